@@ -0,0 +1,11 @@
+"""
+FunDI benchmark suite.
+
+Run all benchmarks and write results to the JSON file::
+
+    python -m benchmarks --output results.json
+
+Compare results of two runs (e.g. made on different commits)::
+
+    python -m benchmarks --compare before.json --output after.json
+"""
@@ -0,0 +1,48 @@
+import json
+import typing
+import argparse
+
+from benchmarks import bench_scan, bench_scope, bench_inject, bench_context  # noqa: F401
+from benchmarks.runner import run, load
+
+
+def _format(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main(argv: typing.Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Run FunDI benchmarks"
+    )
+    parser.add_argument("-o", "--output", help="write results to this JSON file")
+    parser.add_argument("-k", "--filter", help="run only benchmarks which names contain this")
+    parser.add_argument("--repeat", type=int, default=5, help="rounds per benchmark")
+    parser.add_argument(
+        "--min-time", type=float, default=0.05, help="minimal duration of the round in seconds"
+    )
+    parser.add_argument("--compare", help="JSON file of previous run to compare results with")
+    args = parser.parse_args(argv)
+
+    baseline: dict[str, typing.Any] = load(args.compare)["results"] if args.compare else {}
+
+    def report(name: str, result: dict[str, typing.Any]) -> None:
+        line = f"{name:<50} {_format(result['best']):>12}"
+
+        if name in baseline:
+            line += f" {result['best'] / baseline[name]['best']:>8.2f}x"
+
+        print(line, flush=True)
+
+    results = run(args.filter, args.repeat, args.min_time, report)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
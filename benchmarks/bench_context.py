@@ -0,0 +1,35 @@
+from fundi import scan, from_, InjectionContext
+
+from benchmarks.runner import benchmark
+
+
+def dependency(start: int) -> int:
+    return start + 1
+
+
+def dependant(value: int = from_(dependency)) -> int:
+    return value
+
+
+@benchmark("context.inject", cached=(True, False))
+def inject(cached: bool):
+    info = scan(dependant)
+    context = InjectionContext({"start": 0})
+
+    def run():
+        return context.inject(info, no_cache=not cached)
+
+    assert run() == 1
+    return run
+
+
+@benchmark("context.sub")
+def sub():
+    context = InjectionContext({"start": 0})
+
+    def run():
+        # Sub-contexts are closed with the parent one
+        with context.copy() as parent:
+            parent.sub({"value": 1})
+
+    return run
@@ -0,0 +1,40 @@
+from contextlib import ExitStack, AsyncExitStack
+
+from fundi import scan, inject, ainject, Scope
+
+from benchmarks.runner import benchmark
+from benchmarks.graphs import GRAPHS, EXPECTED
+
+SIZES = {"deep": (10, 100), "wide": (10, 100), "diamond": (10, 100), "lifespan": (10, 50)}
+
+
+def _register(graph: str) -> None:
+    build = GRAPHS[graph]
+    expected = EXPECTED[graph]
+
+    @benchmark(f"inject.{graph}", size=SIZES[graph])
+    def sync(size: int):
+        info = scan(build(size, False))
+        scope = Scope({"start": 0})
+
+        def run():
+            with ExitStack() as stack:
+                return inject(scope, info, stack)
+
+        assert run() == expected(size)
+        return run
+
+    @benchmark(f"ainject.{graph}", size=SIZES[graph], concurrency=("sequential", "gather"))
+    def async_(size: int, concurrency: str):
+        info = scan(build(size, True))
+        scope = Scope({"start": 0})
+
+        async def run():
+            async with AsyncExitStack() as stack:
+                return await ainject(scope, info, stack, concurrency=concurrency)
+
+        return run
+
+
+for _graph in GRAPHS:
+    _register(_graph)
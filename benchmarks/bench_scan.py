@@ -0,0 +1,37 @@
+import typing
+
+from fundi import scan, from_, FromType, Scope
+
+from benchmarks.runner import benchmark
+
+
+def dependency(start: int) -> int:
+    return start
+
+
+def dependant(
+    start: int,
+    scope: FromType[Scope],
+    value: int = from_(dependency),
+    *args: typing.Any,
+    flag: bool = False,
+    **kwargs: typing.Any,
+) -> int:
+    return value
+
+
+@benchmark("scan.cold")
+def cold():
+    def run():
+        # Drop the cached result to scan from scratch
+        del dependant.__fundi_info__  # pyright: ignore[reportFunctionMemberAccess]
+        scan(dependant)
+
+    scan(dependant)
+    return run
+
+
+@benchmark("scan.warm")
+def warm():
+    scan(dependant)
+    return lambda: scan(dependant)
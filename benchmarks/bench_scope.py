@@ -0,0 +1,40 @@
+import typing
+
+from fundi import Scope, Type
+
+from benchmarks.runner import benchmark
+
+SIZES = (10, 100, 1000)
+
+
+def _types(size: int) -> list[type]:
+    return [type(f"Type{i}", (), {}) for i in range(size)]
+
+
+def _legacy(size: int) -> dict[str, typing.Any]:
+    # Half of the values are of user-defined types and get registered as type instances
+    return {f"value{i}": value() if i % 2 else i for i, value in enumerate(_types(size))}
+
+
+@benchmark("scope.from_legacy", size=SIZES)
+def from_legacy(size: int):
+    legacy = _legacy(size)
+    return lambda: Scope.from_legacy(legacy)
+
+
+@benchmark("scope.merge", size=SIZES)
+def merge(size: int):
+    left = Scope.from_legacy(_legacy(size))
+    right = Scope.from_legacy(_legacy(size))
+    return lambda: left | right
+
+
+@benchmark("scope.resolve_by_type", size=SIZES, found=(True, False))
+def resolve_by_type(size: int, found: bool):
+    types = _types(size)
+    scope = Scope({type_: Type.Instance(type_()) for type_ in types})
+    # Injection contexts and parameter scopes resolve types from merged scopes
+    scope = scope | Scope({"name": "value"})
+    type_ = types[0] if found else type("Missing", (), {})
+
+    return lambda: scope.resolve_by_type(type_)
@@ -0,0 +1,176 @@
+"""
+Synthetic dependency graphs.
+
+Every builder returns the dependant whose result is known upfront,
+so benchmarks can be checked for correctness before measuring them.
+"""
+
+import inspect
+import typing
+
+from fundi import from_
+
+
+def _with_dependencies(
+    call: typing.Callable[..., typing.Any],
+    dependencies: typing.Sequence[typing.Callable[..., typing.Any]],
+) -> typing.Callable[..., typing.Any]:
+    """
+    Give ``call(**values)`` keyword-only parameter per dependency
+    """
+    call.__signature__ = inspect.Signature(  # pyright: ignore[reportFunctionMemberAccess]
+        [
+            inspect.Parameter(f"d{i}", inspect.Parameter.KEYWORD_ONLY, default=from_(dependency))
+            for i, dependency in enumerate(dependencies)
+        ]
+    )
+    return call
+
+
+def deep(depth: int, async_: bool = False) -> typing.Callable[..., typing.Any]:
+    """
+    Chain of ``depth`` dependencies, each depends on the previous one. Result is ``depth``
+    """
+
+    def first(start: int) -> int:
+        return start
+
+    dependency: typing.Callable[..., typing.Any] = first
+
+    for _ in range(depth):
+        if async_:
+
+            async def link(value: int = from_(dependency)) -> int:
+                return value + 1
+
+        else:
+
+            def link(value: int = from_(dependency)) -> int:
+                return value + 1
+
+        dependency = link
+
+    return dependency
+
+
+def _leaf(index: int, async_: bool) -> typing.Callable[..., typing.Any]:
+    if async_:
+
+        async def leaf(start: int) -> int:
+            return start + index
+
+        return leaf
+
+    def leaf_(start: int) -> int:
+        return start + index
+
+    return leaf_
+
+
+def _sum(async_: bool) -> typing.Callable[..., typing.Any]:
+    if async_:
+
+        async def root(**values: int) -> int:
+            return sum(values.values())
+
+        return root
+
+    def root_(**values: int) -> int:
+        return sum(values.values())
+
+    return root_
+
+
+def wide(width: int, async_: bool = False) -> typing.Callable[..., typing.Any]:
+    """
+    Dependant with ``width`` independent dependencies. Result is ``sum(range(width))``
+    """
+    return _with_dependencies(_sum(async_), [_leaf(i, async_) for i in range(width)])
+
+
+def diamond(width: int, async_: bool = False) -> typing.Callable[..., typing.Any]:
+    """
+    Dependant with ``width`` dependencies that share one cached dependency. Result is ``width``
+    """
+
+    def base(start: int) -> int:
+        return start + 1
+
+    middles: list[typing.Callable[..., typing.Any]] = []
+    for _ in range(width):
+        if async_:
+
+            async def middle(value: int = from_(base)) -> int:
+                return value
+
+        else:
+
+            def middle(value: int = from_(base)) -> int:
+                return value
+
+        middles.append(middle)
+
+    return _with_dependencies(_sum(async_), middles)
+
+
+def lifespan(width: int, async_: bool = False) -> typing.Callable[..., typing.Any]:
+    """
+    Dependant with ``width`` lifespan dependencies:
+    generators and context managers, half of each. Result is ``width``
+    """
+    dependencies: list[typing.Callable[..., typing.Any]] = []
+
+    for i in range(width):
+        if async_ and i % 2:
+
+            class AsyncResource:
+                async def __aenter__(self) -> int:
+                    return 1
+
+                async def __aexit__(self, *exc_info: typing.Any) -> None:
+                    pass
+
+            dependencies.append(AsyncResource)
+
+        elif async_:
+
+            async def agenerator() -> typing.AsyncGenerator[int, None]:
+                yield 1
+
+            dependencies.append(agenerator)
+
+        elif i % 2:
+
+            class Resource:
+                def __enter__(self) -> int:
+                    return 1
+
+                def __exit__(self, *exc_info: typing.Any) -> None:
+                    pass
+
+            dependencies.append(Resource)
+
+        else:
+
+            def generator() -> typing.Generator[int, None, None]:
+                yield 1
+
+            dependencies.append(generator)
+
+    return _with_dependencies(_sum(async_), dependencies)
+
+
+GRAPHS: dict[str, typing.Callable[[int, bool], typing.Callable[..., typing.Any]]] = {
+    "deep": deep,
+    "wide": wide,
+    "diamond": diamond,
+    "lifespan": lifespan,
+}
+
+EXPECTED: dict[str, typing.Callable[[int], int]] = {
+    "deep": lambda size: size,
+    "wide": lambda size: sum(range(size)),
+    "diamond": lambda size: size,
+    "lifespan": lambda size: size,
+}
+"""Result of the graph of the given size injected with ``{"start": 0}`` scope"""
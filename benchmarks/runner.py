@@ -0,0 +1,175 @@
+import sys
+import time
+import json
+import typing
+import asyncio
+import platform
+import statistics
+import subprocess
+from pathlib import Path
+from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from importlib import metadata
+
+Setup = typing.Callable[..., typing.Callable[[], typing.Any]]
+
+
+@dataclass
+class Benchmark:
+    """
+    Registered benchmark.
+
+    ``setup`` is called once per parameter set and returns the function to measure.
+    Returned function may be a coroutine function - it is awaited in the event loop then.
+    """
+
+    name: str
+    setup: Setup
+    params: list[dict[str, typing.Any]] = field(default_factory=lambda: [{}])
+
+    def cases(self) -> typing.Iterator[tuple[str, typing.Callable[[], typing.Any]]]:
+        for params in self.params:
+            name = self.name
+            if params:
+                name += "[" + ",".join(f"{key}={value}" for key, value in params.items()) + "]"
+
+            yield name, self.setup(**params)
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, **params: typing.Iterable[typing.Any]) -> typing.Callable[[Setup], Setup]:
+    """
+    Register benchmark.
+
+    Each keyword argument is the parameter name and its values;
+    setup function is called with every value of the parameter::
+
+        @benchmark("scope.merge", size=(10, 100))
+        def merge(size: int):
+            ...
+            return lambda: left | right
+    """
+
+    def decorator(setup: Setup) -> Setup:
+        cases: list[dict[str, typing.Any]] = [{}]
+        for key, values in params.items():
+            cases = [{**case, key: value} for case in cases for value in values]
+
+        BENCHMARKS.append(Benchmark(name, setup, cases))
+        return setup
+
+    return decorator
+
+
+def _timer(
+    function: typing.Callable[[], typing.Any],
+) -> typing.Callable[[int], float]:
+    if asyncio.iscoroutinefunction(function):
+        loop = asyncio.new_event_loop()
+
+        async def loop_body(number: int) -> float:
+            start = time.perf_counter()
+            for _ in range(number):
+                await function()
+            return time.perf_counter() - start
+
+        return lambda number: loop.run_until_complete(loop_body(number))
+
+    def body(number: int) -> float:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        return time.perf_counter() - start
+
+    return body
+
+
+def measure(
+    function: typing.Callable[[], typing.Any], repeat: int = 5, min_time: float = 0.05
+) -> dict[str, typing.Any]:
+    """
+    Measure time per call of the function.
+
+    Number of calls per round is picked so that the round takes at least ``min_time`` seconds.
+    """
+    timer = _timer(function)
+
+    number = 1
+    while True:
+        elapsed = timer(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    rounds = [elapsed / number] + [timer(number) / number for _ in range(repeat - 1)]
+
+    return {
+        "number": number,
+        "repeat": repeat,
+        "best": min(rounds),
+        "median": statistics.median(rounds),
+        "mean": statistics.fmean(rounds),
+    }
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _version() -> str | None:
+    try:
+        return metadata.version("fundi")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def environment() -> dict[str, typing.Any]:
+    return {
+        "commit": _commit(),
+        "fundi": _version(),
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def run(
+    pattern: str | None = None,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    report: typing.Callable[[str, dict[str, typing.Any]], None] | None = None,
+) -> dict[str, typing.Any]:
+    """
+    Run registered benchmarks which names contain ``pattern``
+
+    :return: JSON-serializable results
+    """
+    results: dict[str, dict[str, typing.Any]] = {}
+
+    for bench in BENCHMARKS:
+        if pattern is not None and pattern not in bench.name:
+            continue
+
+        for name, function in bench.cases():
+            results[name] = measure(function, repeat, min_time)
+            if report is not None:
+                report(name, results[name])
+
+    return {"environment": environment(), "unit": "seconds per call", "results": results}
+
+
+def load(path: str | Path) -> dict[str, typing.Any]:
+    with open(path) as file:
+        return json.load(file)
@@ -1,13 +1,22 @@
 import typing as _typing
 
 from .scan import scan
-from .from_ import from_
+from .from_ import from_, set_lazy_scanning
 from . import exceptions
 from .resolve import resolve
 from .hooks import with_hooks
+from .logging import set_debug
 from .debug import tree, order
 from .scope import Scope, Type
 from .inject import inject, ainject
+from .bulk import inject_many, ainject_many
+from .batch import batched
+from .lazy import Lazy
+from .validate import validate, ValidatedGraph
+from .registry import scan_registry, ScanRegistry, RegistryStats
+from .plan import compile, InjectionPlan
+from .codegen import generate, GeneratedInjector
+from .warmup import warmup, WarmupReport
 from .side_effects import with_side_effects
 from .injection_context import InjectionContext, AsyncInjectionContext
 from .configurable import configurable_dependency, MutableConfigurationWarning
@@ -34,8 +43,18 @@ __all__ = [
     "order",
     "from_",
     "inject",
+    "compile",
+    "generate",
+    "validate",
+    "warmup",
     "resolve",
     "ainject",
+    "inject_many",
+    "ainject_many",
+    "batched",
+    "Lazy",
+    "set_debug",
+    "set_lazy_scanning",
     "Parameter",
     "with_hooks",
     "exceptions",
@@ -44,6 +63,13 @@ __all__ = [
     "combine_hooks",
     "is_configured",
     "InjectionTrace",
+    "InjectionPlan",
+    "ValidatedGraph",
+    "ScanRegistry",
+    "RegistryStats",
+    "scan_registry",
+    "GeneratedInjector",
+    "WarmupReport",
     "virtual_context",
     "injection_trace",
     "InjectionContext",
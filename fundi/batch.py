@@ -0,0 +1,280 @@
+"""
+Batched dependencies.
+
+``batched`` turns a function that loads many values at once into a dependency
+that provides one value. Requests of the dependency made concurrently
+(by concurrent ``ainject`` calls or concurrently injected parameters)
+are coalesced into a single call of the function::
+
+    @batched(max_batch=100, window_ms=2)
+    async def load_user(user_id: list[int], db: Session = from_(get_db)) -> list[User]:
+        return await db.users.get_many(user_id)
+
+    async def handler(user: User = from_(load_user)): ...
+
+The first parameter of the function receives the list of keys and is resolved
+as a single key for each request. The function returns values in order of the keys.
+Dependencies taking the key from elsewhere are made with ``load_user.keyed(...)``::
+
+    async def post(
+        author: User = from_(load_user.keyed("author_id")),
+        editor: User = from_(load_user.keyed(require_editor_id)),
+    ): ...
+
+Other parameters are resolved for each request, requests are batched together
+only if they have the same (identical) values of them.
+"""
+
+import typing
+import asyncio
+import inspect
+import functools
+import collections.abc
+
+from fundi.from_ import from_
+from fundi.util import callable_str
+from fundi import logging as fundi_logging
+from fundi.logging import get_logger
+
+__all__ = ["batched", "BatchLoader"]
+
+logger = get_logger("batch")
+
+R = typing.TypeVar("R")
+
+KeySource = str | typing.Callable[..., typing.Any] | None
+"""Where the key of the request comes from: scope value name or dependency"""
+
+SEQUENCES: frozenset[typing.Any] = frozenset(
+    {list, tuple, collections.abc.Sequence, collections.abc.Iterable}
+)
+"""Annotation origins of the key list and the value list, unwrapped to their item type"""
+
+
+def _item(annotation: typing.Any) -> typing.Any:
+    """
+    Get item type of the sequence annotation, annotations of other types are returned as is
+    """
+    args = typing.get_args(annotation)
+
+    if typing.get_origin(annotation) in SEQUENCES and len(args) == 1:
+        return args[0]
+
+    return annotation
+
+
+class _Batch:
+    __slots__: tuple[str, ...] = ("arguments", "keys", "futures", "handle")
+
+    def __init__(self, arguments: inspect.BoundArguments):
+        self.arguments: inspect.BoundArguments = arguments
+        """Arguments of the first request"""
+        self.keys: list[typing.Any] = []
+        self.futures: list[asyncio.Future[typing.Any]] = []
+        self.handle: asyncio.Handle | None = None
+        """Scheduled dispatch of the batch"""
+
+
+class BatchLoader(typing.Generic[R]):
+    """
+    Coalesces requests of single values into batched calls of the function.
+
+    :param function: function that receives list of keys and returns list of values
+    :param max_batch: maximum amount of keys in a single call
+    :param window: time to wait for more requests after the first one, in seconds
+    """
+
+    def __init__(
+        self,
+        function: typing.Callable[..., typing.Any],
+        max_batch: int = 100,
+        window: float = 0.002,
+    ):
+        if max_batch < 1:
+            raise ValueError(f"Batch size must be positive, got {max_batch}")
+
+        if window < 0:
+            raise ValueError(f"Batch window must not be negative, got {window}")
+
+        self.function: typing.Callable[..., typing.Any] = function
+        self.max_batch: int = max_batch
+        self.window: float = window
+
+        signature = inspect.signature(function)
+        parameters = list(signature.parameters.values())
+
+        if not parameters or parameters[0].kind not in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            raise TypeError(
+                f"Batch loader {callable_str(function)} "
+                "should accept list of keys as the first parameter"
+            )
+
+        key = parameters[0]
+        self.key: str = key.name
+        """Name of the key parameter"""
+        self.signature: inspect.Signature = signature.replace(
+            parameters=[key.replace(annotation=_item(key.annotation)), *parameters[1:]],
+            return_annotation=_item(signature.return_annotation),
+        )
+        """Signature of a single request: single key and single value instead of the lists"""
+
+        self._batches: dict[tuple[typing.Any, ...], _Batch] = {}
+        self._running: set[asyncio.Task[None]] = set()
+        self._dependencies: dict[KeySource, typing.Callable[..., typing.Any]] = {}
+
+    async def load(self, *args: typing.Any, **kwargs: typing.Any) -> R:
+        """
+        Request single value. Accepts arguments of the function, with single key instead of list
+        """
+        arguments = self.signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+
+        loop = asyncio.get_running_loop()
+        group = (
+            loop,
+            *(id(value) for name, value in arguments.arguments.items() if name != self.key),
+        )
+
+        batch = self._batches.get(group)
+        if batch is None:
+            batch = self._batches[group] = _Batch(arguments)
+
+            if self.window:
+                batch.handle = loop.call_later(self.window, self._dispatch, group, batch)
+            else:
+                batch.handle = loop.call_soon(self._dispatch, group, batch)
+
+        future: asyncio.Future[R] = loop.create_future()
+        batch.keys.append(arguments.arguments[self.key])
+        batch.futures.append(future)
+
+        if len(batch.keys) >= self.max_batch:
+            self._dispatch(group, batch)
+
+        return await future
+
+    def dependency(self, key: KeySource = None) -> typing.Callable[..., typing.Any]:
+        """
+        Get dependency that requests single value from this loader.
+
+        Dependencies are created once per key source, so their results are cached separately.
+
+        :param key: name of the scope value or dependency the key is taken from.
+            By default, the key is resolved as the first parameter of the function
+        """
+        dependency = self._dependencies.get(key)
+        if dependency is not None:
+            return dependency
+
+        if key is None:
+            signature = self.signature
+
+            async def load(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+                return await self.load(*args, **kwargs)
+
+        else:
+            parameters = list(self.signature.parameters.values())
+
+            if isinstance(key, str):
+                parameters[0] = parameters[0].replace(name=key)
+            else:
+                parameters[0] = parameters[0].replace(default=from_(key))
+
+            signature = self.signature.replace(parameters=parameters)
+
+            async def load(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+                # Key parameter is always passed positionally
+                arguments = signature.bind(*args, **kwargs)
+                return await self.load(*arguments.args, **arguments.kwargs)
+
+        dependency = functools.wraps(self.function)(load)
+        setattr(dependency, "__signature__", signature)
+        setattr(dependency, "__fundi_loader__", self)
+
+        self._dependencies[key] = dependency
+        return dependency
+
+    def _dispatch(self, group: tuple[typing.Any, ...], batch: _Batch) -> None:
+        if self._batches.get(group) is batch:
+            del self._batches[group]
+
+        if batch.handle is not None:
+            batch.handle.cancel()
+
+        if fundi_logging.DEBUG:
+            logger.debug("Loading batch of %d keys via %r", len(batch.keys), self.function)
+
+        task = asyncio.ensure_future(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: _Batch) -> None:
+        arguments = batch.arguments
+        arguments.arguments[self.key] = batch.keys
+
+        try:
+            values = self.function(*arguments.args, **arguments.kwargs)
+            if inspect.isawaitable(values):
+                values = await values
+
+            values = list(values)
+
+            if len(values) != len(batch.keys):
+                raise ValueError(
+                    f"Batch loader {callable_str(self.function)} "
+                    f"returned {len(values)} values for {len(batch.keys)} keys"
+                )
+
+        except Exception as exc:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        except BaseException:
+            # Requests of the cancelled batch must not wait forever
+            for future in batch.futures:
+                future.cancel()
+            raise
+
+        for future, value in zip(batch.futures, values):
+            if not future.done():
+                future.set_result(value)
+
+
+Dependency = typing.Callable[..., collections.abc.Awaitable[typing.Any]]
+
+
+def batched(
+    max_batch: int = 100, window_ms: float = 2.0
+) -> typing.Callable[[typing.Callable[..., typing.Any]], Dependency]:
+    """
+    Declare batch loader dependency.
+
+    Decorated function receives list of keys as the first parameter and returns list of values
+    in the same order. Resulting dependency is asynchronous and provides single value
+    for single key: requests made within ``window_ms`` after the first one
+    are loaded with one call of the function.
+
+    Key is resolved as the first parameter of the function. To load values of other keys
+    in the same graph, use ``dependency.keyed(name_or_dependency)`` -
+    it takes the key from the scope value with the given name or from the given dependency.
+
+    :param max_batch: maximum amount of keys in a single call, full batch is loaded immediately
+    :param window_ms: time to wait for more requests after the first one, in milliseconds.
+        With zero window only requests made before the event loop switches tasks are coalesced
+    :return: decorator
+    """
+
+    def decorator(function: typing.Callable[..., typing.Any]) -> Dependency:
+        loader: BatchLoader[typing.Any] = BatchLoader(function, max_batch, window_ms / 1000)
+
+        dependency = loader.dependency()
+        setattr(dependency, "keyed", loader.dependency)
+
+        return dependency
+
+    return decorator
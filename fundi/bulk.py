@@ -0,0 +1,334 @@
+"""
+Injection of the same dependant with many scopes.
+
+``inject_many`` and ``ainject_many`` inject the dependant once per scope,
+sharing the work that does not depend on the scope::
+
+    for report in inject_many(records, scan(build_report), shared={"db": db}):
+        ...
+
+Dependencies whose whole subgraph is resolved from the ``shared`` scope
+are injected once before the first scope and their values are reused for every scope.
+Everything else is injected for each scope separately,
+with the scope merged on top of the shared one.
+"""
+
+import typing
+import asyncio
+import contextlib
+import collections.abc
+
+from fundi.scope import NO_VALUE, Scope, Type
+from fundi import logging as fundi_logging
+from fundi.logging import get_logger
+from fundi.inject import inject, ainject
+from fundi.types import CacheKey, CallableInfo, Parameter
+
+__all__ = ["inject_many", "ainject_many"]
+
+logger = get_logger("bulk")
+
+ScopeLike = collections.abc.Mapping[str, typing.Any] | Scope
+Scopes = collections.abc.Iterable[ScopeLike]
+AsyncScopes = collections.abc.Iterable[ScopeLike] | collections.abc.AsyncIterable[ScopeLike]
+Override = collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None
+
+
+class _SharedWork:
+    """
+    Dependencies of the dependant that depend only on the shared scope.
+    """
+
+    def __init__(self, info: CallableInfo[typing.Any], shared: Scope, override: Override):
+        self.dependencies: dict[CacheKey, CallableInfo[typing.Any]] = {}
+        """Topmost shared dependencies, injecting them injects the whole shared subgraphs"""
+        self.names: set[str] = set()
+        """Names looked up in the shared scope by shared dependencies"""
+        self.types: set[typing.Any] = set()
+        """Types looked up in the shared scope by shared dependencies"""
+
+        self._analyse(info, shared, override)
+
+    @staticmethod
+    def _children(
+        info: CallableInfo[typing.Any],
+    ) -> collections.abc.Iterator[CallableInfo[typing.Any]]:
+        for parameter in info.parameters:
+            if parameter.from_ is not None:
+                yield parameter.from_
+
+    @staticmethod
+    def _lookups(
+        info: CallableInfo[typing.Any], shared: Scope, override: Override
+    ) -> tuple[list[str], list[typing.Any]] | None:
+        """
+        Get names and types the dependency looks up in the shared scope.
+        Returns None if its own parameters are not resolved from the shared scope only
+        """
+        if not info.use_cache or info.scopehook is not None or info.side_effects:
+            return None
+
+        # Overridden dependencies are not looked up in the override when injected directly
+        if override and info.call in override:
+            return None
+
+        names: list[str] = []
+        types: list[typing.Any] = []
+
+        for parameter in info.parameters:
+            if parameter.from_ is not None:
+                continue
+
+            if parameter.resolve_by_type:
+                for type_ in parameter.type_options:
+                    # Parameter awareness depends on the dependant the dependency is injected into
+                    if type_ is Parameter:
+                        return None
+
+                    types.append(type_)
+                    resolved = shared.resolve_by_type(type_)
+
+                    if isinstance(resolved, Type.Instance):
+                        break
+
+                    if resolved is not NO_VALUE:
+                        return None
+                else:
+                    return None
+
+                continue
+
+            if parameter.name == "__fundi_parameter__":
+                return None
+
+            names.append(parameter.name)
+            if shared.resolve_by_name(parameter.name) is NO_VALUE:
+                return None
+
+        return names, types
+
+    def _analyse(self, info: CallableInfo[typing.Any], shared: Scope, override: Override) -> None:
+        shareable: dict[CacheKey, bool] = {}
+        entered: set[CacheKey] = {info.key}
+        stack = [(info, self._children(info))]
+
+        while stack:
+            dependant, children = stack[-1]
+            child = next(children, None)
+
+            if child is not None:
+                if child.key not in entered:
+                    entered.add(child.key)
+                    stack.append((child, self._children(child)))
+                continue
+
+            stack.pop()
+
+            lookups = None if dependant is info else self._lookups(dependant, shared, override)
+            # Dependencies that are not analysed yet are part of a cycle
+            shared_ = lookups is not None and all(
+                shareable.get(child.key, False) for child in self._children(dependant)
+            )
+            shareable[dependant.key] = shared_
+
+            if shared_:
+                assert lookups is not None
+                self.names.update(lookups[0])
+                self.types.update(lookups[1])
+                continue
+
+            for parameter in dependant.parameters:
+                child = parameter.from_
+
+                # Lazy dependencies are injected only on request
+                if child is not None and not parameter.lazy and shareable.get(child.key, False):
+                    self.dependencies[child.key] = child
+
+    def shadowed(self, scope: Scope) -> bool:
+        """
+        Check whether the scope has values the shared dependencies look up in the shared scope
+        """
+        for name in self.names:
+            if scope.resolve_by_name(name) is not NO_VALUE:
+                return True
+
+        for type_ in self.types:
+            if scope.resolve_by_type(type_) is not NO_VALUE:
+                return True
+
+        return False
+
+
+def _scope(scope: collections.abc.Mapping[str, typing.Any] | Scope | None) -> Scope:
+    if scope is None:
+        return Scope()
+
+    if not isinstance(scope, Scope):
+        return Scope.from_legacy(scope)
+
+    return scope
+
+
+def inject_many(
+    scopes: Scopes,
+    info: CallableInfo[typing.Any],
+    shared: collections.abc.Mapping[str, typing.Any] | Scope | None = None,
+    stack: contextlib.ExitStack | None = None,
+    override: Override = None,
+) -> collections.abc.Iterator[typing.Any]:
+    """
+    Synchronously inject dependencies into callable for each scope.
+
+    Dependencies resolved only from the ``shared`` scope are injected once,
+    their lifespan ends when the ``stack`` is closed.
+    Lifespan of other dependencies ends after the injection for their scope.
+
+    Scopes that have values the shared dependencies look up are injected without shared values.
+
+    Scopes are taken from ``scopes`` one at a time, only when the next result is requested,
+    so ``scopes`` may be unbounded.
+
+    :param scopes: containers with contextual values of each injection
+    :param info: callable information
+    :param shared: container with contextual values common to all injections
+    :param stack: exit stack to properly handle shared generator dependencies
+    :param override: override dependencies
+    :return: iterator over results of callable, in order of the scopes
+    """
+    shared = _scope(shared)
+
+    if stack is None:
+        with contextlib.ExitStack() as stack:
+            yield from inject_many(scopes, info, shared, stack, override)
+        return
+
+    work = _SharedWork(info, shared, override)
+    cache: dict[CacheKey, typing.Any] = {}
+
+    if fundi_logging.DEBUG:
+        logger.debug("Injecting %d shared dependencies of %r", len(work.dependencies), info.call)
+
+    for key, dependency in work.dependencies.items():
+        if key not in cache:
+            cache[key] = inject(shared, dependency, stack, cache, override)
+
+    for scope in scopes:
+        scope = _scope(scope)
+
+        with contextlib.ExitStack() as scope_stack:
+            value = inject(
+                shared | scope,
+                info,
+                scope_stack,
+                {} if work.shadowed(scope) else cache.copy(),
+                override,
+            )
+
+        yield value
+
+
+async def _iterate(scopes: AsyncScopes) -> collections.abc.AsyncIterator[ScopeLike]:
+    if isinstance(scopes, collections.abc.AsyncIterable):
+        async for scope in scopes:
+            yield scope
+        return
+
+    for scope in scopes:
+        yield scope
+
+
+async def ainject_many(
+    scopes: AsyncScopes,
+    info: CallableInfo[typing.Any],
+    shared: collections.abc.Mapping[str, typing.Any] | Scope | None = None,
+    stack: contextlib.AsyncExitStack | None = None,
+    override: Override = None,
+    limit: int = 1,
+    ordered: bool = True,
+) -> collections.abc.AsyncIterator[typing.Any]:
+    """
+    Asynchronously inject dependencies into callable for each scope.
+
+    Dependencies resolved only from the ``shared`` scope are injected once,
+    their lifespan ends when the ``stack`` is closed.
+    Lifespan of other dependencies ends after the injection for their scope.
+
+    Scopes that have values the shared dependencies look up are injected without shared values.
+
+    Scopes are taken from ``scopes`` (iterable or asynchronous iterable) only when there is
+    less than ``limit`` injections running and results are yielded only when requested,
+    so slow consumer pauses the injections.
+
+    :param scopes: containers with contextual values of each injection
+    :param info: callable information
+    :param shared: container with contextual values common to all injections
+    :param stack: exit stack to properly handle shared generator dependencies
+    :param override: override dependencies
+    :param limit: maximum amount of injections running concurrently
+    :param ordered: yield results in order of the scopes, otherwise - as they complete
+    :return: asynchronous iterator over results of callable
+    """
+    if limit < 1:
+        raise ValueError(f"Concurrency limit must be positive, got {limit}")
+
+    shared = _scope(shared)
+
+    if stack is None:
+        async with contextlib.AsyncExitStack() as stack:
+            async for value in ainject_many(scopes, info, shared, stack, override, limit, ordered):
+                yield value
+        return
+
+    work = _SharedWork(info, shared, override)
+    cache: dict[CacheKey, typing.Any] = {}
+
+    if fundi_logging.DEBUG:
+        logger.debug("Injecting %d shared dependencies of %r", len(work.dependencies), info.call)
+
+    for key, dependency in work.dependencies.items():
+        if key not in cache:
+            cache[key] = await ainject(shared, dependency, stack, cache, override)
+
+    async def inject_scope(scope: Scope) -> typing.Any:
+        async with contextlib.AsyncExitStack() as scope_stack:
+            return await ainject(
+                shared | scope,
+                info,
+                scope_stack,
+                {} if work.shadowed(scope) else cache.copy(),
+                override,
+            )
+
+    pending: collections.deque[asyncio.Task[typing.Any]] = collections.deque()
+
+    async def completed(remaining: int) -> collections.abc.AsyncIterator[typing.Any]:
+        """
+        Yield results of the pending injections until only ``remaining`` of them are left
+        """
+        while len(pending) > remaining:
+            if ordered:
+                yield await pending.popleft()
+                continue
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Injections completed at the same time are yielded in order of their scopes
+            for task in [task for task in pending if task in done]:
+                pending.remove(task)
+                yield task.result()
+
+    try:
+        async with contextlib.aclosing(_iterate(scopes)) as source:
+            async for scope in source:
+                pending.append(asyncio.ensure_future(inject_scope(_scope(scope))))
+
+                async for value in completed(limit - 1):
+                    yield value
+
+        async for value in completed(0):
+            yield value
+    finally:
+        for task in pending:
+            task.cancel()
+
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
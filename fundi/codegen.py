@@ -0,0 +1,637 @@
+"""
+Source generating injection backend.
+
+Turns compiled injection plan into the specialized Python function
+that resolves and calls each dependency in straight-line code::
+
+    v1 = c1(name_("settings"))
+    v2 = c2(v1, name_("token"))
+    v0 = c0(v2)
+    return v0
+
+The generated injector is cached on the ``CallableInfo``::
+
+    injector = generate(scan(handler), Scope({"settings": settings, "token": ""}))
+    injector.inject(Scope({"settings": settings, "token": token}))
+
+It behaves exactly like ``inject``/``ainject`` and falls back to them if scope shape differs.
+"""
+
+import typing
+import linecache
+import contextlib
+import collections.abc
+
+from fundi.lazy import Lazy
+from fundi.scope import NO_VALUE, Scope
+from fundi import logging as fundi_logging
+from fundi.logging import get_logger
+from fundi.inject import PendingValue, inject, ainject, claim, wait, settle, release
+from fundi.types import (
+    KEYWORD,
+    POSITIONAL,
+    VAR_POSITIONAL,
+    CacheKey,
+    CallableInfo,
+)
+from fundi.util import call_bound_sync, call_bound_async, callable_str
+from fundi.plan import (
+    ARG_NAME,
+    ARG_SLOT,
+    ARG_TYPE,
+    OP_CALL,
+    OP_LAZY,
+    OP_ENTER,
+    OP_FACTORY,
+    OP_DELEGATE,
+    PlanNode,
+    InjectionPlan,
+    compile as compile_plan,
+)
+
+__all__ = ["generate", "GeneratedInjector"]
+
+logger = get_logger("codegen")
+
+
+def _async_error(call: typing.Callable[..., typing.Any]) -> RuntimeError:
+    return RuntimeError(
+        "Cannot process async functions ({func}) in synchronous injection".format(
+            func=callable_str(call)
+        )
+    )
+
+
+def _overridden(
+    value: typing.Any,
+    overlay: Scope,
+    scope: Scope,
+    stack: contextlib.ExitStack,
+    cache: collections.abc.MutableMapping[CacheKey, typing.Any],
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any],
+    trace: tuple[CallableInfo[typing.Any], ...],
+) -> typing.Any:
+    if not isinstance(value, CallableInfo):
+        return value
+
+    info = typing.cast(CallableInfo[typing.Any], value)
+    value = inject(scope | overlay, info, stack, cache, override, _trace=trace)
+
+    if info.use_cache:
+        cache[info.key] = value
+
+    return value
+
+
+async def _aoverridden(
+    value: typing.Any,
+    overlay: Scope,
+    scope: Scope,
+    stack: contextlib.AsyncExitStack,
+    cache: collections.abc.MutableMapping[CacheKey, typing.Any],
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any],
+    trace: tuple[CallableInfo[typing.Any], ...],
+) -> typing.Any:
+    if not isinstance(value, CallableInfo):
+        return value
+
+    info = typing.cast(CallableInfo[typing.Any], value)
+    value = await ainject(scope | overlay, info, stack, cache, override, _trace=trace)
+
+    if info.use_cache:
+        cache[info.key] = value
+
+    return value
+
+
+def _factory(
+    plan: InjectionPlan,
+    node: PlanNode,
+    scope: Scope,
+    stack: contextlib.ExitStack,
+    cache: collections.abc.MutableMapping[CacheKey, typing.Any],
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+) -> typing.Any:
+    info, subscope = plan._factory(node, scope)  # pyright: ignore[reportPrivateUsage]
+    trace = plan._ancestors(node)  # pyright: ignore[reportPrivateUsage]
+
+    if override and (value := override.get(info.call)) is not None:
+        return _overridden(value, subscope, scope, stack, cache, override, trace)
+
+    # Only asynchronous injection can wait for dependencies being injected
+    if info.use_cache and info.key in cache and not isinstance(cache[info.key], PendingValue):
+        return cache[info.key]
+
+    value = inject(subscope, info, stack, cache, override, _trace=trace)
+
+    if info.use_cache:
+        cache[info.key] = value
+
+    return value
+
+
+async def _afactory(
+    plan: InjectionPlan,
+    node: PlanNode,
+    scope: Scope,
+    stack: contextlib.AsyncExitStack,
+    cache: collections.abc.MutableMapping[CacheKey, typing.Any],
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+) -> typing.Any:
+    info, subscope = plan._factory(node, scope)  # pyright: ignore[reportPrivateUsage]
+    trace = plan._ancestors(node)  # pyright: ignore[reportPrivateUsage]
+
+    if override and (value := override.get(info.call)) is not None:
+        return await _aoverridden(value, subscope, scope, stack, cache, override, trace)
+
+    claims: dict[CacheKey, PendingValue] = {}
+
+    if info.use_cache:
+        value = cache.get(info.key, NO_VALUE)
+        if isinstance(value, PendingValue):
+            value = await wait(value)
+
+        if value is not NO_VALUE:
+            return value
+
+        claims[info.key] = claim(cache, info.key)
+
+    try:
+        value = await ainject(subscope, info, stack, cache, override, _trace=trace)
+    except BaseException as exc:
+        release(cache, claims, exc)
+        raise
+
+    if info.use_cache:
+        cache[info.key] = value
+        settle(claims, info.key, value)
+
+    return value
+
+
+class _SourceBuilder:
+    """
+    Builds source code of the injector function from the plan steps
+    """
+
+    def __init__(self, plan: InjectionPlan, async_: bool):
+        self.plan: InjectionPlan = plan
+        self.async_: bool = async_
+        self.lines: list[str] = []
+        self.namespace: dict[str, typing.Any] = {
+            "plan": plan,
+            "call_bound_sync": call_bound_sync,
+            "call_bound_async": call_bound_async,
+            "async_error": _async_error,
+            "inject": ainject if async_ else inject,
+            "overridden": _aoverridden if async_ else _overridden,
+            "factory": _afactory if async_ else _factory,
+            "PendingValue": PendingValue,
+            "NO_VALUE": NO_VALUE,
+            "claim": claim,
+            "wait": wait,
+            "settle": settle,
+            "release": release,
+            "Lazy": Lazy,
+        }
+        self.constants: dict[int, str] = {}
+
+    def constant(self, value: typing.Any, prefix: str = "k") -> str:
+        name = self.constants.get(id(value))
+        if name is not None and self.namespace[name] is value:
+            return name
+
+        name = f"{prefix}{len(self.namespace)}"
+        self.namespace[name] = value
+        self.constants[id(value)] = name
+        return name
+
+    def emit(self, depth: int, line: str) -> None:
+        self.lines.append("    " * depth + line)
+
+    def argument(self, kind: int, payload: typing.Any) -> str:
+        if kind == ARG_SLOT:
+            return f"v{payload}"
+        if kind == ARG_NAME:
+            return f"name_({payload!r})"
+        if kind == ARG_TYPE:
+            return f"type_({self.constant(payload, 't')}).instance"
+
+        return self.constant(payload)
+
+    def call(self, node: PlanNode) -> str:
+        info = typing.cast(CallableInfo[typing.Any], node.info)
+        await_ = "await " if self.async_ and info.async_ else ""
+
+        positional: list[str] = []
+        keyword: list[tuple[str | None, str]] = []
+        for (name, kind), (_, argument, payload) in zip(info.binder.layout, node.arguments):
+            value = self.argument(argument, payload)
+
+            if kind == POSITIONAL:
+                positional.append(value)
+            elif kind == VAR_POSITIONAL:
+                positional.append(f"*{value}")
+            elif kind == KEYWORD:
+                keyword.append((name, value))
+            else:
+                keyword.append((None, value))
+
+        if info.generator or info.context:
+            args = ", ".join(positional) + ("," if positional else "")
+            kwargs = ", ".join(
+                f"**{value}" if name is None else f"{name!r}: {value}" for name, value in keyword
+            )
+            i = self.constant(info, "i")
+
+            if await_:
+                return f"await call_bound_async(stack, {i}, ({args}), {{{kwargs}}})"
+
+            return f"call_bound_sync(stack, {i}, ({args}), {{{kwargs}}})"
+
+        arguments = positional + [
+            f"**{value}" if name is None else f"{name}={value}" for name, value in keyword
+        ]
+
+        return f"{await_}{self.constant(info.call, 'c')}({', '.join(arguments)})"
+
+    def lookup(self, node: PlanNode, depth: int, flag: str | None) -> None:
+        """
+        Emit override and cache lookup of the dependency.
+        Clears the ``flag`` if value is found
+        """
+        info = typing.cast(CallableInfo[typing.Any], node.info)
+        await_ = "await " if self.async_ else ""
+        slot = f"v{node.slot}"
+        overlay = self.constant(node.overlay, "o")
+        trace = self.constant(self.plan._ancestors(node), "t")
+
+        self.emit(
+            depth,
+            f"if override and ({slot} := override.get({self.constant(info.call, 'c')}))"
+            " is not None:",
+        )
+        self.emit(
+            depth + 1,
+            f"{slot} = {await_}overridden({slot}, {overlay}, scope, stack, cache, override,"
+            f" {trace})",
+        )
+        if flag is not None:
+            self.emit(depth + 1, f"{flag} = False")
+
+        if info.use_cache:
+            key = self.constant(info.key, "key")
+            cached = f"({slot} := cache[{key}]).__class__ is not PendingValue"
+            # Asynchronous injector waits for dependencies being injected concurrently,
+            # synchronous one injects them again
+            if self.async_:
+                cached = f"({cached} or ({slot} := await wait({slot})) is not NO_VALUE)"
+
+            self.emit(depth, f"elif {key} in cache and {cached}:")
+            self.emit(depth + 1, f"{flag} = False" if flag is not None else "pass")
+
+    def claim(self, node: PlanNode, depth: int, flag: str | None) -> None:
+        """
+        Emit claim of the cached dependency that was not found, only in asynchronous injector.
+        If ``flag`` is provided - claims only if it is set
+        """
+        info = typing.cast(CallableInfo[typing.Any], node.info)
+        if not self.async_ or not info.use_cache:
+            return
+
+        if flag is not None:
+            self.emit(depth, f"if {flag}:")
+            depth += 1
+
+        key = self.constant(info.key, "key")
+        self.emit(depth, f"claims[{key}] = claim(cache, {key})")
+
+    def store(self, info: CallableInfo[typing.Any], depth: int, slot: str) -> None:
+        """
+        Emit caching of the dependency value
+        """
+        key = self.constant(info.key, "key")
+        self.emit(depth, f"cache[{key}] = {slot}")
+
+        if self.async_:
+            self.emit(depth, "if claims:")
+            self.emit(depth + 1, f"settle(claims, {key}, {slot})")
+
+    def build(self) -> str:
+        plan = self.plan
+        root = plan.steps[-1][1]
+        name = "_ainject" if self.async_ else "_inject"
+
+        self.emit(0, f"{'async ' if self.async_ else ''}def {name}(scope, stack, cache, override):")
+        self.emit(1, "name_ = scope.resolve_by_name")
+        self.emit(1, "type_ = scope.resolve_by_type")
+        self.emit(1, " = ".join(f"v{slot}" for slot in range(plan.slots)) + " = None")
+        self.emit(1, "step = 0")
+        if self.async_:
+            self.emit(1, "claims = {}")
+        self.emit(1, "try:")
+
+        for step, (op, node) in enumerate(plan.steps):
+            self.step(step, op, node)
+
+        self.emit(2, f"return v{root.slot}")
+        self.emit(1, "except Exception as exc:")
+        if self.async_:
+            self.emit(2, "if claims:")
+            self.emit(3, "release(cache, claims, exc)")
+        slots = ", ".join(f"v{slot}" for slot in range(plan.slots))
+        self.emit(2, f"plan._trace(exc, *plan.steps[step], scope, [{slots}])")
+        self.emit(2, "raise")
+
+        if self.async_:
+            self.emit(1, "except BaseException as exc:")
+            self.emit(2, "if claims:")
+            self.emit(3, "release(cache, claims, exc)")
+            self.emit(2, "raise")
+
+        return "\n".join(self.lines) + "\n"
+
+    @staticmethod
+    def flag(node: PlanNode | None) -> str | None:
+        if node is None or node.parent is None:
+            return None
+
+        return f"e{node.slot}"
+
+    def guard(self, node: PlanNode | None, depth: int) -> int:
+        """
+        Emit check whether the dependency was not found in override or cache
+        """
+        flag = self.flag(node)
+        if flag is None:
+            return depth
+
+        self.emit(depth, f"if {flag}:")
+        return depth + 1
+
+    def step(self, step: int, op: int, node: PlanNode) -> None:
+        info = node.info
+        slot = f"v{node.slot}"
+        depth = 2
+        await_ = "await " if self.async_ else ""
+
+        if op == OP_ENTER:
+            assert info is not None
+            flag = self.flag(node)
+            self.emit(depth, f"{flag} = {self.flag(node.parent) or 'True'}")
+            self.emit(depth, f"if {flag}:")
+            self.emit(depth + 1, f"step = {step}")
+            self.lookup(node, depth + 1, flag)
+            self.claim(node, depth, flag)
+
+            if info.async_ and not self.async_:
+                self.emit(depth, f"if {flag}:")
+                self.emit(depth + 1, f"raise async_error({self.constant(info.call, 'c')})")
+            return
+
+        if op == OP_CALL:
+            assert info is not None
+            depth = self.guard(node, depth)
+            self.emit(depth, f"step = {step}")
+            self.emit(depth, f"{slot} = {self.call(node)}")
+
+            if node.parent is not None and info.use_cache:
+                self.store(info, depth, slot)
+            return
+
+        depth = self.guard(node.parent, depth)
+        self.emit(depth, f"step = {step}")
+
+        if op == OP_LAZY:
+            assert info is not None
+            self.emit(
+                depth,
+                f"{slot} = Lazy(scope | {self.constant(node.overlay, 'o')},"
+                f" {self.constant(info, 'i')}, stack, cache, override,"
+                f" {self.constant(self.plan._ancestors(node), 't')})",
+            )
+            return
+
+        if op == OP_FACTORY:
+            self.emit(
+                depth,
+                f"{slot} = {await_}factory(plan, {self.constant(node, 'n')},"
+                " scope, stack, cache, override)",
+            )
+            return
+
+        assert op == OP_DELEGATE and info is not None
+        i = self.constant(info, "i")
+
+        if node.parent is None:
+            self.emit(depth, f"{slot} = {await_}inject(scope, {i}, stack, cache, override)")
+            return
+
+        self.lookup(node, depth, None)
+        self.emit(depth, "else:")
+        self.claim(node, depth + 1, None)
+        self.emit(
+            depth + 1,
+            f"{slot} = {await_}inject(scope | {self.constant(node.overlay, 'o')}, {i},"
+            f" stack, cache, override, _trace={self.constant(self.plan._ancestors(node), 't')})",
+        )
+        if info.use_cache:
+            self.store(info, depth + 1, slot)
+
+
+def _build(plan: InjectionPlan, async_: bool) -> tuple[str, typing.Callable[..., typing.Any]]:
+    builder = _SourceBuilder(plan, async_)
+    source = builder.build()
+
+    filename = f"<fundi {'async ' if async_ else ''}injector of {callable_str(plan.info.call)}>"
+    if fundi_logging.DEBUG:
+        logger.debug("Generated %s:\n%s", filename, source)
+
+    code = compile(source, filename, "exec")
+    # Make source visible in tracebacks
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+
+    exec(code, builder.namespace)
+    return source, builder.namespace["_ainject" if async_ else "_inject"]
+
+
+class GeneratedInjector:
+    """
+    Injector of the dependant made of generated Python source.
+
+    Sync and async variants are generated on the first use, or ahead of it by ``build``.
+    """
+
+    def __init__(self, plan: InjectionPlan):
+        self.plan: InjectionPlan = plan
+        self._sync: typing.Callable[..., typing.Any] | None = None
+        self._async: typing.Callable[..., typing.Any] | None = None
+        self.sources: dict[str, str] = {}
+
+    @property
+    def info(self) -> CallableInfo[typing.Any]:
+        return self.plan.info
+
+    def source(self, async_: bool = False) -> str:
+        """
+        Get source code of the generated injector
+        """
+        key = "async" if async_ else "sync"
+
+        if key not in self.sources:
+            self.sources[key], function = _build(self.plan, async_)
+            if async_:
+                self._async = function
+            else:
+                self._sync = function
+
+        return self.sources[key]
+
+    def build(self) -> None:
+        """
+        Generate both sync and async variants of the injector
+        """
+        self.source(False)
+        self.source(True)
+
+    def inject(
+        self,
+        scope: collections.abc.Mapping[str, typing.Any] | Scope,
+        stack: contextlib.ExitStack | None = None,
+        cache: collections.abc.MutableMapping[CacheKey, typing.Any] | None = None,
+        override: (
+            collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None
+        ) = None,
+    ) -> typing.Any:
+        """
+        Synchronously inject dependencies into callable using generated function.
+
+        Falls back to ``inject`` if the scope shape does not match the compiled one.
+
+        :param scope: container with contextual values
+        :param stack: exit stack to properly handle generator dependencies
+        :param cache: dependency cache
+        :param override: override dependencies
+        :return: result of callable
+        """
+        if not isinstance(scope, Scope):
+            scope = Scope.from_legacy(scope)
+
+        if not self.plan.matches(scope):
+            if fundi_logging.DEBUG:
+                logger.debug("Scope does not match plan of %r: Falling back", self.info.call)
+            return inject(scope, self.info, stack, cache, override)
+
+        return self._inject(scope, stack, cache, override)
+
+    def _inject(
+        self,
+        scope: Scope,
+        stack: contextlib.ExitStack | None,
+        cache: collections.abc.MutableMapping[CacheKey, typing.Any] | None,
+        override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+    ) -> typing.Any:
+        """
+        Inject dependencies using generated function without checking the scope shape
+        """
+        if self.info.async_:
+            raise _async_error(self.info.call)
+
+        if stack is None:
+            with contextlib.ExitStack() as stack:
+                return self._inject(scope, stack, cache, override)
+
+        if cache is None:
+            cache = {}
+
+        if self._sync is None:
+            self.source(async_=False)
+            assert self._sync is not None
+
+        return self._sync(scope, stack, cache, override)
+
+    async def ainject(
+        self,
+        scope: collections.abc.Mapping[str, typing.Any] | Scope,
+        stack: contextlib.AsyncExitStack | None = None,
+        cache: collections.abc.MutableMapping[CacheKey, typing.Any] | None = None,
+        override: (
+            collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None
+        ) = None,
+    ) -> typing.Any:
+        """
+        Asynchronously inject dependencies into callable using generated function.
+
+        Falls back to ``ainject`` if the scope shape does not match the compiled one.
+
+        :param scope: container with contextual values
+        :param stack: exit stack to properly handle generator dependencies
+        :param cache: dependency cache
+        :param override: override dependencies
+        :return: result of callable
+        """
+        if not isinstance(scope, Scope):
+            scope = Scope.from_legacy(scope)
+
+        if not self.plan.matches(scope):
+            if fundi_logging.DEBUG:
+                logger.debug("Scope does not match plan of %r: Falling back", self.info.call)
+            return await ainject(scope, self.info, stack, cache, override)
+
+        return await self._ainject(scope, stack, cache, override)
+
+    async def _ainject(
+        self,
+        scope: Scope,
+        stack: contextlib.AsyncExitStack | None,
+        cache: collections.abc.MutableMapping[CacheKey, typing.Any] | None,
+        override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+    ) -> typing.Any:
+        """
+        Inject dependencies using generated function without checking the scope shape
+        """
+        if stack is None:
+            async with contextlib.AsyncExitStack() as stack:
+                return await self._ainject(scope, stack, cache, override)
+
+        if cache is None:
+            cache = {}
+
+        if self._async is None:
+            self.source(async_=True)
+            assert self._async is not None
+
+        return await self._async(scope, stack, cache, override)
+
+    def __repr__(self) -> str:
+        return f"GeneratedInjector({callable_str(self.info.call)})"
+
+
+def generate(
+    info: CallableInfo[typing.Any],
+    scope_shape: collections.abc.Mapping[str, typing.Any] | Scope | None = None,
+) -> GeneratedInjector:
+    """
+    Generate specialized injector function for the callable.
+
+    Generated injector is cached on the ``info`` and reused
+    while ``scope_shape`` matches the one it was generated for.
+
+    :param info: callable information
+    :param scope_shape: scope that has the same names, types and factories
+        as scopes the injector will be used with
+    :return: generated injector
+    """
+    if scope_shape is None:
+        scope_shape = Scope()
+    elif not isinstance(scope_shape, Scope):
+        scope_shape = Scope.from_legacy(scope_shape)
+
+    injector = info._generated  # pyright: ignore[reportPrivateUsage]
+    if injector is not None and injector.plan.guard.check(scope_shape):
+        return injector
+
+    injector = GeneratedInjector(compile_plan(info, scope_shape))
+    info._generated = injector  # pyright: ignore[reportPrivateUsage]
+
+    return injector
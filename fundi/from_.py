@@ -4,6 +4,24 @@ from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from fundi.scan import scan
 from fundi.types import CallableInfo, TypeResolver
 
+LAZY_SCANNING: bool = False
+"""
+Whether ``from_`` defers scanning of dependencies until they are first used.
+
+Enable it with ``set_lazy_scanning(True)``.
+"""
+
+
+def set_lazy_scanning(enabled: bool = True) -> None:
+    """
+    Enable or disable lazy scanning of dependencies defined with ``from_``.
+
+    Lazily scanned dependencies record only the callable when defined,
+    its signature is inspected on the first use.
+    """
+    global LAZY_SCANNING
+    LAZY_SCANNING = enabled
+
 
 def from_(
     dependency: type | typing.Callable[..., typing.Any],
@@ -12,6 +30,7 @@ def from_(
     generator: bool | None = None,
     context: bool | None = None,
     use_return_annotation: bool = True,
+    lazy: bool | None = None,
 ) -> TypeResolver | CallableInfo[typing.Any]:
     """
     Use callable or type as dependency for parameter of function
@@ -27,6 +46,8 @@ def from_(
     :param context: Override "context" attriubute value
     :param use_return_annotation: Whether to use dependency's return
         annotation to define it's type
+    :param lazy: Whether to defer scanning of the dependency until it is first used.
+        Defaults to the global setting changed by ``set_lazy_scanning``
 
     :return: callable information
     """
@@ -42,4 +63,5 @@ def from_(
         generator=generator,
         context=context,
         use_return_annotation=use_return_annotation,
+        lazy=LAZY_SCANNING if lazy is None else lazy,
     )
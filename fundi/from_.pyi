@@ -20,6 +20,7 @@ def from_(
     generator: bool | None = None,
     context: bool | None = None,
     use_return_annotation: bool = True,
+    lazy: bool | None = None,
 ) -> R: ...
 @overload
 def from_(
@@ -29,6 +30,7 @@ def from_(
     generator: bool | None = None,
     context: bool | None = None,
     use_return_annotation: bool = True,
+    lazy: bool | None = None,
 ) -> R: ...
 @overload
 def from_(dependency: T, caching: bool = True) -> T: ...
@@ -40,6 +42,7 @@ def from_(
     generator: typing.Literal[True] | None = None,
     context: bool | None = None,
     use_return_annotation: bool = True,
+    lazy: bool | None = None,
 ) -> R: ...
 @overload
 def from_(
@@ -49,6 +52,7 @@ def from_(
     generator: typing.Literal[True] | None = None,
     context: bool | None = None,
     use_return_annotation: bool = True,
+    lazy: bool | None = None,
 ) -> R: ...
 @overload
 def from_(
@@ -58,6 +62,7 @@ def from_(
     generator: typing.Literal[False] = False,
     context: bool | None = None,
     use_return_annotation: bool = True,
+    lazy: bool | None = None,
 ) -> Generator[Y, S, R]: ...
 @overload
 def from_(
@@ -67,6 +72,7 @@ def from_(
     generator: typing.Literal[False] = False,
     context: bool | None = None,
     use_return_annotation: bool = True,
+    lazy: bool | None = None,
 ) -> AsyncGenerator[Y, S]: ...
 @overload
 def from_(
@@ -76,6 +82,7 @@ def from_(
     generator: bool | None = None,
     context: bool | None = None,
     use_return_annotation: bool = True,
+    lazy: bool | None = None,
 ) -> R: ...
 @overload
 def from_(
@@ -85,6 +92,7 @@ def from_(
     generator: bool | None = None,
     context: bool | None = None,
     use_return_annotation: bool = True,
+    lazy: bool | None = None,
 ) -> R: ...
 @overload
 def from_(
@@ -94,4 +102,5 @@ def from_(
     generator: bool | None = None,
     context: bool | None = None,
     use_return_annotation: bool = True,
+    lazy: bool | None = None,
 ) -> R: ...
@@ -1,23 +1,174 @@
 import typing
+import asyncio
 import contextlib
 import collections.abc
 
-from fundi.resolve import resolve
-from fundi.scope import Scope, Type
+from fundi.scope import NO_VALUE, Scope, Type
+from fundi.lazy import Lazy
+from fundi.resolve import RESOLVE_DEPENDENCY, RESOLVE_LAZY, RESOLVE_TYPE, resolve, resolution_table
+from fundi import logging as fundi_logging
 from fundi.logging import get_logger
-from fundi.exceptions import CyclicDependencyError
+from fundi.exceptions import CyclicDependencyError, ScopeValueNotFoundError
 from fundi.types import CacheKey, CallableInfo, Parameter
 from fundi.util import call_sync, call_async, add_injection_trace, callable_str
 
+if typing.TYPE_CHECKING:
+    from fundi.plan import InjectionPlan
+    from fundi.codegen import GeneratedInjector
+
 injection_logger = get_logger("inject.injection")
 collection_logger = get_logger("inject.collection")
 
+Concurrency = typing.Literal["sequential", "gather"]
+"""Strategy of resolving sibling dependencies in ``ainject``"""
+
+Defer = typing.Callable[[Scope, CallableInfo[typing.Any]], Lazy[typing.Any]]
+"""Factory of lazy values of dependencies, bound to the injection"""
+
+MAX_SPECIALIZED_PLANS = 4
+"""
+Maximum amount of scope shapes injection plans of a single dependant are specialized for.
+
+Dependants injected with scopes of more shapes use generic injection for the new shapes.
+Set to ``0`` to disable plan specialization.
+"""
+
+
+class PendingValue:
+    """
+    Value of the dependency being injected concurrently.
+
+    Stored in the cache while the dependency is being injected,
+    so the same dependency requested by other dependants is injected only once.
+    Replaced with the dependency value once injected.
+
+    Sequential injection creates the future only when someone waits for the value,
+    as most of the dependencies are never requested concurrently.
+    """
+
+    __slots__: tuple[str, ...] = ("task", "value")
+
+    def __init__(self, task: "asyncio.Future[typing.Any] | None" = None):
+        self.task: "asyncio.Future[typing.Any] | None" = task
+        self.value: typing.Any = NO_VALUE
+        """Value of the dependency, if it was injected before the future was created"""
+
+    def future(self) -> "asyncio.Future[typing.Any]":
+        """
+        Get the future of the dependency value
+        """
+        if self.task is None:
+            self.task = asyncio.get_running_loop().create_future()
+
+            # Copies of the cache may hold this value after the dependency was injected
+            if self.value is not NO_VALUE:
+                self.task.set_result(self.value)
+
+        return self.task
+
+
+def claim(
+    cache: collections.abc.MutableMapping[CacheKey, typing.Any], key: CacheKey
+) -> PendingValue:
+    """
+    Mark the cached dependency as being injected,
+    so concurrent injections sharing the cache wait for its value instead of injecting it again
+    """
+    pending = cache[key] = PendingValue()
+    return pending
+
+
+async def wait(pending: PendingValue) -> typing.Any:
+    """
+    Wait for the value of the dependency being injected concurrently.
+
+    Returns ``NO_VALUE`` if its injection was cancelled - the dependency should be injected again.
+    """
+    future = pending.future()
+
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        if not future.cancelled():
+            raise
+
+        return NO_VALUE
+
+
+def settle(claims: dict[CacheKey, PendingValue], key: CacheKey, value: typing.Any) -> None:
+    """
+    Pass the value of the claimed dependency to the injections waiting for it
+    """
+    pending = claims.pop(key, None)
+    if pending is None:
+        return
+
+    pending.value = value
+    if pending.task is not None and not pending.task.done():
+        pending.task.set_result(value)
+
+
+def release(
+    cache: collections.abc.MutableMapping[CacheKey, typing.Any],
+    claims: dict[CacheKey, PendingValue],
+    exc: BaseException,
+) -> None:
+    """
+    Drop claimed dependencies that failed to inject from the cache
+    and pass the exception to the injections waiting for them
+    """
+    for key, pending in claims.items():
+        if cache.get(key) is pending:
+            del cache[key]
+
+        future = pending.future()
+        if future.done():
+            continue
+
+        if isinstance(exc, Exception):
+            future.set_exception(exc)
+            # There may be no injections waiting for it
+            future.exception()
+        else:
+            future.cancel()
+
+    claims.clear()
+
+
+def parameter_scope(scope: Scope, parameter: Parameter) -> Scope:
+    """
+    Make scope for the dependency of the parameter
+    """
+    return scope | Scope(
+        {
+            "__fundi_parameter__": parameter,
+            Parameter: Type.instance(parameter),
+        }
+    )
+
+
+def side_effects_scope(
+    scope: Scope, info: CallableInfo[typing.Any], values: dict[str, typing.Any]
+) -> Scope:
+    """
+    Make scope for the side effects of the dependant
+    """
+    return scope | Scope(
+        {
+            "__values__": values.copy(),
+            "__dependant__": info.copy(True),
+            "__scope__": scope.copy(),
+            "__fundi_parameter__": None,
+        }
+    )
+
 
 def injection_impl(
     scope: Scope,
     info: CallableInfo[typing.Any],
     cache: collections.abc.MutableMapping[CacheKey, typing.Any],
     override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+    defer: Defer | None = None,
 ) -> collections.abc.Generator[
     tuple[collections.abc.Mapping[str, typing.Any] | Scope, CallableInfo[typing.Any], bool],
     typing.Any,
@@ -32,6 +183,8 @@ def injection_impl(
     - If the parameter requires another dependency to be resolved:
       - Yields `(scope_with_context, dependency_info, True)` to request the caller to inject it.
       - Once the value is received — caches it if allowed.
+    - If the parameter is lazy — uses value made by ``defer``.
+      Without ``defer`` lazy parameters are requested to be injected as regular ones.
 
     After all parameters are resolved, yields:
       `(resolved_values_dict, top_level_callable_info, False)`
@@ -39,72 +192,194 @@ def injection_impl(
     If any error occurs during resolution, attaches injection trace and re-raises the exception.
     """
 
-    collection_logger.debug("Collecting values for %r", info.call)
+    if fundi_logging.DEBUG:
+        collection_logger.debug("Collecting values for %r", info.call)
 
     if info.scopehook:
-        collection_logger.debug("Calling scope hook for %r", info.call)
+        if fundi_logging.DEBUG:
+            collection_logger.debug("Calling scope hook for %r", info.call)
         scope = scope.copy()
         info.scopehook(scope, info)
 
+    if override is None:
+        override = {}
+
     values: dict[str, typing.Any] = {}
     try:
-        for result in resolve(scope, info, cache, override):
-            name = result.parameter.name
-            value = result.value
-
-            if not result.resolved:
-                dependency = result.dependency
-                assert dependency is not None, (
-                    "Dependency expected, got None. This is a bug, please report at https://github.com/KuyuCode/fundi"
-                )
-
-                collection_logger.debug("Passing %r upstream to be injected", dependency.call)
-
-                subscope = scope | Scope(
-                    {
-                        "__fundi_parameter__": result.parameter,
-                        Parameter: Type.instance(result.parameter),
-                    }
-                )
-                value = yield subscope, dependency, True
+        for parameter, strategy, payload in resolution_table(info):
+            dependency: CallableInfo[typing.Any] | None = None
+            value: typing.Any = NO_VALUE
+
+            if strategy == RESOLVE_DEPENDENCY:
+                dependency = payload
+            elif strategy == RESOLVE_LAZY:
+                if defer is not None:
+                    values[parameter.name] = defer(parameter_scope(scope, parameter), payload)
+                    continue
+
+                dependency = payload
+            elif strategy == RESOLVE_TYPE:
+                for type_ in payload:
+                    found = scope.resolve_by_type(type_)
+
+                    if isinstance(found, Type.Instance):
+                        value = found.instance
+                        break
+
+                    if isinstance(found, Type.Factory):
+                        dependency = found.factory
+                        parameter = parameter.copy(from_=dependency)
+                        break
+            else:
+                value = scope.resolve_by_name(payload)
+
+            if dependency is not None:
+                value = override.get(dependency.call)
+
+                if value is not None and not isinstance(value, CallableInfo):
+                    values[parameter.name] = value
+                    continue
+
+                if value is not None:
+                    dependency = typing.cast(CallableInfo[typing.Any], value)
+                elif dependency.use_cache and dependency.key in cache:
+                    value = cache[dependency.key]
+
+                    # Dependencies being injected concurrently
+                    # are awaited by the asynchronous injection
+                    if not isinstance(value, PendingValue):
+                        values[parameter.name] = value
+                        continue
+
+                if fundi_logging.DEBUG:
+                    collection_logger.debug("Passing %r upstream to be injected", dependency.call)
+
+                value = yield parameter_scope(scope, parameter), dependency, True
 
                 if dependency.use_cache:
-                    collection_logger.debug(
-                        "Caching %r value using key %r", dependency.call, dependency.key
-                    )
+                    if fundi_logging.DEBUG:
+                        collection_logger.debug(
+                            "Caching %r value using key %r", dependency.call, dependency.key
+                        )
                     cache[dependency.key] = value
 
-            values[name] = value
+            elif value is NO_VALUE:
+                if not parameter.has_default:
+                    raise ScopeValueNotFoundError(parameter.name, info)
+
+                value = parameter.default
+
+            values[parameter.name] = value
 
         if info.side_effects:
-            collection_logger.debug("Passing %r side effects upstream to be injected", info.call)
-            _values = values.copy()
-            _info = info.copy(True)
-            _scope = scope.copy()
-
-            subscope = scope | Scope(
-                {
-                    "__values__": _values,
-                    "__dependant__": _info,
-                    "__scope__": _scope,
-                    "__fundi_parameter__": None,
-                }
-            )
+            if fundi_logging.DEBUG:
+                collection_logger.debug(
+                    "Passing %r side effects upstream to be injected", info.call
+                )
+            subscope = side_effects_scope(scope, info, values)
 
             for side_effect in info.side_effects:
                 yield subscope, side_effect, True
 
-        collection_logger.debug(
-            "Passing %r with collected values %r to be called", info.call, values
-        )
+        if fundi_logging.DEBUG:
+            collection_logger.debug(
+                "Passing %r with collected values %r to be called", info.call, values
+            )
         yield values, info, False
 
     except Exception as exc:
-        collection_logger.debug("Applying injection trace to %r", exc)
+        if fundi_logging.DEBUG:
+            collection_logger.debug("Applying injection trace to %r", exc)
         add_injection_trace(exc, info, values)
         raise exc
 
 
+def unwind(
+    generators: list[collections.abc.Generator[typing.Any, typing.Any, None]],
+    exc: Exception,
+) -> Exception:
+    """
+    Pass the exception down the injection stack, from the innermost dependency to the dependant,
+    so each of them applies its injection trace.
+
+    Returns the exception to be raised.
+    """
+    for gen in reversed(generators):
+        if fundi_logging.DEBUG:
+            injection_logger.debug("Passing exception %r (%r) to downstream", exc, type(exc))
+        try:
+            gen.throw(exc)
+        except StopIteration:
+            pass
+        except Exception as error:
+            exc = error
+
+    return exc
+
+
+def track_cycles(
+    scope: Scope,
+    info: CallableInfo[typing.Any],
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+    trace: list[CallableInfo[typing.Any]],
+) -> set[CacheKey] | None:
+    """
+    Get the set of keys of dependencies being injected, used to detect cyclic dependencies.
+
+    Returns None if the graph of the dependant was validated using ``fundi.validate``
+    with the scope of the same shape and no dependencies are overridden -
+    such graph is known to be acyclic.
+    """
+    validated = info._validated
+
+    if (
+        validated is None
+        or len(trace) > 1
+        or (override and any(isinstance(value, CallableInfo) for value in override.values()))
+        or not validated.matches(scope)
+    ):
+        return {dependant.key for dependant in trace}
+
+    if fundi_logging.DEBUG:
+        injection_logger.debug("%r graph is validated: Skipping cycle tracking", info.call)
+    return None
+
+
+def specialized_injector(
+    scope: Scope, info: CallableInfo[typing.Any]
+) -> "InjectionPlan | GeneratedInjector | None":
+    """
+    Get injector of the dependant specialized for the scope shape.
+
+    Injector generated by ``fundi.generate`` is preferred if its shape matches.
+    Otherwise, injection plans cached on the dependant are selected by their guards,
+    the plan is compiled on the first injection with scope of a new shape.
+
+    Returns None if the dependant should be injected generically.
+    """
+    # Plans delegate such dependants to generic injection anyway.
+    # Plans do not log their steps, so generic injection is used while debugging
+    if info.scopehook is not None or info.side_effects or fundi_logging.DEBUG:
+        return None
+
+    generated = info._generated
+    if generated is not None and generated.plan.matches(scope):
+        return generated
+
+    plans = info._plans
+    for plan in plans:
+        if plan.guard.check(scope):
+            return plan if plan.complete else None
+
+    if len(plans) >= MAX_SPECIALIZED_PLANS:
+        return None
+
+    # Plans are built on top of this module
+    from fundi.plan import specialize
+
+    return specialize(info, scope)
+
+
 def inject(
     scope: collections.abc.Mapping[str, typing.Any] | Scope,
     info: CallableInfo[typing.Any],
@@ -118,6 +393,9 @@ def inject(
 
     If exit stack is not provided - it will be created and closed after injection
 
+    Dependencies are injected using explicit stack instead of recursion,
+    so the depth of the dependency graph is not limited by the Python recursion limit.
+
     :param scope: container with contextual values
     :param info: callable information
     :param stack: exit stack to properly handle generator dependencies
@@ -135,46 +413,81 @@ def inject(
     if not isinstance(scope, Scope):
         scope = Scope.from_legacy(scope)
 
+    if _trace is None:
+        injector = specialized_injector(scope, info)
+        if injector is not None:
+            return injector._inject(  # pyright: ignore[reportPrivateUsage]
+                scope, stack, cache, override
+            )
+
     if stack is None:
-        injection_logger.debug("Exit stack not provided, creating own")
+        if fundi_logging.DEBUG:
+            injection_logger.debug("Exit stack not provided, creating own")
         with contextlib.ExitStack() as stack:
-            return inject(scope, info, stack, cache, override, _trace)
+            return inject(scope, info, stack, cache, override, _trace=_trace)
 
     if cache is None:
         cache = {}
 
-    _trace = (*(_trace or ()), info)
+    if fundi_logging.DEBUG:
+        injection_logger.debug("Synchronously injecting %r", info.call)
+
+    trace = [*(_trace or ()), info]
 
-    injection_logger.debug("Synchronously injecting %r", info.call)
+    def defer(scope: Scope, dependency: CallableInfo[typing.Any]) -> Lazy[typing.Any]:
+        return Lazy(scope, dependency, stack, cache, override, tuple(trace))
 
-    gen = injection_impl(scope, info, cache, override)
+    generators = [injection_impl(scope, info, cache, override, defer)]
+    active = track_cycles(scope, info, override, trace)
 
     value: typing.Any | None = None
 
     try:
         while True:
-            inner_scope, inner_info, more = gen.send(value)
+            inner_scope, inner_info, more = generators[-1].send(value)
+            value = None
 
             if more:
-                if inner_info in _trace:
-                    raise CyclicDependencyError(_trace)
-                injection_logger.debug("Got %r from downstream: Injecting it", inner_info.call)
-                value = inject(inner_scope, inner_info, stack, cache, override, _trace)
+                if active is not None:
+                    if inner_info.key in active:
+                        raise CyclicDependencyError(tuple(trace))
+
+                    active.add(inner_info.key)
+
+                if inner_info.async_:
+                    raise RuntimeError(
+                        "Cannot process async functions ({func}) in synchronous injection".format(
+                            func=callable_str(inner_info.call)
+                        )
+                    )
+
+                if fundi_logging.DEBUG:
+                    injection_logger.debug("Got %r from downstream: Injecting it", inner_info.call)
+                trace.append(inner_info)
+                generators.append(
+                    injection_impl(inner_scope, inner_info, cache, override, defer)  # type: ignore
+                )
                 continue
 
-            injection_logger.debug(
-                "Got collected values %r from downstream: Calling %r with them",
-                inner_scope,
-                inner_info.call,
-            )
+            if fundi_logging.DEBUG:
+                injection_logger.debug(
+                    "Got collected values %r from downstream: Calling %r with them",
+                    inner_scope,
+                    inner_info.call,
+                )
 
-            return call_sync(stack, inner_info, inner_scope)  # type: ignore
-    except Exception as exc:
-        injection_logger.debug("Passing exception %r (%r) to downstream", exc, type(exc))
-        with contextlib.suppress(StopIteration):
-            gen.throw(type(exc), exc, exc.__traceback__)
+            value = call_sync(stack, inner_info, inner_scope)  # type: ignore
 
-        raise
+            generators.pop()
+            key = trace.pop().key
+
+            if active is not None:
+                active.discard(key)
+
+            if not generators:
+                return value
+    except Exception as exc:
+        raise unwind(generators, exc)
 
 
 async def ainject(
@@ -183,6 +496,7 @@ async def ainject(
     stack: contextlib.AsyncExitStack | None = None,
     cache: collections.abc.MutableMapping[CacheKey, typing.Any] | None = None,
     override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    concurrency: Concurrency = "sequential",
     _trace: tuple[CallableInfo[typing.Any], ...] | None = None,
 ) -> typing.Any:
     """
@@ -190,56 +504,328 @@ async def ainject(
 
     If exit stack is not provided - it will be created and closed after injection
 
+    If ``concurrency`` is ``"gather"`` - sibling dependencies are injected concurrently.
+    Otherwise, dependencies are injected using explicit stack instead of recursion,
+    so the depth of the dependency graph is not limited by the Python recursion limit.
+
     :param scope: container with contextual values
     :param info: callable information
     :param stack: exit stack to properly handle generator dependencies
     :param cache: dependency cache
     :param override: override dependencies
+    :param concurrency: strategy of resolving sibling dependencies: ``"sequential"`` or ``"gather"``
     :return: result of callable
     """
     if not isinstance(scope, Scope):
         scope = Scope.from_legacy(scope)
 
+    if _trace is None and concurrency == "sequential":
+        injector = specialized_injector(scope, info)
+        if injector is not None:
+            inject_specialized = injector._ainject  # pyright: ignore[reportPrivateUsage]
+            return await inject_specialized(scope, stack, cache, override)
+
     if stack is None:
-        injection_logger.debug("Exit stack not provided, creating own")
+        if fundi_logging.DEBUG:
+            injection_logger.debug("Exit stack not provided, creating own")
         async with contextlib.AsyncExitStack() as stack:
-            return await ainject(scope, info, stack, cache, override, _trace)
+            return await ainject(scope, info, stack, cache, override, concurrency, _trace)
 
     if cache is None:
         cache = {}
 
-    _trace = (*(_trace or ()), info)
+    if concurrency == "gather":
+        return await gather_injection(scope, info, stack, cache, override, (*(_trace or ()), info))
+
+    if fundi_logging.DEBUG:
+        injection_logger.debug("Asynchronously injecting %r", info.call)
+
+    trace = [*(_trace or ()), info]
 
-    injection_logger.debug("Asynchronously injecting %r", info.call)
+    def defer(scope: Scope, dependency: CallableInfo[typing.Any]) -> Lazy[typing.Any]:
+        return Lazy(scope, dependency, stack, cache, override, tuple(trace))
 
-    gen = injection_impl(scope, info, cache, override)
+    generators = [injection_impl(scope, info, cache, override, defer)]
+    active = track_cycles(scope, info, override, trace)
+    claims: dict[CacheKey, PendingValue] = {}
 
     value: typing.Any | None = None
 
     try:
         while True:
-            inner_scope, inner_info, more = gen.send(value)
+            inner_scope, inner_info, more = generators[-1].send(value)
+            value = None
 
             if more:
-                if inner_info.key in _trace:
+                if active is not None and inner_info.key in active:
+                    raise CyclicDependencyError(tuple(trace))
+
+                # Side effects are not cached
+                if inner_info.use_cache and not any(
+                    inner_info is side_effect for side_effect in trace[-1].side_effects
+                ):
+                    pending = cache.get(inner_info.key)
+
+                    if isinstance(pending, PendingValue):
+                        if fundi_logging.DEBUG:
+                            injection_logger.debug(
+                                "%r is being injected concurrently: Waiting for it", inner_info.call
+                            )
+
+                        value = await wait(pending)
+                        if value is not NO_VALUE:
+                            continue
+
+                    claims[inner_info.key] = claim(cache, inner_info.key)
+
+                if active is not None:
+                    active.add(inner_info.key)
+
+                if fundi_logging.DEBUG:
+                    injection_logger.debug("Got %r from downstream: Injecting it", inner_info.call)
+                trace.append(inner_info)
+                generators.append(
+                    injection_impl(inner_scope, inner_info, cache, override, defer)  # type: ignore
+                )
+                continue
+
+            if fundi_logging.DEBUG:
+                injection_logger.debug(
+                    "Got collected values %r from downstream: Calling %r with them",
+                    inner_scope,
+                    inner_info.call,
+                )
+
+            if inner_info.async_:
+                value = await call_async(stack, inner_info, inner_scope)  # type: ignore
+            else:
+                value = call_sync(stack, inner_info, inner_scope)  # type: ignore
+
+            generators.pop()
+            key = trace.pop().key
+
+            if active is not None:
+                active.discard(key)
+
+            if claims:
+                settle(claims, key, value)
+
+            if not generators:
+                return value
+    except Exception as exc:
+        if claims:
+            release(cache, claims, exc)
+        raise unwind(generators, exc)
+    except BaseException as exc:
+        if claims:
+            release(cache, claims, exc)
+        raise
+
+
+async def gather_injection(
+    scope: Scope,
+    info: CallableInfo[typing.Any],
+    stack: contextlib.AsyncExitStack,
+    cache: collections.abc.MutableMapping[CacheKey, typing.Any],
+    override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+    _trace: tuple[CallableInfo[typing.Any], ...],
+) -> typing.Any:
+    """
+    Asynchronously inject dependencies into callable, injecting sibling dependencies concurrently.
+
+    Each dependency is injected in its own task with its own exit stack.
+    Exit stacks are connected to the ``stack`` in the order of parameters,
+    so lifespan dependencies are closed in the same order as with sequential injection.
+
+    Cached dependencies being injected are stored in the cache as ``PendingValue``,
+    so each of them is injected only once.
+    """
+    if fundi_logging.DEBUG:
+        injection_logger.debug("Concurrently injecting %r", info.call)
+
+    if info.scopehook:
+        if fundi_logging.DEBUG:
+            collection_logger.debug("Calling scope hook for %r", info.call)
+        scope = scope.copy()
+        info.scopehook(scope, info)
+
+    values: dict[str, typing.Any] = {}
+    pending: dict[str, asyncio.Future[typing.Any]] = {}
+    owned: dict[asyncio.Future[typing.Any], CacheKey | None] = {}
+    # Keys of the dependants being injected, used to detect cyclic dependencies
+    keys = {dependant.key for dependant in _trace}
+
+    async def wait_dependency(
+        value: PendingValue,
+        parameter: Parameter,
+        dependency: CallableInfo[typing.Any],
+        substack: contextlib.AsyncExitStack,
+    ) -> typing.Any:
+        """
+        Wait for the dependency being injected concurrently,
+        inject it if the injection that claimed it was cancelled
+        """
+        while True:
+            value = await wait(value)
+            if value is not NO_VALUE:
+                return value
+
+            value = cache.get(dependency.key, NO_VALUE)
+            if value is NO_VALUE:
+                break
+
+            if not isinstance(value, PendingValue):
+                return value
+
+        if fundi_logging.DEBUG:
+            collection_logger.debug("Injection of %r was cancelled: Injecting it", dependency.call)
+
+        claims = {dependency.key: claim(cache, dependency.key)}
+
+        try:
+            value = await ainject(
+                parameter_scope(scope, parameter),
+                dependency,
+                substack,
+                cache,
+                override,
+                "gather",
+                _trace,
+            )
+        except BaseException as exc:
+            release(cache, claims, exc)
+            raise
+
+        cache[dependency.key] = value
+        settle(claims, dependency.key, value)
+        return value
+
+    try:
+        for result in resolve(scope, info, cache, override):
+            name = result.parameter.name
+
+            if not result.resolved:
+                dependency = result.dependency
+                assert (
+                    dependency is not None
+                ), "Dependency expected, got None. This is a bug, please report at https://github.com/KuyuCode/fundi"
+
+                if result.parameter.lazy:
+                    values[name] = Lazy(
+                        parameter_scope(scope, result.parameter),
+                        dependency,
+                        stack,
+                        cache,
+                        override,
+                        _trace,
+                    )
+                    continue
+
+                if dependency.key in keys:
                     raise CyclicDependencyError(_trace)
-                injection_logger.debug("Got %r from downstream: Injecting it", inner_info.call)
-                value = await ainject(inner_scope, inner_info, stack, cache, override, _trace)
+
+                if fundi_logging.DEBUG:
+                    collection_logger.debug("Scheduling %r to be injected", dependency.call)
+
+                substack = contextlib.AsyncExitStack()
+                stack.push_async_exit(substack)
+
+                task = asyncio.ensure_future(
+                    ainject(
+                        parameter_scope(scope, result.parameter),
+                        dependency,
+                        substack,
+                        cache,
+                        override,
+                        "gather",
+                        _trace,
+                    )
+                )
+
+                owned[task] = None
+                if dependency.use_cache:
+                    owned[task] = dependency.key
+                    cache[dependency.key] = PendingValue(task)
+
+                pending[name] = task
+                continue
+
+            if isinstance(result.value, PendingValue):
+                assert result.dependency is not None
+
+                if fundi_logging.DEBUG:
+                    collection_logger.debug("Waiting for %r to be injected", name)
+
+                substack = contextlib.AsyncExitStack()
+                stack.push_async_exit(substack)
+
+                task = asyncio.ensure_future(
+                    wait_dependency(result.value, result.parameter, result.dependency, substack)
+                )
+                owned[task] = None
+                pending[name] = task
                 continue
 
+            values[name] = result.value
+
+        if pending:
+            try:
+                results = await asyncio.gather(*pending.values())
+            except BaseException:
+                for task in owned:
+                    task.cancel()
+
+                await asyncio.gather(*owned, return_exceptions=True)
+                raise
+            finally:
+                for task, key in owned.items():
+                    if key is None:
+                        continue
+
+                    value = cache.get(key)
+                    if not isinstance(value, PendingValue) or value.task is not task:
+                        continue
+
+                    if task.cancelled() or task.exception() is not None:
+                        del cache[key]
+                    else:
+                        if fundi_logging.DEBUG:
+                            collection_logger.debug("Caching value using key %r", key)
+                        cache[key] = task.result()
+
+            values.update(zip(pending, results))
+            values = {parameter.name: values[parameter.name] for parameter in info.parameters}
+
+        if info.side_effects:
+            if fundi_logging.DEBUG:
+                collection_logger.debug("Injecting %r side effects", info.call)
+            subscope = side_effects_scope(scope, info, values)
+
+        for side_effect in info.side_effects:
+            if side_effect.key in keys:
+                raise CyclicDependencyError(_trace)
+
+            await ainject(
+                subscope,
+                side_effect,
+                stack,
+                cache,
+                override,
+                "gather",
+                _trace,
+            )
+
+        if fundi_logging.DEBUG:
             injection_logger.debug(
-                "Got collected values %r from downstream: Calling %r with them",
-                inner_scope,
-                inner_info.call,
+                "Got collected values %r: Calling %r with them", values, info.call
             )
 
-            if info.async_:
-                return await call_async(stack, inner_info, inner_scope)  # type: ignore
+        if info.async_:
+            return await call_async(stack, info, values)
 
-            return call_sync(stack, inner_info, inner_scope)  # type: ignore
+        return call_sync(stack, info, values)
     except Exception as exc:
-        injection_logger.debug("Passing exception %r (%r) to downstream", exc, type(exc))
-        with contextlib.suppress(StopIteration):
-            gen.throw(type(exc), exc, exc.__traceback__)
-
+        if fundi_logging.DEBUG:
+            collection_logger.debug("Applying injection trace to %r", exc)
+        add_injection_trace(exc, info, values)
         raise
@@ -1,10 +1,14 @@
 import typing
 from types import CoroutineType
+from asyncio import Future
 from typing import overload, Coroutine
 from collections.abc import Generator, AsyncGenerator, Mapping, MutableMapping
 
+from fundi.lazy import Lazy
 from fundi.scope import Scope
-from fundi.types import CacheKey, CallableInfo
+from fundi.plan import InjectionPlan
+from fundi.codegen import GeneratedInjector
+from fundi.types import CacheKey, CallableInfo, Parameter
 
 from contextlib import (
     AbstractAsyncContextManager,
@@ -17,16 +21,54 @@ R = typing.TypeVar("R")
 
 ExitStack = AsyncExitStack | SyncExitStack
 
+Concurrency = typing.Literal["sequential", "gather"]
+
+Defer = typing.Callable[[Scope, CallableInfo[typing.Any]], Lazy[typing.Any]]
+
+MAX_SPECIALIZED_PLANS: int
+
+class PendingValue:
+    task: Future[typing.Any] | None
+    value: typing.Any
+    def __init__(self, task: Future[typing.Any] | None = None) -> None: ...
+    def future(self) -> Future[typing.Any]: ...
+
+def claim(cache: MutableMapping[CacheKey, typing.Any], key: CacheKey) -> PendingValue: ...
+async def wait(pending: PendingValue) -> typing.Any: ...
+def settle(claims: dict[CacheKey, PendingValue], key: CacheKey, value: typing.Any) -> None: ...
+def release(
+    cache: MutableMapping[CacheKey, typing.Any],
+    claims: dict[CacheKey, PendingValue],
+    exc: BaseException,
+) -> None: ...
+def parameter_scope(scope: Scope, parameter: Parameter) -> Scope: ...
+def side_effects_scope(
+    scope: Scope, info: CallableInfo[typing.Any], values: dict[str, typing.Any]
+) -> Scope: ...
 def injection_impl(
     scope: Scope,
     info: CallableInfo[typing.Any],
     cache: MutableMapping[CacheKey, typing.Any],
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+    defer: Defer | None = None,
 ) -> Generator[
     tuple[Mapping[str, typing.Any] | Scope, CallableInfo[typing.Any], bool],
     typing.Any,
     None,
 ]: ...
+def track_cycles(
+    scope: Scope,
+    info: CallableInfo[typing.Any],
+    override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+    trace: list[CallableInfo[typing.Any]],
+) -> set[CacheKey] | None: ...
+def specialized_injector(
+    scope: Scope, info: CallableInfo[typing.Any]
+) -> InjectionPlan | GeneratedInjector | None: ...
+def unwind(
+    generators: list[Generator[typing.Any, typing.Any, None]],
+    exc: Exception,
+) -> Exception: ...
 @overload
 def inject(
     scope: Mapping[str, typing.Any] | Scope,
@@ -58,6 +100,7 @@ async def ainject(
     stack: AsyncExitStack | None = None,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    concurrency: Concurrency = "sequential",
 ) -> R: ...
 @overload
 async def ainject(
@@ -66,6 +109,7 @@ async def ainject(
     stack: AsyncExitStack | None = None,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    concurrency: Concurrency = "sequential",
 ) -> R: ...
 @overload
 async def ainject(
@@ -74,6 +118,7 @@ async def ainject(
     stack: AsyncExitStack | None = None,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    concurrency: Concurrency = "sequential",
 ) -> R: ...
 @overload
 async def ainject(
@@ -82,6 +127,7 @@ async def ainject(
     stack: AsyncExitStack | None = None,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    concurrency: Concurrency = "sequential",
 ) -> R: ...
 @overload
 async def ainject(
@@ -90,6 +136,7 @@ async def ainject(
     stack: AsyncExitStack | None = None,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    concurrency: Concurrency = "sequential",
 ) -> R: ...
 @overload
 async def ainject(
@@ -98,6 +145,7 @@ async def ainject(
     stack: AsyncExitStack | None = None,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    concurrency: Concurrency = "sequential",
 ) -> R: ...
 @overload
 async def ainject(
@@ -106,4 +154,13 @@ async def ainject(
     stack: AsyncExitStack | None = None,
     cache: MutableMapping[CacheKey, typing.Any] | None = None,
     override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+    concurrency: Concurrency = "sequential",
 ) -> R: ...
+async def gather_injection(
+    scope: Scope,
+    info: CallableInfo[typing.Any],
+    stack: AsyncExitStack,
+    cache: MutableMapping[CacheKey, typing.Any],
+    override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+    _trace: tuple[CallableInfo[typing.Any], ...],
+) -> typing.Any: ...
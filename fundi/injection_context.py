@@ -33,7 +33,7 @@ from contextlib import AsyncExitStack, ExitStack
 from collections.abc import Mapping, MutableMapping
 
 from .scope import Scope
-from .inject import ainject, inject
+from .inject import Concurrency, ainject, inject
 from .types import CacheKey, CallableInfo
 
 
@@ -189,6 +189,7 @@ class AsyncInjectionContext:
         scope: Mapping[str, typing.Any] | Scope | None = None,
         cache: MutableMapping[CacheKey, typing.Any] | None = None,
         override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+        concurrency: Concurrency = "sequential",
     ) -> None:
         self.scope: Scope = _validate_scope(scope)
 
@@ -198,6 +199,8 @@ class AsyncInjectionContext:
             {**override} if override is not None else {}
         )
 
+        self.concurrency: Concurrency = concurrency
+
         self.stack: AsyncExitStack = AsyncExitStack()
 
     async def inject(
@@ -240,6 +243,7 @@ class AsyncInjectionContext:
             self.stack,
             cache,
             {**self.override, **override},
+            self.concurrency,
         )
 
     async def sub(
@@ -281,7 +285,9 @@ class AsyncInjectionContext:
         override = override or {}
         cache: MutableMapping[CacheKey, typing.Any] = {} if no_cache else {**self.cache}
 
-        return AsyncInjectionContext(self.scope | scope, cache, {**self.override, **override})
+        return AsyncInjectionContext(
+            self.scope | scope, cache, {**self.override, **override}, self.concurrency
+        )
 
     def __repr__(self) -> str:
         return f"AsyncInjectionContext(scope={self.scope!r}, cache={self.cache!r}, override={self.override!r})"
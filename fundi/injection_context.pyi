@@ -5,6 +5,7 @@ from typing_extensions import Self, overload
 from collections.abc import Mapping, MutableMapping, Generator, AsyncGenerator, Coroutine
 
 from .scope import Scope
+from .inject import Concurrency
 from .types import CacheKey, CallableInfo
 
 from contextlib import (
@@ -86,12 +87,14 @@ class AsyncInjectionContext:
     cache: dict[CacheKey, typing.Any]
     override: dict[typing.Callable[..., typing.Any], typing.Any]
     stack: AsyncExitStack
+    concurrency: Concurrency
 
     def __init__(
         self,
         scope: Mapping[str, typing.Any] | Scope | None = None,
         cache: MutableMapping[CacheKey, typing.Any] | None = None,
         override: Mapping[typing.Callable[..., typing.Any], typing.Any] | None = None,
+        concurrency: Concurrency = "sequential",
     ) -> None: ...
     async def sub(
         self,
@@ -0,0 +1,190 @@
+"""
+Lazily injected dependencies.
+
+Parameter annotated with ``Lazy[T]`` receives ``Lazy`` object instead of the dependency value.
+The dependency is injected only when the value is requested,
+so dependencies used only on some code paths cost nothing on the others::
+
+    def handler(db: Lazy[Session] = from_(require_db)):
+        if cached := lookup():
+            return cached
+
+        return db.get().query(...)
+
+Value is injected with the scope, cache, overrides and exit stack of the injection
+the ``Lazy`` object was created by.
+"""
+
+import typing
+import contextlib
+import collections.abc
+
+from fundi import logging as fundi_logging
+from fundi.logging import get_logger
+from fundi.types import CacheKey, CallableInfo
+
+if typing.TYPE_CHECKING:
+    from fundi.scope import Scope
+
+__all__ = ["Lazy"]
+
+logger = get_logger("lazy")
+
+T = typing.TypeVar("T")
+
+NOT_INJECTED = object()
+"""Value of the ``Lazy`` that was not requested yet"""
+
+
+class Lazy(typing.Generic[T]):
+    """
+    Dependency value injected on the first request.
+
+    ``get()`` injects the dependency synchronously, ``await lazy`` - asynchronously.
+    The value is injected once and reused by the following requests.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "info",
+        "_scope",
+        "_stack",
+        "_cache",
+        "_override",
+        "_trace",
+        "_value",
+    )
+
+    def __init__(
+        self,
+        scope: "Scope",
+        info: CallableInfo[T],
+        stack: contextlib.ExitStack | contextlib.AsyncExitStack,
+        cache: collections.abc.MutableMapping[CacheKey, typing.Any],
+        override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+        trace: tuple[CallableInfo[typing.Any], ...],
+    ):
+        self.info: CallableInfo[T] = info
+        self._scope: "Scope" = scope
+        self._stack: contextlib.ExitStack | contextlib.AsyncExitStack = stack
+        self._cache: collections.abc.MutableMapping[CacheKey, typing.Any] = cache
+        self._override: (
+            collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None
+        ) = override
+        self._trace: tuple[CallableInfo[typing.Any], ...] = trace
+        self._value: typing.Any = NOT_INJECTED
+
+    @property
+    def resolved(self) -> bool:
+        """
+        Whether the value was already injected
+        """
+        return self._value is not NOT_INJECTED
+
+    def _overridden(self) -> tuple[CallableInfo[typing.Any], typing.Any]:
+        """
+        Get the dependency to inject and its overridden value, if any
+        """
+        from fundi.scope import NO_VALUE
+
+        info: CallableInfo[typing.Any] = self.info
+
+        if self._override:
+            value = self._override.get(info.call)
+            if isinstance(value, CallableInfo):
+                return typing.cast(CallableInfo[typing.Any], value), NO_VALUE
+
+            if value is not None:
+                return info, value
+
+        return info, NO_VALUE
+
+    def get(self) -> T:
+        """
+        Synchronously inject the dependency, if it is not injected yet, and get its value
+        """
+        if self._value is not NOT_INJECTED:
+            return self._value
+
+        # Injection is built on top of this module
+        from fundi.scope import NO_VALUE
+        from fundi.inject import PendingValue, inject
+
+        info, value = self._overridden()
+
+        if value is NO_VALUE and info.use_cache:
+            value = self._cache.get(info.key, NO_VALUE)
+
+            # Only asynchronous injection can wait for dependencies being injected
+            if isinstance(value, PendingValue):
+                value = NO_VALUE
+
+        if value is NO_VALUE:
+            if fundi_logging.DEBUG:
+                logger.debug("Synchronously injecting lazy %r", info.call)
+
+            value = inject(
+                self._scope,
+                info,
+                typing.cast(contextlib.ExitStack, self._stack),
+                self._cache,
+                self._override,
+                _trace=self._trace,
+            )
+
+            if info.use_cache:
+                self._cache[info.key] = value
+
+        self._value = value
+        return value
+
+    async def aget(self) -> T:
+        """
+        Asynchronously inject the dependency, if it is not injected yet, and get its value
+        """
+        if self._value is not NOT_INJECTED:
+            return self._value
+
+        from fundi.scope import NO_VALUE
+        from fundi.inject import PendingValue, ainject, claim, wait, settle, release
+
+        info, value = self._overridden()
+        claims: dict[CacheKey, PendingValue] = {}
+
+        if value is NO_VALUE and info.use_cache:
+            value = self._cache.get(info.key, NO_VALUE)
+            if isinstance(value, PendingValue):
+                value = await wait(value)
+
+            if value is NO_VALUE:
+                claims[info.key] = claim(self._cache, info.key)
+
+        if value is NO_VALUE:
+            if fundi_logging.DEBUG:
+                logger.debug("Asynchronously injecting lazy %r", info.call)
+
+            try:
+                value = await ainject(
+                    self._scope,
+                    info,
+                    typing.cast(contextlib.AsyncExitStack, self._stack),
+                    self._cache,
+                    self._override,
+                    _trace=self._trace,
+                )
+            except BaseException as exc:
+                release(self._cache, claims, exc)
+                raise
+
+            if info.use_cache:
+                self._cache[info.key] = value
+                settle(claims, info.key, value)
+
+        self._value = value
+        return value
+
+    def __await__(self) -> collections.abc.Generator[typing.Any, None, T]:
+        return self.aget().__await__()
+
+    def __repr__(self) -> str:
+        value = repr(self._value) if self._value is not NOT_INJECTED else "<not injected>"
+        return f"Lazy({self.info.call!r}, {value})"
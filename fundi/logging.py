@@ -1,7 +1,29 @@
+import os
 from logging import getLogger
 
 _root_logger = getLogger("fundi")
 
+DEBUG_ENVIRONMENT_VARIABLE = "FUNDI_DEBUG"
+
+DEBUG: bool = os.environ.get(DEBUG_ENVIRONMENT_VARIABLE, "").lower() in ("1", "true", "yes", "on")
+"""
+Whether FunDI emits debug logs.
+
+Debug logging is done on every step of scanning and injection, so it is disabled by default
+to keep it off the hot path.
+Enable it with ``set_debug(True)`` or ``FUNDI_DEBUG=1`` environment variable.
+"""
+
+
+def set_debug(enabled: bool = True) -> None:
+    """
+    Enable or disable FunDI debug logs.
+
+    Logs are emitted to the ``fundi`` logger hierarchy and are still subject to its level.
+    """
+    global DEBUG
+    DEBUG = enabled
+
 
 def get_logger(name: str):
     return _root_logger.getChild(name)
@@ -0,0 +1,739 @@
+"""
+Compiled injection plans.
+
+``compile(info, scope_shape)`` walks the dependency graph of the dependant once
+and flattens it into a list of steps, fixing the resolution strategy of every
+parameter for the given scope shape (which names, types and factories are present).
+
+The resulting ``InjectionPlan`` can be used any number of times with scopes of the same shape::
+
+    plan = compile(scan(handler), Scope({"request": request}))
+
+    for request in requests:
+        plan.inject(Scope({"request": request}))
+
+If the scope passed to the plan has a different shape -
+the plan falls back to ``inject``/``ainject``.
+"""
+
+import typing
+import contextlib
+import collections.abc
+from dataclasses import dataclass, field
+
+from fundi.lazy import Lazy
+from fundi.scope import NO_VALUE, Scope, Type
+from fundi import logging as fundi_logging
+from fundi.logging import get_logger
+from fundi.inject import PendingValue, inject, ainject, claim, wait, settle, release
+from fundi.types import CacheKey, CallableInfo, Parameter
+from fundi.exceptions import CyclicDependencyError
+from fundi.util import (
+    call_bound_sync,
+    call_bound_async,
+    add_injection_trace,
+    callable_str,
+)
+
+__all__ = ["compile", "specialize", "InjectionPlan", "PlanNode", "PlanGuard"]
+
+logger = get_logger("plan")
+
+# Step operations
+OP_ENTER = 0
+"""Check override and cache for the dependency, skip its steps if the value is found"""
+OP_CALL = 1
+"""Collect values of the dependant and call it"""
+OP_DELEGATE = 2
+"""Inject the dependency using generic ``inject``/``ainject``"""
+OP_FACTORY = 3
+"""Inject the type factory found in scope using generic ``inject``/``ainject``"""
+OP_LAZY = 4
+"""Wrap the dependency of the lazy parameter into ``Lazy``, it is injected on request"""
+
+# Argument resolution strategies
+ARG_SLOT = 0
+"""Value is produced by the dependency stored in the slot"""
+ARG_NAME = 1
+"""Value is stored in scope under the name"""
+ARG_TYPE = 2
+"""Value is stored in scope as the type instance"""
+ARG_CONST = 3
+"""Value is known at compile time (defaults, dependency parameter awareness)"""
+ARG_MISSING = 4
+"""Value cannot be resolved with the compiled scope shape"""
+
+Argument = tuple[Parameter, int, typing.Any]
+
+
+@dataclass
+class PlanNode:
+    """
+    Single occurrence of the dependency in the compiled graph.
+    """
+
+    info: CallableInfo[typing.Any] | None
+    """Dependency information. ``None`` for type factories - they are taken from scope"""
+    parent: "PlanNode | None"
+    """Dependant this dependency is injected into"""
+    parameter: Parameter | None
+    """Parameter of the dependant this dependency is injected into"""
+    position: int
+    """Position of the parameter in the dependant's parameter list"""
+    slot: int
+    """Index of the slot the result of this dependency is stored into"""
+    type_: typing.Any = None
+    """Type the factory is resolved by"""
+    end: int = 0
+    """Index of the last step of this dependency"""
+    arguments: list[Argument] = field(default_factory=list)
+    """Resolution strategies of the dependency parameters"""
+    overlay: Scope | None = None
+    """Scope overlay used for generic injection of this dependency"""
+
+
+@dataclass
+class PlanGuard:
+    """
+    Scope shape the plan was compiled for.
+    """
+
+    names: frozenset[str] = frozenset()
+    absent_names: frozenset[str] = frozenset()
+    instances: frozenset[typing.Any] = frozenset()
+    factories: frozenset[typing.Any] = frozenset()
+    absent_types: frozenset[typing.Any] = frozenset()
+
+    def check(self, scope: Scope) -> bool:
+        """
+        Check whether the scope has the same shape as the one plan was compiled for
+        """
+        by_name = scope.resolve_by_name
+        by_type = scope.resolve_by_type
+
+        for name in self.names:
+            if by_name(name) is NO_VALUE:
+                return False
+
+        for name in self.absent_names:
+            if by_name(name) is not NO_VALUE:
+                return False
+
+        for type_ in self.instances:
+            if not isinstance(by_type(type_), Type.Instance):
+                return False
+
+        for type_ in self.factories:
+            if not isinstance(by_type(type_), Type.Factory):
+                return False
+
+        for type_ in self.absent_types:
+            if by_type(type_) is not NO_VALUE:
+                return False
+
+        return True
+
+
+def _overlay(parameter: Parameter) -> Scope:
+    return Scope({"__fundi_parameter__": parameter, Parameter: Type.instance(parameter)})
+
+
+class _PlanBuilder:
+    def __init__(self, scope: Scope):
+        self.scope: Scope = scope
+        self.steps: list[tuple[int, PlanNode]] = []
+        self.slots: int = 0
+        self.complete: bool = True
+
+        self.names: set[str] = set()
+        self.absent_names: set[str] = set()
+        self.instances: set[typing.Any] = set()
+        self.factories: set[typing.Any] = set()
+        self.absent_types: set[typing.Any] = set()
+
+    def node(
+        self,
+        info: CallableInfo[typing.Any] | None,
+        parent: PlanNode | None,
+        parameter: Parameter | None,
+        position: int,
+    ) -> PlanNode:
+        node = PlanNode(info, parent, parameter, position, self.slots)
+        self.slots += 1
+        return node
+
+    def visit(
+        self,
+        info: CallableInfo[typing.Any],
+        parent: PlanNode | None = None,
+        parameter: Parameter | None = None,
+        position: int = 0,
+        trace: tuple[CallableInfo[typing.Any], ...] = (),
+    ) -> PlanNode:
+        node = self.node(info, parent, parameter, position)
+
+        if parameter is not None:
+            node.overlay = _overlay(parameter)
+
+        # Scope hooks and side effects depend on runtime values - leave them to generic injection
+        if info.scopehook is not None or info.side_effects:
+            if fundi_logging.DEBUG:
+                logger.debug("Delegating %r to generic injection", info.call)
+            node.end = len(self.steps)
+            self.steps.append((OP_DELEGATE, node))
+            return node
+
+        if parent is not None:
+            self.steps.append((OP_ENTER, node))
+
+        trace = (*trace, info)
+
+        for index, param in enumerate(info.parameters):
+            node.arguments.append(self.argument(node, param, index, trace))
+
+        node.end = len(self.steps)
+        self.steps.append((OP_CALL, node))
+
+        return node
+
+    def dependency(
+        self,
+        node: PlanNode,
+        parameter: Parameter,
+        position: int,
+        trace: tuple[CallableInfo[typing.Any], ...],
+    ) -> Argument:
+        dependency = parameter.from_
+        assert dependency is not None
+
+        if dependency in trace:
+            raise CyclicDependencyError(trace)
+
+        child = self.visit(dependency, node, parameter, position, trace)
+        return parameter, ARG_SLOT, child.slot
+
+    def argument(
+        self,
+        node: PlanNode,
+        parameter: Parameter,
+        position: int,
+        trace: tuple[CallableInfo[typing.Any], ...],
+    ) -> Argument:
+        if parameter.from_ is not None and parameter.lazy:
+            child = self.node(parameter.from_, node, parameter, position)
+            child.overlay = _overlay(parameter)
+            child.end = len(self.steps)
+            self.steps.append((OP_LAZY, child))
+
+            return parameter, ARG_SLOT, child.slot
+
+        if parameter.from_ is not None:
+            return self.dependency(node, parameter, position, trace)
+
+        if parameter.resolve_by_type:
+            for type_ in parameter.type_options:
+                if node.parameter is not None and type_ is Parameter:
+                    return parameter, ARG_CONST, node.parameter
+
+                resolved = self.scope.resolve_by_type(type_)
+
+                if isinstance(resolved, Type.Instance):
+                    self.instances.add(type_)
+                    return parameter, ARG_TYPE, type_
+
+                if isinstance(resolved, Type.Factory):
+                    self.factories.add(type_)
+
+                    child = self.node(None, node, parameter, position)
+                    child.type_ = type_
+                    child.end = len(self.steps)
+                    self.steps.append((OP_FACTORY, child))
+
+                    return parameter, ARG_SLOT, child.slot
+
+                self.absent_types.add(type_)
+
+        elif node.parameter is not None and parameter.name == "__fundi_parameter__":
+            return parameter, ARG_CONST, node.parameter
+
+        elif parameter.name in self.scope.values:
+            self.names.add(parameter.name)
+            return parameter, ARG_NAME, parameter.name
+
+        else:
+            self.absent_names.add(parameter.name)
+
+        if parameter.has_default:
+            return parameter, ARG_CONST, parameter.default
+
+        self.complete = False
+        return parameter, ARG_MISSING, None
+
+
+class InjectionPlan:
+    """
+    Reusable injection plan of the dependant.
+
+    Holds the dependency graph topologically ordered as the flat list of steps
+    with resolution strategy of each parameter fixed for the compiled scope shape.
+    """
+
+    def __init__(
+        self,
+        info: CallableInfo[typing.Any],
+        steps: list[tuple[int, PlanNode]],
+        slots: int,
+        guard: PlanGuard,
+        complete: bool,
+    ):
+        self.info: CallableInfo[typing.Any] = info
+        self.steps: list[tuple[int, PlanNode]] = steps
+        self.slots: int = slots
+        self.guard: PlanGuard = guard
+        self.complete: bool = complete
+
+    def matches(self, scope: Scope) -> bool:
+        """
+        Check whether this plan can be used with the scope.
+        """
+        return self.complete and self.guard.check(scope)
+
+    @staticmethod
+    def _argument(
+        kind: int, payload: typing.Any, scope: Scope, slots: list[typing.Any]
+    ) -> typing.Any:
+        if kind == ARG_SLOT:
+            return slots[payload]
+        if kind == ARG_NAME:
+            return scope.resolve_by_name(payload)
+        if kind == ARG_TYPE:
+            return scope.resolve_by_type(payload).instance
+
+        return payload
+
+    def _values(
+        self, node: PlanNode, scope: Scope, slots: list[typing.Any], until: int | None = None
+    ) -> dict[str, typing.Any]:
+        values: dict[str, typing.Any] = {}
+        for parameter, kind, payload in node.arguments[:until]:
+            values[parameter.name] = self._argument(kind, payload, scope, slots)
+
+        return values
+
+    def _trace(
+        self,
+        exc: Exception,
+        op: int,
+        node: PlanNode,
+        scope: Scope,
+        slots: list[typing.Any],
+    ) -> None:
+        """
+        Apply injection trace the same way generic injection does
+        """
+        if op == OP_CALL:
+            assert node.info is not None
+            add_injection_trace(exc, node.info, self._values(node, scope, slots))
+
+        while node.parent is not None:
+            parent = node.parent
+            assert parent.info is not None
+            add_injection_trace(exc, parent.info, self._values(parent, scope, slots, node.position))
+            node = parent
+
+    @staticmethod
+    def _ancestors(node: PlanNode) -> tuple[CallableInfo[typing.Any], ...]:
+        """
+        Dependants the node is injected into, used to detect cycles in generic injection
+        """
+        ancestors: list[CallableInfo[typing.Any]] = []
+
+        parent = node.parent
+        while parent is not None:
+            assert parent.info is not None
+            ancestors.append(parent.info)
+            parent = parent.parent
+
+        return tuple(reversed(ancestors))
+
+    def _factory(self, node: PlanNode, scope: Scope) -> tuple[CallableInfo[typing.Any], Scope]:
+        assert node.parameter is not None
+        factory: CallableInfo[typing.Any] = scope.resolve_by_type(node.type_).factory
+        return factory, scope | _overlay(node.parameter.copy(from_=factory))
+
+    def inject(
+        self,
+        scope: collections.abc.Mapping[str, typing.Any] | Scope,
+        stack: contextlib.ExitStack | None = None,
+        cache: collections.abc.MutableMapping[CacheKey, typing.Any] | None = None,
+        override: (
+            collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None
+        ) = None,
+    ) -> typing.Any:
+        """
+        Synchronously inject dependencies into callable using this plan.
+
+        Falls back to ``inject`` if the scope shape does not match the compiled one.
+
+        :param scope: container with contextual values
+        :param stack: exit stack to properly handle generator dependencies
+        :param cache: dependency cache
+        :param override: override dependencies
+        :return: result of callable
+        """
+        if not isinstance(scope, Scope):
+            scope = Scope.from_legacy(scope)
+
+        if not self.matches(scope):
+            if fundi_logging.DEBUG:
+                logger.debug("Scope does not match plan of %r: Falling back", self.info.call)
+            return inject(scope, self.info, stack, cache, override)
+
+        return self._inject(scope, stack, cache, override)
+
+    def _inject(
+        self,
+        scope: Scope,
+        stack: contextlib.ExitStack | None,
+        cache: collections.abc.MutableMapping[CacheKey, typing.Any] | None,
+        override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+    ) -> typing.Any:
+        """
+        Inject dependencies using this plan without checking the scope shape
+        """
+        if self.info.async_:
+            raise RuntimeError(
+                "Cannot process async functions ({func}) in synchronous injection".format(
+                    func=callable_str(self.info.call)
+                )
+            )
+
+        if stack is None:
+            with contextlib.ExitStack() as stack:
+                return self._inject(scope, stack, cache, override)
+
+        if cache is None:
+            cache = {}
+
+        if override is None:
+            override = {}
+
+        steps = self.steps
+        slots: list[typing.Any] = [None] * self.slots
+        argument = self._argument
+        length = len(steps)
+        ix = 0
+
+        op, node = steps[0]
+        try:
+            while ix < length:
+                op, node = steps[ix]
+
+                if op == OP_CALL:
+                    info = typing.cast(CallableInfo[typing.Any], node.info)
+                    args, kwargs = info.binder.bind_ordered(
+                        [
+                            argument(kind, payload, scope, slots)
+                            for _, kind, payload in node.arguments
+                        ]
+                    )
+                    value = call_bound_sync(stack, info, args, kwargs)
+
+                    if node.parent is not None and info.use_cache:
+                        cache[info.key] = value
+
+                    slots[node.slot] = value
+                    ix += 1
+                    continue
+
+                if op == OP_LAZY:
+                    slots[node.slot] = Lazy(
+                        scope | typing.cast(Scope, node.overlay),
+                        typing.cast(CallableInfo[typing.Any], node.info),
+                        stack,
+                        cache,
+                        override,
+                        self._ancestors(node),
+                    )
+                    ix += 1
+                    continue
+
+                subscope = node.overlay
+                if op == OP_FACTORY:
+                    info, subscope = self._factory(node, scope)
+                else:
+                    info = typing.cast(CallableInfo[typing.Any], node.info)
+
+                if node.parent is not None:
+                    value = override.get(info.call)
+                    if value is not None:
+                        if isinstance(value, CallableInfo):
+                            info = typing.cast(CallableInfo[typing.Any], value)
+                            op = OP_DELEGATE
+                        else:
+                            slots[node.slot] = value
+                            ix = node.end + 1
+                            continue
+
+                    elif info.use_cache and info.key in cache:
+                        value = cache[info.key]
+
+                        # Only asynchronous injection can wait for dependencies being injected
+                        if not isinstance(value, PendingValue):
+                            slots[node.slot] = value
+                            ix = node.end + 1
+                            continue
+
+                if op == OP_ENTER:
+                    if info.async_:
+                        raise RuntimeError(
+                            "Cannot process async functions ({func}) "
+                            "in synchronous injection".format(func=callable_str(info.call))
+                        )
+
+                    ix += 1
+                    continue
+
+                if subscope is not None:
+                    subscope = scope | subscope
+                else:
+                    subscope = scope
+
+                value = inject(subscope, info, stack, cache, override, _trace=self._ancestors(node))
+
+                if node.parent is not None and info.use_cache:
+                    cache[info.key] = value
+
+                slots[node.slot] = value
+                ix = node.end + 1
+
+            return slots[steps[-1][1].slot]
+        except Exception as exc:
+            self._trace(exc, op, node, scope, slots)
+            raise
+
+    async def ainject(
+        self,
+        scope: collections.abc.Mapping[str, typing.Any] | Scope,
+        stack: contextlib.AsyncExitStack | None = None,
+        cache: collections.abc.MutableMapping[CacheKey, typing.Any] | None = None,
+        override: (
+            collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None
+        ) = None,
+    ) -> typing.Any:
+        """
+        Asynchronously inject dependencies into callable using this plan.
+
+        Falls back to ``ainject`` if the scope shape does not match the compiled one.
+
+        :param scope: container with contextual values
+        :param stack: exit stack to properly handle generator dependencies
+        :param cache: dependency cache
+        :param override: override dependencies
+        :return: result of callable
+        """
+        if not isinstance(scope, Scope):
+            scope = Scope.from_legacy(scope)
+
+        if not self.matches(scope):
+            if fundi_logging.DEBUG:
+                logger.debug("Scope does not match plan of %r: Falling back", self.info.call)
+            return await ainject(scope, self.info, stack, cache, override)
+
+        return await self._ainject(scope, stack, cache, override)
+
+    async def _ainject(
+        self,
+        scope: Scope,
+        stack: contextlib.AsyncExitStack | None,
+        cache: collections.abc.MutableMapping[CacheKey, typing.Any] | None,
+        override: collections.abc.Mapping[typing.Callable[..., typing.Any], typing.Any] | None,
+    ) -> typing.Any:
+        """
+        Inject dependencies using this plan without checking the scope shape
+        """
+        if stack is None:
+            async with contextlib.AsyncExitStack() as stack:
+                return await self._ainject(scope, stack, cache, override)
+
+        if cache is None:
+            cache = {}
+
+        if override is None:
+            override = {}
+
+        steps = self.steps
+        slots: list[typing.Any] = [None] * self.slots
+        claims: dict[CacheKey, PendingValue] = {}
+        argument = self._argument
+        length = len(steps)
+        ix = 0
+
+        op, node = steps[0]
+        try:
+            while ix < length:
+                op, node = steps[ix]
+
+                if op == OP_CALL:
+                    info = typing.cast(CallableInfo[typing.Any], node.info)
+                    args, kwargs = info.binder.bind_ordered(
+                        [
+                            argument(kind, payload, scope, slots)
+                            for _, kind, payload in node.arguments
+                        ]
+                    )
+
+                    if info.async_:
+                        value = await call_bound_async(stack, info, args, kwargs)
+                    else:
+                        value = call_bound_sync(stack, info, args, kwargs)
+
+                    if node.parent is not None and info.use_cache:
+                        cache[info.key] = value
+
+                        if claims:
+                            settle(claims, info.key, value)
+
+                    slots[node.slot] = value
+                    ix += 1
+                    continue
+
+                if op == OP_LAZY:
+                    slots[node.slot] = Lazy(
+                        scope | typing.cast(Scope, node.overlay),
+                        typing.cast(CallableInfo[typing.Any], node.info),
+                        stack,
+                        cache,
+                        override,
+                        self._ancestors(node),
+                    )
+                    ix += 1
+                    continue
+
+                subscope = node.overlay
+                if op == OP_FACTORY:
+                    info, subscope = self._factory(node, scope)
+                else:
+                    info = typing.cast(CallableInfo[typing.Any], node.info)
+
+                if node.parent is not None:
+                    value = override.get(info.call)
+                    if value is not None:
+                        if isinstance(value, CallableInfo):
+                            info = typing.cast(CallableInfo[typing.Any], value)
+                            op = OP_DELEGATE
+                        else:
+                            slots[node.slot] = value
+                            ix = node.end + 1
+                            continue
+
+                    elif info.use_cache and info.key in cache:
+                        value = cache[info.key]
+                        if isinstance(value, PendingValue):
+                            value = await wait(value)
+
+                        if value is not NO_VALUE:
+                            slots[node.slot] = value
+                            ix = node.end + 1
+                            continue
+
+                    if info.use_cache:
+                        claims[info.key] = claim(cache, info.key)
+
+                if op == OP_ENTER:
+                    ix += 1
+                    continue
+
+                if subscope is not None:
+                    subscope = scope | subscope
+                else:
+                    subscope = scope
+
+                value = await ainject(
+                    subscope, info, stack, cache, override, _trace=self._ancestors(node)
+                )
+
+                if node.parent is not None and info.use_cache:
+                    cache[info.key] = value
+
+                    if claims:
+                        settle(claims, info.key, value)
+
+                slots[node.slot] = value
+                ix = node.end + 1
+
+            return slots[steps[-1][1].slot]
+        except Exception as exc:
+            if claims:
+                release(cache, claims, exc)
+            self._trace(exc, op, node, scope, slots)
+            raise
+        except BaseException as exc:
+            if claims:
+                release(cache, claims, exc)
+            raise
+
+    def __repr__(self) -> str:
+        return f"InjectionPlan({callable_str(self.info.call)}, steps={len(self.steps)})"
+
+
+def compile(
+    info: CallableInfo[typing.Any],
+    scope_shape: collections.abc.Mapping[str, typing.Any] | Scope | None = None,
+) -> InjectionPlan:
+    """
+    Compile injection plan of the callable.
+
+    Walks dependency graph once, orders it topologically
+    and fixes resolution strategy of each parameter for the provided scope shape.
+
+    Only presence of the values in ``scope_shape`` matters, not the values themselves.
+
+    :param info: callable information
+    :param scope_shape: scope that has the same names, types and factories
+        as scopes the plan will be used with
+    :return: injection plan
+    """
+    if scope_shape is None:
+        scope_shape = Scope()
+    elif not isinstance(scope_shape, Scope):
+        scope_shape = Scope.from_legacy(scope_shape)
+
+    if fundi_logging.DEBUG:
+        logger.debug("Compiling injection plan for %r", info.call)
+
+    builder = _PlanBuilder(scope_shape)
+    builder.visit(info)
+
+    guard = PlanGuard(
+        frozenset(builder.names),
+        frozenset(builder.absent_names),
+        frozenset(builder.instances),
+        frozenset(builder.factories),
+        frozenset(builder.absent_types),
+    )
+
+    return InjectionPlan(info, builder.steps, builder.slots, guard, builder.complete)
+
+
+def specialize(info: CallableInfo[typing.Any], scope: Scope) -> InjectionPlan | None:
+    """
+    Compile injection plan of the callable for the scope shape and cache it on the ``info``.
+
+    Used by ``inject``/``ainject`` on the first injection with scope of a new shape.
+    Plans that cannot be used with their shape are cached too,
+    so the shape is recognized by the plan guard without compiling it again.
+
+    :param info: callable information
+    :param scope: scope the callable is injected with
+    :return: injection plan or ``None`` if the callable cannot be injected with a plan
+    """
+    try:
+        plan = compile(info, scope)
+    except (CyclicDependencyError, RecursionError):
+        # Leave these graphs to generic injection, it reports cycles and handles deep graphs.
+        # Guard without requirements matches any scope, so they are not compiled again
+        plan = InjectionPlan(info, [], 0, PlanGuard(), False)
+
+    info._plans = (*info._plans, plan)  # pyright: ignore[reportPrivateUsage]
+    return plan if plan.complete else None
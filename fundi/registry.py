@@ -0,0 +1,197 @@
+"""
+Registry of scan results for callables that cannot hold ``__fundi_info__`` attribute.
+
+``scan`` caches its result in the ``__fundi_info__`` attribute of the callable.
+Bound methods, builtins and instances of classes
+with ``__slots__`` reject new attributes, so their results are kept here instead.
+
+Entries are bound to the lifetime of their callable:
+
+- bound methods are registered by their function, so every ``service.method``
+  access reuses the same entry, regardless of the instance
+- callables that support weak references are held weakly and their entry
+  is dropped when they are garbage collected
+- other callables are held strongly in a bounded LRU,
+  so they are never confused with another object having the same id
+
+Callables are never hashed, so unhashable ones are safe to register.
+"""
+
+import typing
+import threading
+from types import MethodType
+from dataclasses import dataclass, fields
+from collections import OrderedDict
+from weakref import ref, ReferenceType
+
+from fundi import logging as fundi_logging
+from fundi.logging import get_logger
+from fundi.types import CallableInfo
+
+__all__ = ["ScanRegistry", "RegistryStats", "scan_registry"]
+
+logger = get_logger("registry")
+
+Template = dict[str, typing.Any]
+"""Fields of the ``CallableInfo`` except ``call``"""
+
+
+@dataclass(frozen=True)
+class RegistryStats:
+    size: int
+    """Total amount of entries"""
+    weak: int
+    """Entries held by weak references"""
+    strong: int
+    """Entries held in the bounded LRU"""
+    hits: int
+    """Lookups that found the scan result"""
+    misses: int
+    """Lookups that found nothing"""
+
+
+def _anchor(call: typing.Any) -> typing.Any:
+    """
+    Object the scan result of the callable is bound to
+    """
+    if isinstance(call, MethodType):
+        return call.__func__
+
+    return call
+
+
+class ScanRegistry:
+    """
+    Registry of scan results.
+
+    :param maxsize: maximum amount of callables held strongly
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize: int = maxsize
+
+        self._weak: dict[int, tuple[ReferenceType[typing.Any], Template]] = {}
+        self._strong: OrderedDict[int, tuple[typing.Any, Template]] = OrderedDict()
+        self._lock: threading.RLock = threading.RLock()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, call: typing.Callable[..., typing.Any]) -> CallableInfo[typing.Any] | None:
+        """
+        Get registered scan result of the callable
+        """
+        anchor = _anchor(call)
+        key = id(anchor)
+
+        template: Template | None = None
+
+        weak = self._weak.get(key)
+        if weak is not None:
+            if weak[0]() is anchor:
+                template = weak[1]
+
+        elif key in self._strong:
+            with self._lock:
+                entry = self._strong.get(key)
+                if entry is not None and entry[0] is anchor:
+                    self._strong.move_to_end(key)
+                    template = entry[1]
+
+        if template is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return CallableInfo(call=call, **template)
+
+    def add(self, call: typing.Callable[..., typing.Any], info: CallableInfo[typing.Any]) -> None:
+        """
+        Register scan result of the callable
+        """
+        anchor = _anchor(call)
+        key = id(anchor)
+
+        # The entry must not reference the callable, otherwise it would never be collected
+        template = {
+            field.name: getattr(info, field.name)
+            for field in fields(info)
+            if field.init and field.name != "call"
+        }
+
+        # Graph results are bound to the callable, bound methods of other instances get their own
+        if anchor is not call:
+            del template["_artifacts"]
+
+        with self._lock:
+            try:
+                self._weak[key] = (ref(anchor, self._forget_callback(key)), template)
+                self._strong.pop(key, None)
+                return
+            except TypeError:
+                pass
+
+            self._strong[key] = (anchor, template)
+            self._strong.move_to_end(key)
+
+            if len(self._strong) > self.maxsize:
+                self._strong.popitem(last=False)
+
+        if fundi_logging.DEBUG:
+            logger.debug("Registered scan result of %r", call)
+
+    def _forget_callback(self, key: int) -> typing.Callable[[ReferenceType[typing.Any]], None]:
+        def forget(reference: ReferenceType[typing.Any]) -> None:
+            with self._lock:
+                entry = self._weak.get(key)
+                if entry is not None and entry[0] is reference:
+                    del self._weak[key]
+
+        return forget
+
+    def invalidate(self, call: typing.Callable[..., typing.Any] | None = None) -> None:
+        """
+        Drop registered scan result of the callable, or all results if callable is not provided
+        """
+        with self._lock:
+            if call is None:
+                self._weak.clear()
+                self._strong.clear()
+                return
+
+            anchor = _anchor(call)
+            key = id(anchor)
+
+            entry = self._weak.get(key)
+            if entry is not None and entry[0]() is anchor:
+                del self._weak[key]
+
+            strong = self._strong.get(key)
+            if strong is not None and strong[0] is anchor:
+                del self._strong[key]
+
+    def stats(self) -> RegistryStats:
+        """
+        Get size statistics of the registry
+        """
+        weak = len(self._weak)
+        strong = len(self._strong)
+        return RegistryStats(weak + strong, weak, strong, self.hits, self.misses)
+
+    def __len__(self) -> int:
+        return len(self._weak) + len(self._strong)
+
+    def __contains__(self, call: typing.Callable[..., typing.Any]) -> bool:
+        anchor = _anchor(call)
+        key = id(anchor)
+
+        weak = self._weak.get(key)
+        if weak is not None:
+            return weak[0]() is anchor
+
+        entry = self._strong.get(key)
+        return entry is not None and entry[0] is anchor
+
+
+scan_registry = ScanRegistry()
+"""Process-wide registry used by ``scan``"""
@@ -1,6 +1,7 @@
 import typing
 import collections.abc
 
+from fundi import logging as fundi_logging
 from fundi.logging import get_logger
 from fundi.scope import Scope, NO_VALUE, Type
 from fundi.util import normalize_annotation, callable_str
@@ -8,6 +9,42 @@ from fundi.types import CacheKey, CallableInfo, ParameterResult, Parameter
 
 logger = get_logger("resolve")
 
+# Parameter resolution strategies
+RESOLVE_DEPENDENCY = 0
+"""Value is produced by the dependency. Payload is the dependency"""
+RESOLVE_TYPE = 1
+"""Value is resolved by type. Payload is the tuple of type options"""
+RESOLVE_NAME = 2
+"""Value is resolved by name. Payload is the name"""
+RESOLVE_LAZY = 3
+"""Value is ``fundi.lazy.Lazy`` injecting the dependency on request. Payload is the dependency"""
+
+Strategy = tuple[Parameter, int, typing.Any]
+
+
+def resolution_table(info: CallableInfo[typing.Any]) -> tuple[Strategy, ...]:
+    """
+    Get resolution strategies of the callable parameters.
+
+    Table is built once on the first use and stored in the ``info``.
+    """
+    table = info._resolution_table
+    if table is not None:
+        return table
+
+    strategies: list[Strategy] = []
+    for parameter in info.parameters:
+        if parameter.from_ is not None:
+            strategy = RESOLVE_LAZY if parameter.lazy else RESOLVE_DEPENDENCY
+            strategies.append((parameter, strategy, parameter.from_))
+        elif parameter.resolve_by_type:
+            strategies.append((parameter, RESOLVE_TYPE, parameter.type_options))
+        else:
+            strategies.append((parameter, RESOLVE_NAME, parameter.name))
+
+    table = info._resolution_table = tuple(strategies)
+    return table
+
 
 def resolve_by_dependency(
     param: Parameter,
@@ -18,11 +55,13 @@ def resolve_by_dependency(
 
     assert dependency is not None
 
-    logger.debug("Resolving %r using dependency %s", param.name, callable_str(dependency.call))
+    if fundi_logging.DEBUG:
+        logger.debug("Resolving %r using dependency %s", param.name, callable_str(dependency.call))
 
     value = override.get(dependency.call)
     if value is not None:
-        logger.debug("Found value %r for %r: Override", value, param.name)
+        if fundi_logging.DEBUG:
+            logger.debug("Found value %r for %r: Override", value, param.name)
         if isinstance(value, CallableInfo):
             return ParameterResult(
                 param, None, typing.cast(CallableInfo[typing.Any], value), resolved=False
@@ -32,18 +71,24 @@ def resolve_by_dependency(
 
     if dependency.use_cache and dependency.key in cache:
         value = cache[dependency.key]
-        logger.debug("Found value %r for %r: Cache", value, param.name)
+        if fundi_logging.DEBUG:
+            logger.debug("Found value %r for %r: Cache", value, param.name)
         return ParameterResult(param, value, dependency, resolved=True)
 
-    logger.debug(
-        "Not found value for %r: Hoping, that the upstream will deal with it", param.name
-    )  # LMAO
+    if fundi_logging.DEBUG:
+        logger.debug(
+            "Not found value for %r: Hoping, that the upstream will deal with it", param.name
+        )  # LMAO
     return ParameterResult(param, None, dependency, resolved=False)
 
 
-def resolve_by_type(scope: Scope, param: Parameter) -> ParameterResult:
-    logger.debug("Resolving %r using annotation %r", param.name, param.annotation)
-    type_options = normalize_annotation(param.annotation)
+def resolve_by_type(
+    scope: Scope, param: Parameter, type_options: tuple[typing.Any, ...] | None = None
+) -> ParameterResult:
+    if fundi_logging.DEBUG:
+        logger.debug("Resolving %r using annotation %r", param.name, param.annotation)
+    if type_options is None:
+        type_options = param.type_options or normalize_annotation(param.annotation)
 
     for type_ in type_options:
         value = scope.resolve_by_type(typing.cast(type[typing.Any], type_))
@@ -53,17 +98,20 @@ def resolve_by_type(scope: Scope, param: Parameter) -> ParameterResult:
 
         match value:
             case Type.Instance(value):
-                logger.debug("Found type instance %r for %r", value, param.name)
+                if fundi_logging.DEBUG:
+                    logger.debug("Found type instance %r for %r", value, param.name)
                 return ParameterResult(param, value, None, resolved=True)
             case Type.Factory(factory):
-                logger.debug(
-                    "Found type factory %s for %r",
-                    callable_str(factory.call),
-                    param.name,
-                )
+                if fundi_logging.DEBUG:
+                    logger.debug(
+                        "Found type factory %s for %r",
+                        callable_str(factory.call),
+                        param.name,
+                    )
                 return ParameterResult(param, None, factory, False)
 
-    logger.debug("Not found value for %r using annotation %r", param.name, param.annotation)
+    if fundi_logging.DEBUG:
+        logger.debug("Not found value for %r using annotation %r", param.name, param.annotation)
 
     return ParameterResult(param, None, None, resolved=False)
 
@@ -100,18 +148,24 @@ def resolve(
     """
     from fundi.exceptions import ScopeValueNotFoundError
 
-    logger.debug("Resolving values for %r", info.call)
+    if fundi_logging.DEBUG:
+        logger.debug("Resolving values for %r", info.call)
 
     if override is None:
         override = {}
 
-    for parameter in info.parameters:
-        if parameter.from_:
+    for parameter, strategy, payload in resolution_table(info):
+        if strategy == RESOLVE_DEPENDENCY:
             yield resolve_by_dependency(parameter, cache, override)
             continue
 
-        if parameter.resolve_by_type:
-            result = resolve_by_type(scope, parameter)
+        if strategy == RESOLVE_LAZY:
+            # Lazy value is created by the injection, as it is bound to its exit stack
+            yield ParameterResult(parameter, None, payload, resolved=False)
+            continue
+
+        if strategy == RESOLVE_TYPE:
+            result = resolve_by_type(scope, parameter, payload)
 
             if result.dependency is not None:
                 yield resolve_by_dependency(
@@ -124,14 +178,16 @@ def resolve(
                 continue
 
         elif (value := scope.resolve_by_name(parameter.name)) is not NO_VALUE:
-            logger.debug("Found value %r for %r: Name", value, parameter.name)
+            if fundi_logging.DEBUG:
+                logger.debug("Found value %r for %r: Name", value, parameter.name)
             yield ParameterResult(parameter, value, None, resolved=True)
             continue
 
         if parameter.has_default:
-            logger.debug(
-                "Falling back to default value %r for %r", parameter.default, parameter.name
-            )
+            if fundi_logging.DEBUG:
+                logger.debug(
+                    "Falling back to default value %r for %r", parameter.default, parameter.name
+                )
             yield ParameterResult(parameter, parameter.default, None, resolved=True)
             continue
 
@@ -1,37 +1,167 @@
 import typing
 import inspect
+import threading
+from typing_extensions import override
 from types import BuiltinFunctionType, FunctionType, MethodType
 from collections.abc import AsyncGenerator, Awaitable, Generator
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
 
+from fundi import logging as fundi_logging
 from fundi.logging import get_logger
-from fundi.types import R, CallableInfo, Parameter, TypeResolver
+from fundi.lazy import Lazy
+from fundi.registry import scan_registry
+from fundi.types import R, CacheKey, CallableInfo, GraphArtifacts, Parameter, TypeResolver
 from fundi.util import is_configured, get_configuration, normalize_annotation
 
 logger = get_logger("scan")
 
+_LAZY_ATTRIBUTES = frozenset(
+    {
+        "async_",
+        "context",
+        "generator",
+        "parameters",
+        "return_annotation",
+        "configuration",
+        "named_parameters",
+        "_artifacts",
+        "binder",
+    }
+)
+"""Attributes of the ``CallableInfo`` that require callable signature"""
 
-def _transform_parameter(parameter: inspect.Parameter) -> Parameter:
-    logger.debug("Transforming parameter %r into FunDI parameter", parameter.name)
+_lazy_lock = threading.RLock()
 
-    positional_varying = parameter.kind == inspect.Parameter.VAR_POSITIONAL
-    positional_only = parameter.kind == inspect.Parameter.POSITIONAL_ONLY
-    keyword_varying = parameter.kind == inspect.Parameter.VAR_KEYWORD
-    keyword_only = parameter.kind == inspect.Parameter.KEYWORD_ONLY
 
-    default = parameter.default
-    has_default = default is not inspect.Parameter.empty
+_EMPTY = inspect.Parameter.empty
+
+_SIGNATURE_ATTRIBUTES = frozenset({"__wrapped__", "__signature__", "_partialmethod"})
+"""Function attributes that change its signature"""
+
+SignatureParameter = tuple[str, inspect._ParameterKind, typing.Any, typing.Any]
+"""Name, kind, default value and annotation of the parameter"""
+
+
+def _function_signature(
+    function: FunctionType, skip_first: bool
+) -> tuple[list[SignatureParameter], typing.Any]:
+    """
+    Read signature of the plain function directly from its code object,
+    the same way ``inspect.signature`` does, without building ``inspect.Signature``
+    """
+    code = function.__code__
+    names = code.co_varnames
+    positional_count = code.co_argcount
+    keyword_only_count = code.co_kwonlyargcount
+    positional_only_left = code.co_posonlyargcount
+    annotations = function.__annotations__
+    defaults = function.__defaults__ or ()
+    keyword_defaults = function.__kwdefaults__ or {}
+
+    non_default_count = positional_count - len(defaults)
+    parameters: list[SignatureParameter] = []
+
+    for index, name in enumerate(names[:positional_count]):
+        if positional_only_left:
+            kind = inspect.Parameter.POSITIONAL_ONLY
+            positional_only_left -= 1
+        else:
+            kind = inspect.Parameter.POSITIONAL_OR_KEYWORD
+
+        default = defaults[index - non_default_count] if index >= non_default_count else _EMPTY
+        parameters.append((name, kind, default, annotations.get(name, _EMPTY)))
+
+    index = positional_count + keyword_only_count
+
+    if code.co_flags & inspect.CO_VARARGS:
+        name = names[index]
+        parameters.append(
+            (name, inspect.Parameter.VAR_POSITIONAL, _EMPTY, annotations.get(name, _EMPTY))
+        )
+        index += 1
+
+    for name in names[positional_count : positional_count + keyword_only_count]:
+        parameters.append(
+            (
+                name,
+                inspect.Parameter.KEYWORD_ONLY,
+                keyword_defaults.get(name, _EMPTY),
+                annotations.get(name, _EMPTY),
+            )
+        )
+
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        name = names[index]
+        parameters.append(
+            (name, inspect.Parameter.VAR_KEYWORD, _EMPTY, annotations.get(name, _EMPTY))
+        )
+
+    if skip_first:
+        del parameters[0]
+
+    return parameters, annotations.get("return", _EMPTY)
+
+
+def _signature(
+    call: typing.Callable[..., typing.Any],
+) -> tuple[list[SignatureParameter], typing.Any]:
+    """
+    Get parameters and return annotation of the callable.
+
+    Plain functions and methods are read from their code objects,
+    other callables are inspected with ``inspect.signature``
+    """
+    function = call.__func__ if isinstance(call, MethodType) else call
+
+    if (
+        type(function) is FunctionType
+        and _SIGNATURE_ATTRIBUTES.isdisjoint(function.__dict__)
+        and (function is call or function.__code__.co_argcount)
+    ):
+        return _function_signature(function, function is not call)
+
+    signature = inspect.signature(call)
+    parameters = [
+        (parameter.name, parameter.kind, parameter.default, parameter.annotation)
+        for parameter in signature.parameters.values()
+    ]
+    return parameters, signature.return_annotation
+
+
+def _is_lazy(annotation: typing.Any) -> bool:
+    """
+    Check whether the annotation is ``Lazy[T]`` or ``Annotated[Lazy[T], ...]``
+    """
+    if typing.get_origin(annotation) is typing.Annotated:
+        annotation = typing.get_args(annotation)[0]
+
+    return annotation is Lazy or typing.get_origin(annotation) is Lazy
+
+
+def _transform_parameter(
+    name: str, kind: inspect._ParameterKind, default: typing.Any, annotation: typing.Any
+) -> Parameter:
+    if fundi_logging.DEBUG:
+        logger.debug("Transforming parameter %r into FunDI parameter", name)
+
+    positional_varying = kind == inspect.Parameter.VAR_POSITIONAL
+    positional_only = kind == inspect.Parameter.POSITIONAL_ONLY
+    keyword_varying = kind == inspect.Parameter.VAR_KEYWORD
+    keyword_only = kind == inspect.Parameter.KEYWORD_ONLY
+
+    has_default = default is not _EMPTY
     from_: CallableInfo[typing.Any] | None = None
     resolve_by_type = False
 
     if isinstance(default, CallableInfo):
-        logger.debug("Parameter %r is a dependency definition", parameter.name)
+        if fundi_logging.DEBUG:
+            logger.debug("Parameter %r is a dependency definition", name)
         has_default = False
         from_ = typing.cast(CallableInfo[typing.Any], default)
 
-    annotation = parameter.annotation
     if isinstance(annotation, TypeResolver):
-        logger.debug("Parameter %r marked to resolve by type via TypeResolver", parameter.name)
+        if fundi_logging.DEBUG:
+            logger.debug("Parameter %r marked to resolve by type via TypeResolver", name)
         annotation = annotation.annotation
         resolve_by_type = True
 
@@ -40,17 +170,23 @@ def _transform_parameter(parameter: inspect.Parameter) -> Parameter:
 
         if TypeResolver in args:
             resolve_by_type = True
-            logger.debug("Parameter %r marked to resolve by type via FromType", parameter.name)
+            if fundi_logging.DEBUG:
+                logger.debug("Parameter %r marked to resolve by type via FromType", name)
         else:
             presence: tuple[CallableInfo[typing.Any]] | tuple[()] = tuple(
                 filter(lambda x: isinstance(x, CallableInfo), args)
             )
             if presence:
-                logger.debug("Parameter %r is a dependency definition", parameter.name)
+                if fundi_logging.DEBUG:
+                    logger.debug("Parameter %r is a dependency definition", name)
                 from_ = presence[0]
 
+    lazy = _is_lazy(annotation)
+    if lazy and from_ is None:
+        raise ValueError(f"Lazy parameter {name!r} should have a dependency defined with from_")
+
     parameter_ = Parameter(
-        parameter.name,
+        name,
         annotation,
         from_=from_,
         default=default if has_default else None,
@@ -60,12 +196,12 @@ def _transform_parameter(parameter: inspect.Parameter) -> Parameter:
         positional_only=positional_only,
         keyword_varying=keyword_varying,
         keyword_only=keyword_only,
+        lazy=lazy,
     )
 
     if from_ is not None and from_.graphhook is not None:
-        logger.debug(
-            "Calling graph hook defined for %r on parameter %r", from_.call, parameter.name
-        )
+        if fundi_logging.DEBUG:
+            logger.debug("Calling graph hook defined for %r on parameter %r", from_.call, name)
         from_copy = from_.copy(deep=True)
         from_.graphhook(from_copy, parameter_.copy())
 
@@ -88,6 +224,78 @@ def _is_async_context(call: typing.Any):
         return isinstance(call, AbstractAsyncContextManager)
 
 
+class LazyCallableInfo(CallableInfo[R]):
+    """
+    Callable information that is scanned on the first access to the signature-based attributes.
+
+    Callable, caching, hooks and side effects are known upfront,
+    so dependency graph can be built from lazy callable information without scanning them.
+    On the first access to other attributes the callable is scanned
+    and this object turns into regular ``CallableInfo``.
+    """
+
+    def __init__(
+        self,
+        call: typing.Callable[..., R],
+        use_cache: bool,
+        side_effects: tuple[CallableInfo[typing.Any], ...],
+        **options: typing.Any,
+    ):
+        hooks = getattr(call, "__fundi_hooks__", {})
+
+        self.call = call
+        self.use_cache = use_cache
+        self.side_effects = side_effects
+        self.graphhook = hooks.get("graph")
+        self.scopehook = hooks.get("scope")
+        self.key = CacheKey(call)
+        self._options: dict[str, typing.Any] = options
+
+    def _resolve(self) -> None:
+        with _lazy_lock:
+            # Other thread has resolved it first
+            if type(self) is not LazyCallableInfo:
+                return
+
+            state = object.__getattribute__(self, "__dict__")
+
+            if fundi_logging.DEBUG:
+                logger.debug("Resolving lazy CallableInfo for %r", state["call"])
+
+            info = scan(state["call"], caching=state["use_cache"], **state.pop("_options"))
+
+            side_effects = state["side_effects"]
+            key = state["key"]
+
+            state.update(info.__dict__)
+            state["key"] = key
+            state["side_effects"] = side_effects + tuple(
+                side_effect for side_effect in info.side_effects if side_effect not in side_effects
+            )
+
+            # Graph results of the scanned callable do not fit the one with other side effects
+            if state["side_effects"] != info.side_effects:
+                state["_artifacts"] = GraphArtifacts()
+
+            self.__class__ = CallableInfo
+
+    @override
+    def __getattribute__(self, name: str) -> typing.Any:
+        if name in _LAZY_ATTRIBUTES:
+            LazyCallableInfo._resolve(self)
+
+        return object.__getattribute__(self, name)
+
+    @override
+    def copy(self, deep: bool = False, **update: typing.Any):
+        self._resolve()
+        return CallableInfo.copy(self, deep, **update)
+
+    @override
+    def __repr__(self) -> str:
+        return f"LazyCallableInfo(call={self.call!r}, use_cache={self.use_cache!r})"
+
+
 def scan(
     call: typing.Callable[..., R],
     caching: bool = True,
@@ -96,6 +304,7 @@ def scan(
     context: bool | None = None,
     use_return_annotation: bool = True,
     side_effects: tuple[typing.Callable[..., typing.Any], ...] = (),
+    lazy: bool = False,
 ) -> CallableInfo[R]:
     """
     Get callable information
@@ -108,25 +317,33 @@ def scan(
     :param use_return_annotation: Whether to use call's return
         annotation to define it's type
     :param side_effects: functions that will be injected before this dependant
+    :param lazy: whether to defer scanning until the signature-based attributes are accessed.
+        Has no effect if the callable was already scanned
 
     :return: callable information
     """
-    logger.debug(
-        "Scanning %r (async=%s, generator=%s, context=%s, caching=%s)",
-        call,
-        async_,
-        generator,
-        context,
-        caching,
-    )
+    if fundi_logging.DEBUG:
+        logger.debug(
+            "Scanning %r (async=%s, generator=%s, context=%s, caching=%s)",
+            call,
+            async_,
+            generator,
+            context,
+            caching,
+        )
 
     _side_effects: list[CallableInfo[typing.Any]] = []
     for side_effect in side_effects:
         _side_effects.append(scan(side_effect))
 
-    if hasattr(call, "__fundi_info__"):
-        logger.debug("Reusing cached CallableInfo for %r", call)
-        info = typing.cast(CallableInfo[typing.Any], getattr(call, "__fundi_info__"))
+    info = typing.cast(
+        CallableInfo[typing.Any] | None,
+        getattr(call, "__fundi_info__", None) or scan_registry.get(call),
+    )
+
+    if info is not None:
+        if fundi_logging.DEBUG:
+            logger.debug("Reusing cached CallableInfo for %r", call)
 
         overrides: dict[str, typing.Any] = {"use_cache": caching}
         if async_ is not None:
@@ -147,26 +364,40 @@ def scan(
 
             overrides["side_effects"] = tuple(_side_effects)
 
-        logger.debug(
-            "Overriding cached CallableInfo for %r with values: %r",
-            call,
-            list(overrides.keys()),
-        )
+        if fundi_logging.DEBUG:
+            logger.debug(
+                "Overriding cached CallableInfo for %r with values: %r",
+                call,
+                list(overrides.keys()),
+            )
 
         return info.copy(**overrides)
 
+    if lazy:
+        return LazyCallableInfo(
+            call,
+            caching,
+            tuple(_side_effects),
+            async_=async_,
+            generator=generator,
+            context=context,
+            use_return_annotation=use_return_annotation,
+        )
+
     if not callable(call):
-        raise ValueError(f"Callable expected, got {type(call)!r}")  # pyright: ignore[reportUnreachable]
+        raise ValueError(  # pyright: ignore[reportUnreachable]
+            f"Callable expected, got {type(call)!r}"
+        )
 
     truecall = call.__call__
     if isinstance(call, (FunctionType, BuiltinFunctionType, MethodType, type)):
         truecall = call
 
-    signature = inspect.signature(truecall)
+    signature, return_annotation = _signature(truecall)
 
     return_: type[typing.Any] = type
-    if signature.return_annotation is not signature.empty:
-        annotation = normalize_annotation(signature.return_annotation)[0]
+    if return_annotation is not _EMPTY:
+        annotation = normalize_annotation(return_annotation)[0]
 
         if not isinstance(annotation, type):
             return_ = type(return_)
@@ -201,7 +432,7 @@ def scan(
             and issubclass(return_, (AsyncGenerator, AbstractAsyncContextManager, Awaitable))
         ) or (_agenerator or _acontext or inspect.iscoroutinefunction(truecall))
 
-    parameters = [_transform_parameter(parameter) for parameter in signature.parameters.values()]
+    parameters = [_transform_parameter(*parameter) for parameter in signature]
     hooks = getattr(call, "__fundi_hooks__", {})
 
     info = CallableInfo(
@@ -214,14 +445,15 @@ def scan(
         side_effects=(),
         generator=generator,
         parameters=parameters,
-        return_annotation=signature.return_annotation,
+        return_annotation=return_annotation,
         configuration=get_configuration(call) if is_configured(call) else None,
     )
 
     try:
         setattr(call, "__fundi_info__", info)
     except (AttributeError, TypeError):
-        logger.debug("Unable to cache scan result in %r", call)
-        pass
+        if fundi_logging.DEBUG:
+            logger.debug("Unable to cache scan result in %r, using registry", call)
+        scan_registry.add(call, info)
 
     return info.copy(side_effects=tuple(_side_effects))
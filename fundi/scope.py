@@ -1,8 +1,8 @@
 import inspect
 import typing
-from itertools import chain
+import contextlib
 from dataclasses import dataclass
-from collections.abc import Mapping, Callable
+from collections.abc import Mapping, Callable, Iterator
 
 from typing_extensions import NewType, overload, override
 
@@ -38,6 +38,121 @@ NO_VALUE = NoValue()
 
 T = typing.TypeVar("T")
 S = typing.TypeVar("S", bound="Scope")
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+
+MAX_LAYERS = 8
+"""Maximum amount of scope layers. Upper layers are collapsed into one when exceeded"""
+
+_DELETED = NoValue()
+"""Marks the key deleted in upper layer while it still exists in lower ones"""
+
+VALUES = 0
+TYPES = 1
+FACTORIES = 2
+
+Layer: typing.TypeAlias = tuple[
+    dict[str, typing.Any],
+    dict[typing.Any, typing.Any],
+    dict[typing.Any, "CallableInfo[typing.Any]"],
+]
+"""Scope layer: named values, type instances and type factories"""
+
+
+class ScopeView(typing.MutableMapping[K, V]):
+    """
+    Mapping view of the one of scope storages (named values, type instances or type factories).
+
+    Similar to ``collections.ChainMap``: looks up the key in scope layers from the top one.
+    All writes go to the top layer of the scope.
+
+    Type factory is hidden if the instance of the same type is present in any layer.
+    """
+
+    __slots__: tuple[str, ...] = ("scope", "kind")
+
+    def __init__(self, scope: "Scope", kind: int):
+        self.scope: "Scope" = scope
+        self.kind: int = kind
+
+    def _lookup(self, key: typing.Any) -> typing.Any:
+        kind = self.kind
+
+        if kind == FACTORIES and self.scope.types._lookup(key) is not _DELETED:
+            return _DELETED
+
+        for layer in self.scope._layers:
+            storage = layer[kind]
+            if key in storage:
+                return storage[key]
+
+        return _DELETED
+
+    @override
+    def __getitem__(self, key: K) -> V:
+        value = self._lookup(key)
+        if value is _DELETED:
+            raise KeyError(key)
+
+        return value
+
+    @override
+    def get(self, key: K, default: typing.Any = None) -> typing.Any:
+        value = self._lookup(key)
+        if value is _DELETED:
+            return default
+
+        return value
+
+    @override
+    def __contains__(self, key: object) -> bool:
+        return self._lookup(key) is not _DELETED
+
+    @override
+    def __setitem__(self, key: K, value: V) -> None:
+        self.scope._top()[self.kind][key] = value
+
+        self.scope._changed(self.kind)
+
+    @override
+    def __delitem__(self, key: K) -> None:
+        if key not in self:
+            raise KeyError(key)
+
+        storage = self.scope._top()[self.kind]
+        if len(self.scope._layers) == 1:
+            del storage[key]
+        else:
+            storage[key] = _DELETED
+
+        self.scope._changed(self.kind)
+
+    @override
+    def __iter__(self) -> Iterator[K]:
+        seen: set[K] = set()
+        for layer in self.scope._layers:
+            for key in layer[self.kind]:
+                if key in seen:
+                    continue
+
+                seen.add(key)
+
+                if key in self:
+                    yield key
+
+    @override
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def copy(self) -> dict[K, V]:
+        """
+        Make flat copy of this storage
+        """
+        return dict(self.items())
+
+    @override
+    def __repr__(self) -> str:
+        return repr(self.copy())
 
 
 class Type:
@@ -94,6 +209,14 @@ class Type:
         return Type.Instance(instance)
 
 
+def _is_subclass(type_: type, base: type) -> bool:
+    try:
+        return issubclass(type_, base)
+    except TypeError:
+        # Protocols that are not runtime checkable
+        return False
+
+
 class Scope:
     """
     Injection scope.
@@ -105,7 +228,27 @@ class Scope:
     Also, allows to create type factories - functions that create instances of the type.
     """
 
-    def __init__(self, initial: dict[str | type | NewType, typing.Any] | None = None):
+    subclasses: bool = False
+    """Whether types are resolved to instances and factories of their subclasses"""
+    _subclass_cache: dict[typing.Any, typing.Any] | None = None
+    _subscribers: "list[Callable[[Scope], typing.Any]] | None" = None
+    _pending: set[int] | None = None
+    """Kinds of storages changed by the current operation, see ``_operation``"""
+
+    version: int = 0
+    """
+    Version of the scope contents. Incremented on every change of this scope,
+    once per ``add_*`` or ``update`` call.
+
+    Versions are counted per scope: copies and merged scopes start from zero.
+    """
+
+    def __init__(
+        self,
+        initial: dict[str | type | NewType, typing.Any] | None = None,
+        *,
+        subclasses: bool = False,
+    ):
         """
         Create the Scope.
 
@@ -114,26 +257,149 @@ class Scope:
         If the key is the type then the value is checked whether it is ``TypeInstance`` or ``TypeFactory``.
         If the value is the ``TypeInstance`` - it is stored as instance of the type from key.
         If the value is the ``TypeFactory`` - it is stored as factory of the type from key.
+
+        If ``subclasses`` is True - types that are not found in the scope
+        are resolved to instances or factories of their subclasses (see ``resolve_by_type``)
         """
         initial = initial or {}
 
-        self.values: dict[str, typing.Any] = {}
-        self.types: dict[type | NewType, typing.Any] = {}
-        self.factories: dict[type | NewType, "CallableInfo[typing.Any]"] = {}
+        values: dict[str, typing.Any] = {}
+        types: dict[type | NewType, typing.Any] = {}
+        factories: dict[type | NewType, "CallableInfo[typing.Any]"] = {}
 
         for key, value in initial.items():
             if isinstance(key, str):
-                self.values[key] = value
+                values[key] = value
                 continue
 
             match value:
                 case Type.Instance(instance):
-                    self.types[key] = instance
+                    types[key] = instance
                 case Type.Factory(factory):
-                    self.factories[key] = factory
+                    factories[key] = factory
                 case value:
                     raise InvalidInitialValue(value)
 
+        self._own: Layer | None = (values, types, factories)
+        self._layers: tuple[Layer, ...] = (self._own,)
+
+        if subclasses:
+            self.subclasses = True
+
+    @property
+    def values(self) -> ScopeView[str, typing.Any]:
+        """Named values"""
+        return ScopeView(self, VALUES)
+
+    @property
+    def types(self) -> ScopeView[type | NewType, typing.Any]:
+        """Type instances"""
+        return ScopeView(self, TYPES)
+
+    @property
+    def factories(self) -> ScopeView[type | NewType, "CallableInfo[typing.Any]"]:
+        """Type factories"""
+        return ScopeView(self, FACTORIES)
+
+    def _changed(self, kind: int) -> None:
+        """
+        Register change of the scope storage
+        """
+        if self._pending is not None:
+            self._pending.add(kind)
+            return
+
+        self._notify({kind})
+
+    def _notify(self, kinds: set[int]) -> None:
+        """
+        Bump the version and notify subscribers about changes of the storages
+        """
+        self.version += 1
+
+        if kinds != {VALUES} and self._subclass_cache is not None:
+            self._subclass_cache = None
+
+        if self._subscribers:
+            for subscriber in tuple(self._subscribers):
+                subscriber(self)
+
+    @contextlib.contextmanager
+    def _operation(self) -> Iterator[None]:
+        """
+        Register all the changes made inside as a single change, once the operation is done
+        """
+        if self._pending is not None:
+            yield
+            return
+
+        self._pending = set()
+        try:
+            yield
+        finally:
+            kinds, self._pending = self._pending, None
+            if kinds:
+                self._notify(kinds)
+
+    def subscribe(self, subscriber: Callable[["Scope"], typing.Any]) -> Callable[[], None]:
+        """
+        Call ``subscriber`` with this scope after every change of it.
+
+        Subscribers are not inherited by copies and merged scopes.
+
+        :return: function that unsubscribes the subscriber
+        """
+        if self._subscribers is None:
+            self._subscribers = []
+
+        self._subscribers.append(subscriber)
+
+        def unsubscribe() -> None:
+            if self._subscribers is not None and subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+        return unsubscribe
+
+    def _top(self) -> Layer:
+        """
+        Get writable top layer of this scope.
+
+        Layers shared with other scopes are never written,
+        so the new top layer is created if the current one is shared
+        """
+        if self._own is not None:
+            return self._own
+
+        # Existing layers are collapsed first, so the new top layer is never merged away
+        layers = self._collapse(self._layers, MAX_LAYERS - 1)
+
+        self._own = ({}, {}, {})
+        self._layers = (self._own, *layers)
+
+        return self._own
+
+    def _share(self) -> tuple[Layer, ...]:
+        """
+        Share layers of this scope. Next write to this scope will create new top layer
+        """
+        self._own = None
+        return self._layers
+
+    @staticmethod
+    def _collapse(layers: tuple[Layer, ...], limit: int = MAX_LAYERS) -> tuple[Layer, ...]:
+        """
+        Collapse upper layers into one if there are more than ``limit`` of them
+        """
+        if len(layers) <= limit:
+            return layers
+
+        collapsed: Layer = ({}, {}, {})
+        for layer in reversed(layers[:-1]):
+            for kind in (VALUES, TYPES, FACTORIES):
+                collapsed[kind].update(layer[kind])
+
+        return collapsed, layers[-1]
+
     def add_value(self, key: str, value: typing.Any) -> bool:
         """
         Adds named value to the scope.
@@ -175,8 +441,9 @@ class Scope:
             instance = type_or_instance
 
         elif isinstance(type_or_instance, tuple):
-            for type_ in type_or_instance:
-                self.types[type_] = instance
+            with self._operation():
+                for type_ in type_or_instance:
+                    self.types[type_] = instance
             return None
 
         elif isinstance(type_or_instance, (type, NewType)):
@@ -186,16 +453,17 @@ class Scope:
         else:
             raise ValueError("Unable to detect type or value of the assignment")
 
-        if type_ in self.factories:
-            del self.factories[type_]
+        with self._operation():
+            if type_ in self.factories:
+                del self.factories[type_]
 
-        self.types[type_] = instance
+            self.types[type_] = instance
 
-        if mro:
-            for type_ in type_.mro()[1:-1]:
-                if type_ in self.factories:
-                    del self.factories[type_]
-                self.types[type_] = instance
+            if mro:
+                for type_ in type_.mro()[1:-1]:
+                    if type_ in self.factories:
+                        del self.factories[type_]
+                    self.types[type_] = instance
 
     @overload
     def add_factory(
@@ -264,17 +532,18 @@ class Scope:
             if type_ is typing.Any or type_ is None or type_ is inspect.Signature.empty:
                 raise ValueError("Unable to identify return type of the factory")
 
-        if isinstance(type_, tuple):
-            for type__ in type_:
-                if type__ in self.types:
-                    del self.types[type__]  # ty:ignore[invalid-argument-type]
-                self.factories[type__] = scanned_factory  # ty:ignore[invalid-assignment]
-            return
+        with self._operation():
+            if isinstance(type_, tuple):
+                for type__ in type_:
+                    if type__ in self.types:
+                        del self.types[type__]  # ty:ignore[invalid-argument-type]
+                    self.factories[type__] = scanned_factory  # ty:ignore[invalid-assignment]
+                return
 
-        if type_ in self.types:
-            del self.types[type_]
+            if type_ in self.types:
+                del self.types[type_]
 
-        self.factories[type_] = scanned_factory
+            self.factories[type_] = scanned_factory
 
     def update(
         self,
@@ -296,25 +565,26 @@ class Scope:
         When adding a type instance, any existing factory for that type is removed.
         When adding a type factory, any existing instance for that type is removed.
         """
-        self.values.update(values)
-
-        if mapping is None:
-            return None
-
-        for key, value in mapping.items():
-            if isinstance(key, str):
-                self.values[key] = value
-                continue
-
-            match value:
-                case Type.Instance(value):
-                    if key in self.factories:
-                        del self.factories[key]
-                    self.types[key] = value
-                case Type.Factory(factory):
-                    if key in self.types:
-                        del self.types[key]
-                    self.factories[key] = factory
+        with self._operation():
+            self.values.update(values)
+
+            if mapping is None:
+                return None
+
+            for key, value in mapping.items():
+                if isinstance(key, str):
+                    self.values[key] = value
+                    continue
+
+                match value:
+                    case Type.Instance(value):
+                        if key in self.factories:
+                            del self.factories[key]
+                        self.types[key] = value
+                    case Type.Factory(factory):
+                        if key in self.types:
+                            del self.types[key]
+                        self.factories[key] = factory
 
     def resolve_by_name(self, key: str, *, default: typing.Any = NO_VALUE) -> typing.Any | NoValue:
         """
@@ -323,7 +593,12 @@ class Scope:
         Returns either value or the default.
         The default is set to ``NoValue`` instance as the value may be None in the scope.
         """
-        return self.values.get(key, default)
+        for values, _, _ in self._layers:
+            if key in values:
+                value = values[key]
+                return default if value is _DELETED else value
+
+        return default
 
     @overload
     def resolve_by_type(
@@ -343,41 +618,90 @@ class Scope:
         The default is set to ``NoValue`` instance as the value may be None in the scope.
 
         Resolution order: instance of the type -> type factory -> default value
-        """
-        if type_ in self.types:
-            return Type.Instance(self.types[type_])
 
-        if type_ in self.factories:
-            return Type.Factory(self.factories[type_])
+        If the scope resolves ``subclasses`` - the type that is not found
+        is resolved to the instance or factory of its first found subclass
+        (instances take precedence, upper layers first).
+        Results of such lookups are cached until types or factories of the scope change.
+        """
+        for _, types, _ in self._layers:
+            if type_ in types:
+                value = types[type_]
+                if value is not _DELETED:
+                    return Type.Instance(value)
+                break
+
+        for _, _, factories in self._layers:
+            if type_ in factories:
+                value = factories[type_]
+                if value is not _DELETED:
+                    return Type.Factory(value)
+                break
+
+        if self.subclasses and isinstance(type_, type):
+            value = self._resolve_subclass(type_)
+            if value is not NO_VALUE:
+                return value
 
         return default
 
+    def _resolve_subclass(
+        self, type_: type
+    ) -> Type.Instance[typing.Any] | Type.Factory[typing.Any] | NoValue:
+        cache = self._subclass_cache
+        if cache is None:
+            cache = self._subclass_cache = {}
+        elif type_ in cache:
+            return cache[type_]
+
+        value: Type.Instance[typing.Any] | Type.Factory[typing.Any] | NoValue = NO_VALUE
+
+        for view, marker in ((self.types, Type.Instance), (self.factories, Type.Factory)):
+            for key in view:
+                if isinstance(key, type) and _is_subclass(key, type_):
+                    value = marker(view[key])
+                    break
+
+            if value is not NO_VALUE:
+                break
+
+        cache[type_] = value
+        return value
+
     def merge(self, other: "Scope") -> "Scope":
         """
         Merges two scopes together and returns the result as the new Scope instance.
 
+        Storages of both scopes are shared with the result instead of being copied,
+        so merging costs the same regardless of the scope sizes.
+
         If the method detects confict of type instance and type factories -
         the type factories with conflicts are being discarded
+
+        The result resolves subclasses if any of the merged scopes does
         """
-        new_scope = Scope()
-        new_scope.values = {**self.values, **other.values}
-        new_scope.types = {**self.types, **other.types}
-        new_scope.factories = {
-            type_: factory
-            for type_, factory in chain(self.factories.items(), other.factories.items())
-            if type_ not in new_scope.types
-        }
+        new_scope = Scope.__new__(Scope)
+        new_scope._own = None
+        new_scope._layers = self._collapse((*other._share(), *self._share()))
+        if self.subclasses or other.subclasses:
+            new_scope.subclasses = True
 
         return new_scope
 
     def copy(self) -> "Scope":
         """
         Make a copy of this scope
+
+        The copy is copy-on-write: storages are shared with this scope
+        until either of them is changed, so copying costs the same regardless of the scope size.
         """
-        scope = Scope()
-        scope.values = self.values.copy()
-        scope.types = self.types.copy()
-        scope.factories = self.factories.copy()
+        scope = Scope.__new__(Scope)
+        scope._own = None
+        scope._layers = self._share()
+
+        if self.subclasses:
+            scope.subclasses = True
+
         return scope
 
     def simplify(self):
@@ -385,7 +709,7 @@ class Scope:
         Return simple representation of this scope that can be used in the Scope constructor
         """
         return (
-            self.values
+            self.values.copy()
             | {t: Type.Instance(ti) for t, ti in self.types.items()}
             | {t: Type.Factory(f) for t, f in self.factories.items()}
         )
@@ -396,16 +720,22 @@ class Scope:
         Makes the `Scope` instance from the legacy dictionary based scope
         """
         new_scope = cls()
+        if not scope:
+            return new_scope
+
+        # Storages are filled directly: this runs on every injection with the legacy scope
+        values, types, _ = new_scope._top()
 
         for key, value in scope.items():
-            new_scope.values[key] = value
+            values[key] = value
 
             value_type = type(value)
             if value_type in IGNORE_TYPES or getattr(value_type, "__module__", None) == "builtins":
                 continue
 
-            new_scope.types[value_type] = value
+            types[value_type] = value
 
+        new_scope._notify({VALUES, TYPES})
         return new_scope
 
     __or__ = merge
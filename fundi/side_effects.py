@@ -2,6 +2,7 @@ import typing
 from typing import Callable, TypeVar
 
 from fundi.scan import scan
+from fundi.registry import scan_registry
 
 C = TypeVar("C", bound=Callable[..., typing.Any])
 
@@ -28,8 +29,8 @@ def with_side_effects(*side_effects: Callable[..., typing.Any]) -> Callable[[C],
         # here will be present in next copies
         try:
             setattr(dependency, "__fundi_info__", info)
-        except (AttributeError, ValueError):
-            pass
+        except (AttributeError, TypeError, ValueError):
+            scan_registry.add(dependency, info)
 
         return dependency
 
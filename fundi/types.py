@@ -1,20 +1,28 @@
+import types
 import typing
+import functools
 import collections
 import collections.abc
 from logging import Logger
 from typing_extensions import override
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field, fields, replace
 
+from fundi import logging as fundi_logging
 from fundi.logging import get_logger
 
 if typing.TYPE_CHECKING:
     from fundi.scope import Scope
+    from fundi.plan import InjectionPlan
+    from fundi.validate import ValidatedGraph
+    from fundi.codegen import GeneratedInjector
 
 __all__ = [
     "R",
     "Parameter",
     "TypeResolver",
     "CallableInfo",
+    "GraphArtifacts",
+    "ArgumentBinder",
     "InjectionTrace",
     "ParameterResult",
     "DependencyConfiguration",
@@ -23,6 +31,52 @@ __all__ = [
 R = typing.TypeVar("R", covariant=True)
 
 
+_NORMALIZED_MAXSIZE = 4096
+
+_normalized: dict[int, tuple[typing.Any, tuple[typing.Any, ...]]] = {}
+"""Normalized annotations by their ids. Annotations are held, so their ids are not reused"""
+
+
+def _normalize_annotation(annotation: typing.Any) -> tuple[typing.Any, ...]:
+    type_options: tuple[type, ...] = (annotation,)
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is typing.Annotated:
+        annotation = args[0]
+        type_options = (annotation,)
+        origin = typing.get_origin(annotation)
+        args = typing.get_args(annotation)
+
+    if origin is types.UnionType:
+        type_options = tuple(t for t in args if t is not types.NoneType)
+    elif origin is not None:
+        type_options = (origin,)
+
+    return type_options
+
+
+def normalize_annotation(annotation: typing.Any) -> tuple[typing.Any, ...]:
+    """
+    Normalize type annotation to make it easily work with
+
+    Results are memoized by the annotation identity, so unhashable annotations are supported
+    and equal unions with different order of types are not mixed up.
+    """
+    entry = _normalized.get(id(annotation))
+    if entry is not None and entry[0] is annotation:
+        return entry[1]
+
+    type_options = _normalize_annotation(annotation)
+
+    if len(_normalized) >= _NORMALIZED_MAXSIZE:
+        _normalized.clear()
+
+    _normalized[id(annotation)] = (annotation, type_options)
+    return type_options
+
+
 @dataclass
 class TypeResolver:
     """
@@ -50,6 +104,13 @@ class Parameter:
     keyword_only: bool = False
     positional_varying: bool = False
     keyword_varying: bool = False
+    lazy: bool = False
+    """Dependency is injected on the first request of its value, see ``fundi.lazy.Lazy``"""
+    type_options: tuple[typing.Any, ...] = field(init=False, compare=False, repr=False)
+    """Normalized annotation, types to resolve parameter by. Empty if not resolved by type"""
+
+    def __post_init__(self):
+        self.type_options = normalize_annotation(self.annotation) if self.resolve_by_type else ()
 
     def copy(self, deep: bool = False, **update: typing.Any):
         if not deep:
@@ -60,6 +121,116 @@ class Parameter:
         )
 
 
+# Argument kinds of the binder layout
+POSITIONAL = 0
+VAR_POSITIONAL = 1
+KEYWORD = 2
+VAR_KEYWORD = 3
+
+BinderLayout = tuple[tuple[str, int], ...]
+BindFunction = typing.Callable[[typing.Any], tuple[tuple[typing.Any, ...], dict[str, typing.Any]]]
+
+_bind_functions: dict[BinderLayout, tuple[BindFunction, BindFunction]] = {}
+
+
+def _bind_source(function: str, layout: BinderLayout, ordered: bool) -> str:
+    positional: list[str] = []
+    keyword: list[str] = []
+
+    for index, (name, kind) in enumerate(layout):
+        value = f"values[{index if ordered else repr(name)}]"
+
+        if kind == POSITIONAL:
+            positional.append(value)
+        elif kind == VAR_POSITIONAL:
+            positional.append(f"*{value}")
+        elif kind == KEYWORD:
+            keyword.append(f"{name!r}: {value}")
+        else:
+            keyword.append(f"**{value}")
+
+    args = ", ".join(positional) + ("," if positional else "")
+    return f"def {function}(values):\n    return ({args}), {{{', '.join(keyword)}}}\n"
+
+
+def _bind_functions_for(layout: BinderLayout) -> tuple[BindFunction, BindFunction]:
+    """
+    Generate functions that build arguments for the layout.
+
+    The first one takes values by parameter names, the second - by parameter positions.
+    Functions are shared between callables with the same layout.
+    """
+    functions = _bind_functions.get(layout)
+    if functions is not None:
+        return functions
+
+    namespace: dict[str, typing.Any] = {}
+    filename = f"<fundi binder ({', '.join(name for name, _ in layout)})>"
+
+    for function, ordered in (("bind", False), ("bind_ordered", True)):
+        exec(compile(_bind_source(function, layout, ordered), filename, "exec"), namespace)
+
+    functions = namespace["bind"], namespace["bind_ordered"]
+    _bind_functions[layout] = functions
+    return functions
+
+
+class ArgumentBinder:
+    """
+    Precomputed argument layout of the callable.
+
+    Builds positional and keyword arguments of the callable from parameter values
+    in a single generated expression, without inspecting parameter kinds on every call.
+    """
+
+    __slots__: tuple[str, ...] = ("layout", "bind", "bind_ordered")
+
+    def __init__(self, parameters: collections.abc.Sequence["Parameter"]):
+        layout: list[tuple[str, int]] = []
+
+        for parameter in parameters:
+            if parameter.positional_varying:
+                kind = VAR_POSITIONAL
+            elif parameter.keyword_varying:
+                kind = VAR_KEYWORD
+            elif parameter.keyword_only:
+                kind = KEYWORD
+            else:
+                kind = POSITIONAL
+
+            layout.append((parameter.name, kind))
+
+        self.layout: BinderLayout = tuple(layout)
+
+        bind, bind_ordered = _bind_functions_for(self.layout)
+
+        self.bind: BindFunction = bind
+        """Build arguments from the mapping of parameter names to values"""
+        self.bind_ordered: BindFunction = bind_ordered
+        """Build arguments from the sequence of values in the order of parameters"""
+
+    @override
+    def __repr__(self) -> str:
+        return f"ArgumentBinder({', '.join(name for name, _ in self.layout)})"
+
+
+class GraphArtifacts:
+    """
+    Results built for the dependency graph of the dependant.
+
+    Shared by the callable information and its shallow copies that keep the graph
+    (``call``, parameters, hooks and side effects), so results built for one of them
+    are reused by every ``scan`` of the same callable.
+    """
+
+    __slots__: tuple[str, ...] = ("generated", "validated", "plans")
+
+    def __init__(self):
+        self.generated: "GeneratedInjector | None" = None
+        self.validated: "ValidatedGraph | None" = None
+        self.plans: "tuple[InjectionPlan, ...]" = ()
+
+
 @dataclass
 class CallableInfo(typing.Generic[R]):
     call: typing.Callable[..., R]
@@ -79,11 +250,41 @@ class CallableInfo(typing.Generic[R]):
     side_effects: tuple["CallableInfo[typing.Any]", ...] = ()
 
     _logger: Logger = field(default=get_logger("types.CallableInfo"), init=False, repr=False)
+    _artifacts: GraphArtifacts = field(
+        default_factory=GraphArtifacts, kw_only=True, repr=False, compare=False
+    )
+    _resolution_table: "tuple[tuple[Parameter, int, typing.Any], ...] | None" = field(
+        default=None, init=False, repr=False
+    )
 
     def __post_init__(self):
         self.named_parameters = {p.name: p for p in self.parameters}
         self.key = CacheKey(self.call)
 
+    @property
+    def _generated(self) -> "GeneratedInjector | None":
+        return self._artifacts.generated
+
+    @_generated.setter
+    def _generated(self, value: "GeneratedInjector | None") -> None:
+        self._artifacts.generated = value
+
+    @property
+    def _validated(self) -> "ValidatedGraph | None":
+        return self._artifacts.validated
+
+    @_validated.setter
+    def _validated(self, value: "ValidatedGraph | None") -> None:
+        self._artifacts.validated = value
+
+    @property
+    def _plans(self) -> "tuple[InjectionPlan, ...]":
+        return self._artifacts.plans
+
+    @_plans.setter
+    def _plans(self, value: "tuple[InjectionPlan, ...]") -> None:
+        self._artifacts.plans = value
+
     @override
     def __hash__(self) -> int:
         return hash(self.key)
@@ -98,13 +299,14 @@ class CallableInfo(typing.Generic[R]):
         kwargs: collections.abc.MutableMapping[str, typing.Any],
         partial: bool = False,
     ) -> dict[str, typing.Any]:
-        self._logger.debug(
-            "Building %svalues for %r using arguments: arguments=(%d items) keyword=(%d items)",
-            "partial " if partial else "",
-            self.call,
-            len(args),
-            len(kwargs),
-        )
+        if fundi_logging.DEBUG:
+            self._logger.debug(
+                "Building %svalues for %r using arguments: arguments=(%d items) keyword=(%d items)",
+                "partial " if partial else "",
+                self.call,
+                len(args),
+                len(kwargs),
+            )
 
         values: dict[str, typing.Any] = {}
 
@@ -115,36 +317,44 @@ class CallableInfo(typing.Generic[R]):
             name = parameter.name
 
             if parameter.keyword_varying:
-                self._logger.debug("Parameter **%s got value %r", name, kwargs)
+                if fundi_logging.DEBUG:
+                    self._logger.debug("Parameter **%s got value %r", name, kwargs)
                 values[name] = kwargs
                 continue
 
             if name in kwargs:
                 value = kwargs.pop(name)
-                self._logger.debug("Parameter %s got value %r", name, value)
+                if fundi_logging.DEBUG:
+                    self._logger.debug("Parameter %s got value %r", name, value)
                 values[name] = value
                 continue
 
             if parameter.positional_varying:
                 value = args[ix:]
-                self._logger.debug("Parameter *%s got value %r", name, value)
+                if fundi_logging.DEBUG:
+                    self._logger.debug("Parameter *%s got value %r", name, value)
                 values[name] = value
                 ix = args_amount
                 continue
 
             if ix < args_amount:
                 value = args[ix]
-                self._logger.debug("Parameter %s got value %r", name, value)
+                if fundi_logging.DEBUG:
+                    self._logger.debug("Parameter %s got value %r", name, value)
                 values[name] = value
                 ix += 1
                 continue
 
             if parameter.has_default:
-                self._logger.debug("Parameter %s got value (default) %r", name, parameter.default)
+                if fundi_logging.DEBUG:
+                    self._logger.debug(
+                        "Parameter %s got value (default) %r", name, parameter.default
+                    )
                 values[name] = parameter.default
                 continue
 
-            self._logger.debug("Parameter %s got no value", name)
+            if fundi_logging.DEBUG:
+                self._logger.debug("Parameter %s got no value", name)
 
             if not partial:
                 raise ValueError(f'Argument for parameter "{parameter.name}" not found')
@@ -161,55 +371,87 @@ class CallableInfo(typing.Generic[R]):
     ) -> collections.abc.Mapping[str, typing.Any]:
         return self._build_values(args, kwargs, partial=True)
 
+    @functools.cached_property
+    def binder(self) -> ArgumentBinder:
+        """
+        Argument binder of the callable. Built once on the first use
+        """
+        return ArgumentBinder(self.parameters)
+
     def build_arguments(
         self, values: collections.abc.Mapping[str, typing.Any]
     ) -> tuple[tuple[typing.Any, ...], dict[str, typing.Any]]:
-        self._logger.debug("Building arguments for %r using values: %r", self.call, values)
+        try:
+            return self.binder.bind(values)
+        except KeyError as exc:
+            name = exc.args[0] if exc.args else None
+            if name in self.named_parameters and name not in values:
+                raise ValueError(f'Value for "{name}" parameter not found') from None
 
-        positional: tuple[typing.Any, ...] = ()
-        keyword: dict[str, typing.Any] = {}
+            raise
 
-        for parameter in self.parameters:
-            name = parameter.name
-
-            if name not in values:
-                raise ValueError(f'Value for "{name}" parameter not found')
-
-            value = values[name]
+    def copy(self, deep: bool = False, **update: typing.Any):
+        """
+        Make a copy of the callable information with the updated fields.
+
+        Shallow copy shares parsed parameters and argument binder with this one
+        and gets an equal copy of its cache key, only fields derived from the updated ones
+        are recomputed.
+        Deep copy also copies parameters with their dependencies and gets its own cache key,
+        so it can be modified freely (e.g. by graph hooks).
+        """
+        unknown = update.keys() - _COPY_FIELDS
+        if unknown:
+            raise TypeError(f"Unable to copy CallableInfo with fields: {', '.join(unknown)}")
+
+        if fundi_logging.DEBUG:
+            self._logger.debug("Making %s copy of %r", "deep" if deep else "shallow", self.call)
+
+        if deep and "parameters" not in update:
+            update["parameters"] = [parameter.copy(deep=True) for parameter in self.parameters]
+
+        copy = object.__new__(type(self))
+        state = copy.__dict__
+        state.update(self.__dict__)
+        state.update(update)
+
+        # Results for the dependency graph of this dependant may not fit the copy with other graph
+        if "_artifacts" not in update and (deep or not self._keeps_graph(update)):
+            state["_artifacts"] = GraphArtifacts()
+
+        if "parameters" in update:
+            state["named_parameters"] = {p.name: p for p in copy.parameters}
+            state["_resolution_table"] = None
+            state.pop("binder", None)
+
+        # Copies never share the key object: adding items to the key of one does not affect others
+        if deep or "call" in update:
+            state["key"] = CacheKey(copy.call)
+        else:
+            state["key"] = self.key.copy()
+
+        return copy
+
+    def _keeps_graph(self, update: collections.abc.Mapping[str, typing.Any]) -> bool:
+        """
+        Check whether the shallow copy with the updated fields has the same dependency graph.
+        Caching of the dependant itself does not change its graph
+        """
+        state = self.__dict__
+
+        for name, value in update.items():
+            if name == "use_cache" or value is state.get(name):
+                continue
 
-            if parameter.positional_only:
-                self._logger.debug("Adding positional-only %s argument: %r", name, value)
-                positional += (value,)
-            elif parameter.positional_varying:
-                self._logger.debug("Adding *%s argument: %r", name, value)
-                positional += value
-            elif parameter.keyword_only:
-                self._logger.debug("Adding keyword-only %s argument: %r", name, value)
-                keyword[name] = value
-            elif parameter.keyword_varying:
-                self._logger.debug("Adding **%s argument: %r", name, value)
-                keyword.update(value)
-            else:
-                self._logger.debug("Adding %s argument: %r", name, value)
-                positional += (value,)
+            if name == "side_effects" and value == self.side_effects:
+                continue
 
-        self._logger.debug("Built arguments for %r: %r %r", self.call, positional, keyword)
+            return False
 
-        return positional, keyword
+        return True
 
-    def copy(self, deep: bool = False, **update: typing.Any):
-        if not deep:
-            self._logger.debug("Making shallow copy of %r", self.call)
-            return replace(self, **update)
 
-        self._logger.debug("Making deep copy of %r", self.call)
-        return replace(
-            self,
-            **{
-                "parameters": [parameter.copy(deep=True) for parameter in self.parameters],
-                **update,
-            },
-        )
+_COPY_FIELDS = frozenset(f.name for f in fields(CallableInfo) if f.init)
 
 
 class CacheKey:
@@ -223,6 +465,12 @@ class CacheKey:
         self._items.extend(items)
         self._hash = None
 
+    def copy(self) -> "CacheKey":
+        key = CacheKey.__new__(CacheKey)
+        key._hash = self._hash
+        key._items = self._items.copy()
+        return key
+
     @override
     def __hash__(self) -> int:
         if self._hash is not None:
@@ -234,7 +482,7 @@ class CacheKey:
 
     @override
     def __eq__(self, value: typing.Hashable) -> bool:
-        return self._hash == hash(value)
+        return hash(self) == hash(value)
 
     @override
     def __repr__(self) -> str:
@@ -1,5 +1,4 @@
 import os
-import types
 import typing
 import inspect
 import warnings
@@ -7,8 +6,12 @@ import contextlib
 import collections.abc
 from types import TracebackType
 
-from fundi.types import CallableInfo, InjectionTrace, DependencyConfiguration
-
+from fundi.types import (
+    CallableInfo,
+    InjectionTrace,
+    DependencyConfiguration,
+    normalize_annotation,
+)
 
 __all__ = [
     "call_sync",
@@ -63,6 +66,24 @@ def call_sync(
     :return: callable result
     """
     args, kwargs = info.build_arguments(values)
+    return call_bound_sync(stack, info, args, kwargs)
+
+
+def call_bound_sync(
+    stack: contextlib.ExitStack | contextlib.AsyncExitStack,
+    info: CallableInfo[typing.Any],
+    args: tuple[typing.Any, ...],
+    kwargs: dict[str, typing.Any],
+) -> typing.Any:
+    """
+    Synchronously call dependency callable with already built arguments.
+
+    :param stack: exit stack to properly handle generator dependencies
+    :param info: callable information
+    :param args: positional arguments
+    :param kwargs: keyword arguments
+    :return: callable result
+    """
     value = info.call(*args, **kwargs)
 
     if info.context:
@@ -136,7 +157,24 @@ async def call_async(
     :return: callable result
     """
     args, kwargs = info.build_arguments(values)
+    return await call_bound_async(stack, info, args, kwargs)
+
+
+async def call_bound_async(
+    stack: contextlib.AsyncExitStack,
+    info: CallableInfo[typing.Any],
+    args: tuple[typing.Any, ...],
+    kwargs: dict[str, typing.Any],
+) -> typing.Any:
+    """
+    Asynchronously call dependency callable with already built arguments.
 
+    :param stack: exit stack to properly handle generator dependencies
+    :param info: callable information
+    :param args: positional arguments
+    :param kwargs: keyword arguments
+    :return: callable result
+    """
     value = info.call(*args, **kwargs)
 
     if info.context:
@@ -236,29 +274,6 @@ def get_configuration(call: typing.Callable[..., typing.Any]) -> DependencyConfi
     return configuration
 
 
-def normalize_annotation(annotation: typing.Any) -> tuple[typing.Any, ...]:
-    """
-    Normalize type annotation to make it easily work with
-    """
-    type_options: tuple[type, ...] = (annotation,)
-
-    origin = typing.get_origin(annotation)
-    args = typing.get_args(annotation)
-
-    if origin is typing.Annotated:
-        annotation = args[0]
-        type_options = (annotation,)
-        origin = typing.get_origin(annotation)
-        args = typing.get_args(annotation)
-
-    if origin is types.UnionType:
-        type_options = tuple(t for t in args if t is not types.NoneType)
-    elif origin is not None:
-        type_options = (origin,)
-
-    return type_options
-
-
 Target = typing.TypeVar("Target")
 P = typing.ParamSpec("P")
 
@@ -0,0 +1,224 @@
+"""
+Ahead-of-time graph validation.
+
+``validate(info, scope)`` walks the whole dependency graph once and reports problems
+that would otherwise be found only while injecting:
+
+- cyclic dependencies (``CyclicDependencyError``)
+- parameters that cannot be resolved from the scope (``ScopeValueNotFoundError``)
+
+Use it at startup to fail fast::
+
+    validate(scan(handler), Scope({"request": request}))
+
+Validated graph remembers the types it was validated with.
+While injected with scope of the same shape, ``inject``/``ainject`` skip cycle tracking
+as the graph is known to be acyclic.
+"""
+
+import typing
+import collections.abc
+from dataclasses import dataclass, field
+
+from fundi import logging as fundi_logging
+from fundi.logging import get_logger
+from fundi.scope import NO_VALUE, Scope, Type
+from fundi.types import CallableInfo, Parameter
+from fundi.exceptions import CyclicDependencyError, ScopeValueNotFoundError
+
+__all__ = ["validate", "ValidatedGraph"]
+
+logger = get_logger("validate")
+
+# Injection contexts of the dependant
+ROOT = 0
+"""Injected dependant itself"""
+DEPENDENCY = 1
+"""Dependency of the parameter. Has access to ``__fundi_parameter__`` and ``Parameter``"""
+SIDE_EFFECT = 2
+"""Side effect of the dependant. Has access to ``__values__``, ``__dependant__``, ``__scope__``"""
+
+CONTEXT_NAMES: dict[int, frozenset[str]] = {
+    ROOT: frozenset(),
+    DEPENDENCY: frozenset({"__fundi_parameter__"}),
+    SIDE_EFFECT: frozenset({"__fundi_parameter__", "__values__", "__dependant__", "__scope__"}),
+}
+
+
+@dataclass
+class ValidatedGraph:
+    """
+    Types the graph was validated with.
+
+    Type resolution is the only thing in the scope that can add dependencies to the graph
+    (via type factories), so the graph stays acyclic while these types resolve the same way.
+    """
+
+    instances: set[typing.Any] = field(default_factory=set)
+    """Types resolved to instances"""
+    factories: dict[typing.Any, CallableInfo[typing.Any]] = field(default_factory=dict)
+    """Types resolved to factories"""
+    absent_types: set[typing.Any] = field(default_factory=set)
+    """Types looked up but not found"""
+
+    def matches(self, scope: Scope) -> bool:
+        """
+        Check whether the types of the scope resolve the same way as in the validated one
+        """
+        for type_ in self.instances:
+            if not isinstance(scope.resolve_by_type(type_), Type.Instance):
+                return False
+
+        for type_, factory in self.factories.items():
+            value = scope.resolve_by_type(type_)
+            if not isinstance(value, Type.Factory) or value.factory != factory:
+                return False
+
+        for type_ in self.absent_types:
+            if scope.resolve_by_type(type_) is not NO_VALUE:
+                return False
+
+        return True
+
+
+class _Validator:
+    def __init__(self, scope: Scope):
+        self.scope: Scope = scope
+        self.graph: ValidatedGraph = ValidatedGraph()
+        self.done: set[tuple[typing.Any, int, bool]] = set()
+        self.dynamic: bool = False
+
+    def dependencies(
+        self, info: CallableInfo[typing.Any], context: int, lenient: bool
+    ) -> collections.abc.Iterator[tuple[CallableInfo[typing.Any], int]]:
+        """
+        Check parameters of the dependant and yield its dependencies
+        """
+        names = CONTEXT_NAMES[context]
+        # Dependencies of side effects inherit their scope
+        inner = SIDE_EFFECT if context == SIDE_EFFECT else DEPENDENCY
+
+        for parameter in info.parameters:
+            if parameter.from_ is not None:
+                yield parameter.from_, inner
+                continue
+
+            if parameter.resolve_by_type:
+                resolved, factory = self.resolve_type(parameter, context)
+
+                if factory is not None:
+                    yield factory, inner
+                    continue
+
+                if resolved:
+                    continue
+
+            elif parameter.name in names or parameter.name in self.scope.values:
+                continue
+
+            if parameter.has_default or lenient:
+                continue
+
+            raise ScopeValueNotFoundError(parameter.name, info)
+
+        for side_effect in info.side_effects:
+            yield side_effect, SIDE_EFFECT
+
+    def resolve_type(
+        self, parameter: Parameter, context: int
+    ) -> tuple[bool, CallableInfo[typing.Any] | None]:
+        """
+        Resolve parameter by type, the same way ``fundi.resolve.resolve_by_type`` does.
+
+        Returns whether the parameter was resolved and type factory if it was found.
+        """
+        for type_ in parameter.type_options:
+            if context != ROOT and type_ is Parameter:
+                return True, None
+
+            match self.scope.resolve_by_type(type_):
+                case Type.Instance():
+                    self.graph.instances.add(type_)
+                    return True, None
+                case Type.Factory(factory):
+                    self.graph.factories[type_] = factory
+                    return True, factory
+                case _:
+                    self.graph.absent_types.add(type_)
+
+        return False, None
+
+    def run(self, info: CallableInfo[typing.Any]) -> None:
+        trace: list[CallableInfo[typing.Any]] = [info]
+        active: set[typing.Any] = {info.key}
+        lenient: list[bool] = [info.scopehook is not None]
+        stack = [self.dependencies(info, ROOT, lenient[-1])]
+
+        self.dynamic = info.scopehook is not None
+
+        while stack:
+            next_ = next(stack[-1], None)
+
+            if next_ is None:
+                stack.pop()
+                lenient.pop()
+                active.discard(trace.pop().key)
+                continue
+
+            dependency, context = next_
+
+            if dependency.key in active:
+                raise CyclicDependencyError(tuple(trace))
+
+            dependency_lenient = lenient[-1] or dependency.scopehook is not None
+
+            if (dependency.key, context, dependency_lenient) in self.done:
+                continue
+
+            self.done.add((dependency.key, context, dependency_lenient))
+
+            if dependency.scopehook is not None:
+                if fundi_logging.DEBUG:
+                    logger.debug(
+                        "%r has scope hook: graph cannot be fully validated", dependency.call
+                    )
+                self.dynamic = True
+
+            trace.append(dependency)
+            active.add(dependency.key)
+            lenient.append(dependency_lenient)
+            stack.append(self.dependencies(dependency, context, dependency_lenient))
+
+
+def validate(
+    info: CallableInfo[typing.Any],
+    scope: collections.abc.Mapping[str, typing.Any] | Scope | None = None,
+) -> ValidatedGraph:
+    """
+    Validate dependency graph of the dependant ahead of time.
+
+    Detects cyclic dependencies and parameters that cannot be resolved from the scope.
+    Values of dependencies with scope hooks are not required to be in the scope,
+    as scope hooks may add them.
+
+    If the graph has no scope hooks - it is remembered in the ``info``,
+    and its injections with the scope of the same shape skip cycle tracking.
+    Validate the graph again if it was modified after validation.
+
+    :param info: callable information
+    :param scope: scope the dependant will be injected with
+    :return: types the graph was validated with
+    """
+    if not isinstance(scope, Scope):
+        scope = Scope.from_legacy(scope or {})
+
+    if fundi_logging.DEBUG:
+        logger.debug("Validating %r", info.call)
+
+    validator = _Validator(scope)
+    validator.run(info)
+
+    if not validator.dynamic:
+        info._validated = validator.graph
+
+    return validator.graph
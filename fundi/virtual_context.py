@@ -14,6 +14,7 @@ from contextlib import AbstractAsyncContextManager, AbstractContextManager
 
 from .scan import scan
 from .types import CallableInfo
+from fundi import logging as fundi_logging
 from fundi.logging import get_logger
 from .exceptions import GeneratorExitedTooEarly
 
@@ -38,7 +39,8 @@ class _VirtualContextManager(typing.Generic[T], AbstractContextManager[T]):
 
     def __enter__(self) -> T:  # pyright: ignore[reportMissingSuperCall, reportImplicitOverride]
         try:
-            logger.debug("Entering %r", self.origin)
+            if fundi_logging.DEBUG:
+                logger.debug("Entering %r", self.origin)
             return self.generator.send(None)
         except StopIteration as exc:
             raise GeneratorExitedTooEarly(self.origin, self.generator) from exc
@@ -51,25 +53,29 @@ class _VirtualContextManager(typing.Generic[T], AbstractContextManager[T]):
     ) -> bool:
         try:
             if exc_type is not None:
-                logger.debug(
-                    "Raising %s in %r: %r",
-                    exc_type.__name__ if exc_type else "Unknown",
-                    self.origin,
-                    exc_value,
-                )
+                if fundi_logging.DEBUG:
+                    logger.debug(
+                        "Raising %s in %r: %r",
+                        exc_type.__name__ if exc_type else "Unknown",
+                        self.origin,
+                        exc_value,
+                    )
                 self.generator.throw(exc_type, exc_value, traceback)
             else:
-                logger.debug("Exiting %r", self.origin)
+                if fundi_logging.DEBUG:
+                    logger.debug("Exiting %r", self.origin)
                 self.generator.send(None)
         except StopIteration:
-            logger.debug("Generator %r exited cleanly", self.origin)
+            if fundi_logging.DEBUG:
+                logger.debug("Generator %r exited cleanly", self.origin)
         except Exception as exc:
             if exc is exc_value:
-                logger.debug(
-                    "Generator created by %r re-raised exception %r, suppressing traceback",
-                    self.origin,
-                    exc_type,
-                )
+                if fundi_logging.DEBUG:
+                    logger.debug(
+                        "Generator created by %r re-raised exception %r, suppressing traceback",
+                        self.origin,
+                        exc_type,
+                    )
                 return False
 
             raise exc
@@ -92,7 +98,8 @@ class _VirtualAsyncContextManager(typing.Generic[T], AbstractAsyncContextManager
 
     async def __aenter__(self) -> T:  # pyright: ignore[reportImplicitOverride]
         try:
-            logger.debug("Entering %r", self.origin)
+            if fundi_logging.DEBUG:
+                logger.debug("Entering %r", self.origin)
             return await self.generator.asend(None)
         except StopAsyncIteration as exc:
             raise GeneratorExitedTooEarly(self.origin, self.generator) from exc
@@ -107,25 +114,29 @@ class _VirtualAsyncContextManager(typing.Generic[T], AbstractAsyncContextManager
 
         try:
             if exc_type is not None:
-                logger.debug(
-                    "Raising %s in %r: %r",
-                    exc_type.__name__ if exc_type else "Unknown",
-                    self.origin,
-                    exc_value,
-                )
+                if fundi_logging.DEBUG:
+                    logger.debug(
+                        "Raising %s in %r: %r",
+                        exc_type.__name__ if exc_type else "Unknown",
+                        self.origin,
+                        exc_value,
+                    )
                 await self.generator.athrow(exc_type, exc_value, traceback)
             else:
-                logger.debug("Exiting %r", self.origin)
+                if fundi_logging.DEBUG:
+                    logger.debug("Exiting %r", self.origin)
                 await self.generator.asend(None)
         except StopAsyncIteration:
-            logger.debug("Generator %r exited cleanly", self.origin)
+            if fundi_logging.DEBUG:
+                logger.debug("Generator %r exited cleanly", self.origin)
         except Exception as exc:
             if exc is exc_value:
-                logger.debug(
-                    "Generator created by %r re-raised exception %r, suppressing traceback",
-                    self.origin,
-                    exc_type,
-                )
+                if fundi_logging.DEBUG:
+                    logger.debug(
+                        "Generator created by %r re-raised exception %r, suppressing traceback",
+                        self.origin,
+                        exc_type,
+                    )
                 return False
 
             raise exc
@@ -149,7 +160,8 @@ class VirtualContextProvider(typing.Generic[T, P]):
         self.__wrapped__: typing.Callable[P, Generator[T, None, None]] = function
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> _VirtualContextManager[T]:
-        logger.debug("Creating virtual context manager for %r", self.__wrapped__)
+        if fundi_logging.DEBUG:
+            logger.debug("Creating virtual context manager for %r", self.__wrapped__)
         return _VirtualContextManager(self.__wrapped__(*args, **kwargs), self.__wrapped__)
 
 
@@ -166,7 +178,8 @@ class AsyncVirtualContextProvider(typing.Generic[T, P]):
         self.__wrapped__: typing.Callable[P, AsyncGenerator[T]] = function
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> _VirtualAsyncContextManager[T]:
-        logger.debug("Creating virtual context manager for %r", self.__wrapped__)
+        if fundi_logging.DEBUG:
+            logger.debug("Creating virtual context manager for %r", self.__wrapped__)
         return _VirtualAsyncContextManager(self.__wrapped__(*args, **kwargs), self.__wrapped__)
 
 
@@ -0,0 +1,224 @@
+"""
+Startup warmup of dependency graphs.
+
+``warmup`` scans dependants and their whole dependency graphs ahead of time,
+and builds everything FunDI otherwise builds on the first injection.
+In pre-fork servers call it before forking, so workers share the warmed structures::
+
+    report = warmup([handlers_module], Scope({"request": request}), freeze=True)
+    if report.failures:
+        raise RuntimeError(str(report))
+"""
+
+import gc
+import time
+import typing
+import inspect
+import collections.abc
+from types import ModuleType
+from dataclasses import dataclass, field
+
+from fundi.scan import scan
+from fundi.scope import Scope
+from fundi.types import CallableInfo
+from fundi.validate import validate
+from fundi.codegen import generate
+from fundi import logging as fundi_logging
+from fundi.logging import get_logger
+from fundi.resolve import resolution_table
+from fundi.exceptions import CyclicDependencyError, ScopeValueNotFoundError
+
+__all__ = ["warmup", "WarmupReport"]
+
+logger = get_logger("warmup")
+
+Target = ModuleType | typing.Callable[..., typing.Any] | CallableInfo[typing.Any]
+
+
+@dataclass
+class WarmupReport:
+    dependants: list[CallableInfo[typing.Any]] = field(default_factory=list)
+    """Warmed up dependants. Injectors generated by warmup are shared by every ``scan`` of them"""
+    nodes: int = 0
+    """Amount of unique dependencies in the graphs of all dependants"""
+    duration: float = 0.0
+    """Time spent on warmup in seconds"""
+    failures: list[tuple[typing.Callable[..., typing.Any], Exception]] = field(default_factory=list)
+    """Callables that failed to scan, have cyclic or unresolvable dependency graph"""
+    skipped: list[tuple[typing.Callable[..., typing.Any], Exception]] = field(default_factory=list)
+    """
+    Functions found in modules that have own parameters not resolvable with the scope.
+    Such functions are usually helpers, not dependants, so they are not reported as failures
+    """
+    frozen: int = 0
+    """Amount of objects moved to the permanent generation by ``gc.freeze()``"""
+
+    def __str__(self) -> str:
+        summary = (
+            f"Warmed up {len(self.dependants)} dependants ({self.nodes} dependencies)"
+            f" in {self.duration * 1000:.1f}ms"
+        )
+        if self.skipped:
+            summary += f", skipped {len(self.skipped)} functions"
+
+        lines = [summary]
+        for call, exc in self.failures:
+            lines.append(f"  {getattr(call, '__qualname__', call)!s}: {exc}")
+
+        return "\n".join(lines)
+
+
+def _dependants(
+    targets: collections.abc.Iterable[Target],
+) -> typing.Iterator[tuple[Target, bool]]:
+    """
+    Get dependants of the targets and whether they were found in modules
+    """
+    for target in targets:
+        if not isinstance(target, ModuleType):
+            yield target, False
+            continue
+
+        # Only functions defined in the module, not imported ones
+        for value in vars(target).values():
+            if inspect.isfunction(value) and value.__module__ == target.__name__:
+                yield value, True
+
+
+def _prepare(info: CallableInfo[typing.Any]) -> None:
+    """
+    Build lazily created parts of the callable information
+    """
+    _ = info.binder
+    resolution_table(info)
+
+
+def _dependencies(info: CallableInfo[typing.Any]) -> typing.Iterator[CallableInfo[typing.Any]]:
+    for parameter in info.parameters:
+        if parameter.from_ is not None:
+            yield parameter.from_
+
+    yield from info.side_effects
+
+
+def _walk(info: CallableInfo[typing.Any], seen: set[int], keys: set[typing.Any]) -> None:
+    """
+    Prepare every dependency in the graph of the dependant. Raises ``CyclicDependencyError``
+    """
+    trace: list[CallableInfo[typing.Any]] = [info]
+    active: set[typing.Any] = {info.key}
+    stack = [_dependencies(info)]
+
+    _prepare(info)
+    keys.add(info.key)
+
+    while stack:
+        dependency = next(stack[-1], None)
+
+        if dependency is None:
+            stack.pop()
+            active.discard(trace.pop().key)
+            continue
+
+        if dependency.key in active:
+            raise CyclicDependencyError(tuple(trace))
+
+        # Dependencies reached from other paths are already checked
+        if id(dependency) in seen:
+            continue
+
+        seen.add(id(dependency))
+        _prepare(dependency)
+        keys.add(dependency.key)
+
+        trace.append(dependency)
+        active.add(dependency.key)
+        stack.append(_dependencies(dependency))
+
+
+def warmup(
+    targets: collections.abc.Iterable[Target],
+    scope: collections.abc.Mapping[str, typing.Any] | Scope | None = None,
+    precompile: bool = False,
+    freeze: bool = False,
+) -> WarmupReport:
+    """
+    Scan dependants and their whole dependency graphs ahead of time.
+
+    Modules in the ``targets`` are walked for functions defined in them.
+    Every dependency in the graphs is scanned (including lazily defined ones),
+    its argument binder and resolution table are built.
+
+    If ``scope`` is provided - graphs are validated with it
+    and unresolvable parameters are reported as failures.
+    Functions found in modules with unresolvable parameters of their own
+    are reported as ``skipped`` instead - they are usually helpers, not dependants.
+
+    :param targets: modules, dependants or their callable information
+    :param scope: scope the dependants will be injected with
+    :param precompile: generate sync and async injectors for the ``scope`` shape,
+        requires ``scope``
+    :param freeze: move all objects to the permanent generation with ``gc.freeze()``
+        after warmup, so processes forked afterwards share them copy-on-write
+    :return: warmup report
+    """
+    if precompile and scope is None:
+        raise ValueError("Scope is required to precompile injectors")
+
+    if scope is not None and not isinstance(scope, Scope):
+        scope = Scope.from_legacy(scope)
+
+    report = WarmupReport()
+    seen: set[int] = set()
+    keys: set[typing.Any] = set()
+
+    start = time.perf_counter()
+
+    for target, found in _dependants(targets):
+        call = target.call if isinstance(target, CallableInfo) else target
+
+        if fundi_logging.DEBUG:
+            logger.debug("Warming up %r", call)
+
+        try:
+            if isinstance(target, CallableInfo):
+                info = target
+            else:
+                info = scan(target)
+                # Scanned copies share binder and resolution table of the cached one
+                cached = getattr(target, "__fundi_info__", None)
+                if isinstance(cached, CallableInfo):
+                    _prepare(cached)
+
+            _walk(info, seen, keys)
+
+            if scope is not None:
+                validate(info, scope)
+
+            if precompile:
+                # Code of the injector is generated now, not on the first request of each worker
+                generate(info, scope).build()
+
+        except ScopeValueNotFoundError as exc:
+            # Not every function of the module is a dependant
+            if found and exc.info.call is call:
+                report.skipped.append((call, exc))
+            else:
+                report.failures.append((call, exc))
+            continue
+
+        except (ValueError, TypeError) as exc:
+            report.failures.append((call, exc))
+            continue
+
+        report.dependants.append(info)
+
+    report.nodes = len(keys)
+    report.duration = time.perf_counter() - start
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+        report.frozen = gc.get_freeze_count()
+
+    return report
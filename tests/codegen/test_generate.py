@@ -0,0 +1,221 @@
+import pytest
+
+from fundi.hooks import with_hooks
+from fundi.exceptions import CyclicDependencyError
+from fundi import Type, Scope, scan, from_, generate, FromType, Parameter, injection_trace
+
+
+def test_generate_inject():
+    def dep(arg: int) -> int:
+        return arg * 2
+
+    def func(arg: int, /, arg1: str, *, arg2: int = from_(dep)) -> str:
+        return f"{arg1}:{arg2}"
+
+    injector = generate(scan(func), {"arg": 0, "arg1": ""})
+
+    assert injector.inject({"arg": 1, "arg1": "value"}) == "value:2"
+    assert "name_('arg1')" in injector.source()
+
+
+async def test_generate_ainject():
+    async def dep(arg: int) -> int:
+        return arg * 2
+
+    async def func(value: int = from_(dep)) -> int:
+        return value
+
+    injector = generate(scan(func), {"arg": 0})
+
+    assert await injector.ainject({"arg": 1}) == 2
+
+
+def test_generate_cached_on_info():
+    def func(arg: int):
+        return arg
+
+    info = scan(func)
+
+    injector = generate(info, {"arg": 0})
+
+    assert generate(info, {"arg": 1}) is injector
+    assert generate(info, {}) is not injector
+
+
+def test_generate_varying():
+    def func(*args: int, **kwargs: int):
+        return args, kwargs
+
+    injector = generate(scan(func), {"args": (), "kwargs": {}})
+
+    assert injector.inject({"args": (1, 2), "kwargs": {"a": 3}}) == ((1, 2), {"a": 3})
+
+
+def test_generate_caching():
+    calls = 0
+
+    def dep() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    def func(a: int = from_(dep), b: int = from_(dep), c: int = from_(dep, caching=False)):
+        return a, b, c
+
+    injector = generate(scan(func))
+
+    assert injector.inject({}) == (1, 1, 2)
+
+    cache = {}
+    assert injector.inject({}, cache=cache) == (3, 3, 4)
+    assert injector.inject({}, cache=cache) == (3, 3, 5)
+
+
+def test_generate_override():
+    def dep() -> str:
+        return "dep"
+
+    def replacement() -> str:
+        return "replacement"
+
+    def func(value: str = from_(dep)):
+        return value
+
+    injector = generate(scan(func))
+
+    assert injector.inject({}, override={dep: "value"}) == "value"
+    assert injector.inject({}, override={dep: scan(replacement)}) == "replacement"
+
+
+async def test_generate_override_cycle():
+    def dep() -> str:
+        return "dep"
+
+    def func(value: str = from_(dep)):
+        return value
+
+    injector = generate(scan(func))
+    # Overridden dependency is injected with the same generated injector
+    override = {dep: scan(func)}
+
+    with pytest.raises(CyclicDependencyError):
+        injector.inject({}, override=override)
+
+    with pytest.raises(CyclicDependencyError):
+        await injector.ainject({}, override=override)
+
+
+def test_generate_lifespan():
+    states = []
+
+    def dep():
+        states.append("start")
+        yield "value"
+        states.append("end")
+
+    class Context:
+        def __enter__(self):
+            states.append("enter")
+            return "context"
+
+        def __exit__(self, *args):
+            states.append("exit")
+
+    def func(value: str = from_(dep), context: str = from_(Context)):
+        return value, context
+
+    assert generate(scan(func)).inject({}) == ("value", "context")
+    assert states == ["start", "enter", "exit", "end"]
+
+
+async def test_generate_async_lifespan():
+    states = []
+
+    async def dep():
+        states.append("start")
+        yield "value"
+        states.append("end")
+
+    def func(value: str = from_(dep)):
+        return value
+
+    assert await generate(scan(func)).ainject({}) == "value"
+    assert states == ["start", "end"]
+
+
+def test_generate_by_type():
+    class Session:
+        pass
+
+    class User:
+        pass
+
+    session = Session()
+
+    def func(session: FromType[Session], user: FromType[User], param=from_(lambda param: param)):
+        return session, user
+
+    scope = Scope(
+        {
+            "param": None,
+            Session: Type.instance(session),
+            User: Type.factory(lambda: User()),
+        }
+    )
+
+    result_session, user = generate(scan(func), scope).inject(scope)
+    assert result_session is session
+    assert isinstance(user, User)
+
+
+def test_generate_parameter_awareness():
+    def dep(param: FromType[Parameter]):
+        return param.name
+
+    def func(arg: str = from_(dep)):
+        return arg
+
+    assert generate(scan(func)).inject({}) == "arg"
+
+
+def test_generate_scope_hook():
+    @with_hooks(scope=lambda scope, _: scope.update(value="Hook value"))
+    def dep(value: str):
+        return value
+
+    def func(value: str = from_(dep)):
+        return value
+
+    assert generate(scan(func)).inject({}) == "Hook value"
+
+
+def test_generate_injection_trace():
+    def dep(arg: str):
+        raise RuntimeError()
+
+    def application(app_name: str, value=from_(dep)): ...
+
+    injector = generate(scan(application), {"arg": "", "app_name": ""})
+
+    with pytest.raises(RuntimeError) as exc_info:
+        injector.inject({"arg": "string", "app_name": "Kuyu's App"})
+
+    trace = injection_trace(exc_info.value)
+
+    assert trace.info.call is application
+    assert trace.values == {"app_name": "Kuyu's App"}
+
+    assert trace.origin is not None
+    assert trace.origin.info.call is dep
+    assert trace.origin.values == {"arg": "string"}
+
+
+def test_generate_async_in_sync():
+    async def dep():
+        pass
+
+    def func(value: None = from_(dep)):
+        pass
+
+    with pytest.raises(RuntimeError):
+        generate(scan(func)).inject({})
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+from fundi import scan, from_, ainject, batched
+
+
+async def test_batched_concurrent_injections():
+    calls: list[list[int]] = []
+
+    @batched(window_ms=1)
+    async def load(user_id: list[int]) -> list[str]:
+        calls.append(user_id)
+        return [f"user:{id_}" for id_ in user_id]
+
+    def application(user: str = from_(load)) -> str:
+        return user
+
+    info = scan(application)
+    assert info.parameters[0].from_ is not None
+    assert info.parameters[0].from_.parameters[0].annotation is int
+
+    results = await asyncio.gather(*(ainject({"user_id": i}, info) for i in range(5)))
+
+    assert results == [f"user:{i}" for i in range(5)]
+    assert calls == [[0, 1, 2, 3, 4]]
+
+
+async def test_batched_gather_parameters():
+    calls: list[list[int]] = []
+
+    @batched(window_ms=0)
+    async def load(key: list[int]) -> list[int]:
+        calls.append(key)
+        return [key * 10 for key in key]
+
+    async def a(value: int = from_(load, caching=False)) -> int:
+        return value
+
+    async def b(value: int = from_(load, caching=False)) -> int:
+        return value + 1
+
+    def application(x: int = from_(a), y: int = from_(b)) -> tuple[int, int]:
+        return x, y
+
+    assert await ainject({"key": 3}, scan(application), concurrency="gather") == (30, 31)
+    assert calls == [[3, 3]]
+
+
+async def test_batched_max_batch():
+    calls: list[list[int]] = []
+
+    @batched(max_batch=2, window_ms=1000)
+    def load(key: list[int]) -> list[int]:
+        calls.append(key)
+        return key
+
+    results = await asyncio.wait_for(asyncio.gather(*(load(i) for i in range(4))), 1)
+
+    assert results == [0, 1, 2, 3]
+    assert calls == [[0, 1], [2, 3]]
+
+
+async def test_batched_groups_by_arguments():
+    calls: list[tuple[list[int], str]] = []
+
+    @batched(window_ms=1)
+    async def load(key: list[int], prefix: str) -> list[str]:
+        calls.append((key, prefix))
+        return [f"{prefix}{key}" for key in key]
+
+    results = await asyncio.gather(load(1, "a"), load(2, "b"), load(3, "a"))
+
+    assert results == ["a1", "b2", "a3"]
+    assert sorted(calls) == [([1, 3], "a"), ([2], "b")]
+
+
+async def test_batched_error():
+    @batched(window_ms=1)
+    async def wrong_length(key: list[int]) -> list[int]:
+        return key[:1]
+
+    @batched(window_ms=1)
+    async def failing(key: list[int]) -> list[int]:
+        raise RuntimeError("database is down")
+
+    results = await asyncio.gather(wrong_length(1), wrong_length(2), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+    with pytest.raises(RuntimeError, match="database is down"):
+        await asyncio.gather(failing(1), failing(2))
+
+    with pytest.raises(TypeError):
+
+        @batched()
+        def no_keys() -> list[int]:
+            return []
+
+
+async def test_batched_keyed():
+    calls: list[list[int]] = []
+
+    @batched(window_ms=1)
+    async def load(user_id: list[int]) -> list[str]:
+        calls.append(user_id)
+        return [f"user:{id_}" for id_ in user_id]
+
+    def require_editor_id() -> int:
+        return 2
+
+    assert load.keyed("author_id") is load.keyed("author_id")
+    assert load.keyed(None) is load
+
+    async def post(
+        author: str = from_(load.keyed("author_id")),
+        editor: str = from_(load.keyed(require_editor_id)),
+        reader: str = from_(load),
+    ) -> tuple[str, str, str]:
+        return author, editor, reader
+
+    result = await ainject({"author_id": 1, "user_id": 3}, scan(post), concurrency="gather")
+
+    assert result == ("user:1", "user:2", "user:3")
+    assert [sorted(keys) for keys in calls] == [[1, 2, 3]]
+
+
+async def test_batched_cancelled():
+    started = asyncio.Event()
+
+    @batched(window_ms=0)
+    async def load(key: list[int]) -> list[int]:
+        started.set()
+        await asyncio.sleep(10)
+        return key
+
+    requests = [asyncio.ensure_future(load(i)) for i in range(2)]
+    await started.wait()
+
+    loader = getattr(load, "__fundi_loader__")
+    for task in loader._running:
+        task.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*requests, return_exceptions=True), 1)
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from fundi.side_effects import with_side_effects
+from fundi import from_, scan, ainject, injection_trace, AsyncInjectionContext
+
+
+async def test_gather_concurrent():
+    running = 0
+    max_running = 0
+
+    async def fetch() -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return 1
+
+    async def row() -> int:
+        return await fetch()
+
+    async def http() -> int:
+        return await fetch()
+
+    def application(a: int = from_(row), b: int = from_(http), c: int = 2) -> int:
+        return a + b + c
+
+    assert await ainject({}, scan(application), concurrency="gather") == 4
+    assert max_running == 2
+
+
+async def test_gather_cache():
+    calls = 0
+
+    async def dep() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return calls
+
+    async def middle(value: int = from_(dep)) -> int:
+        return value
+
+    def application(a: int = from_(dep), b: int = from_(middle), c: int = from_(dep)):
+        return a, b, c
+
+    cache = {}
+    assert await ainject({}, scan(application), cache=cache, concurrency="gather") == (1, 1, 1)
+    assert calls == 1
+    assert list(cache.values()) == [1, 1]
+
+
+async def test_gather_teardown_order():
+    states = []
+
+    def make(name: str):
+        async def dep():
+            await asyncio.sleep(0.01 if name == "a" else 0)
+            states.append(f"enter {name}")
+            yield name
+            states.append(f"exit {name}")
+
+        return dep
+
+    def application(a: str = from_(make("a")), b: str = from_(make("b"))):
+        return a + b
+
+    assert await ainject({}, scan(application), concurrency="gather") == "ab"
+    assert states == ["enter b", "enter a", "exit b", "exit a"]
+
+
+async def test_gather_injection_trace():
+    cancelled = False
+
+    async def slow():
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    async def dep(arg: str):
+        raise RuntimeError()
+
+    def application(app_name: str, value=from_(dep), other=from_(slow)): ...
+
+    with pytest.raises(RuntimeError) as exc_info:
+        await ainject(
+            {"arg": "string", "app_name": "Kuyu's App"}, scan(application), concurrency="gather"
+        )
+
+    assert cancelled
+
+    trace = injection_trace(exc_info.value)
+
+    assert trace.info.call is application
+    assert trace.values == {"app_name": "Kuyu's App"}
+
+    assert trace.origin is not None
+    assert trace.origin.info.call is dep
+    assert trace.origin.values == {"arg": "string"}
+
+
+async def test_gather_side_effects():
+    effects = []
+
+    def effect(__values__: dict):
+        effects.append(__values__)
+
+    async def dep() -> int:
+        return 1
+
+    @with_side_effects(effect)
+    def application(value: int = from_(dep)):
+        return value
+
+    assert await ainject({}, scan(application), concurrency="gather") == 1
+    assert effects == [{"value": 1}]
+
+
+async def test_gather_injection_context():
+    async def dep() -> int:
+        await asyncio.sleep(0)
+        return 1
+
+    def application(a: int = from_(dep), b: int = from_(dep)):
+        return a, b
+
+    async with AsyncInjectionContext(concurrency="gather") as ctx:
+        assert await ctx.inject(scan(application)) == (1, 1)
+        assert ctx.copy().concurrency == "gather"
@@ -1,3 +1,4 @@
+import sys
 from types import TracebackType
 from contextlib import ExitStack, AsyncExitStack
 
@@ -411,3 +412,25 @@ def test_inject_mixed_side_effects():
         inject({}, scan(func, side_effects=(lambda: side_effect(),)), stack)
 
     assert side_effect_injections == 2
+
+
+def _deep_chain(depth: int):
+    def call():
+        return 0
+
+    for _ in range(depth):
+
+        def call(value: int = from_(call)):
+            return value + 1
+
+    return scan(call)
+
+
+def test_inject_deep_graph():
+    depth = sys.getrecursionlimit()
+    assert inject({}, _deep_chain(depth)) == depth
+
+
+async def test_ainject_deep_graph():
+    depth = sys.getrecursionlimit()
+    assert await ainject({}, _deep_chain(depth)) == depth
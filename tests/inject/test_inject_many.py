@@ -0,0 +1,225 @@
+import asyncio
+import itertools
+import contextlib
+
+import pytest
+
+from fundi import Type, Scope, scan, from_, FromType, inject_many, ainject_many
+
+
+def test_inject_many_shared():
+    events: list[str] = []
+
+    def connection(dsn: str):
+        events.append("open")
+        yield f"connection:{dsn}"
+        events.append("close")
+
+    def record_value(record: int, connection: str = from_(connection)) -> str:
+        return f"{connection}:{record}"
+
+    def application(value: str = from_(record_value)) -> str:
+        events.append(value)
+        return value
+
+    results = inject_many(
+        [{"record": record} for record in range(3)], scan(application), shared={"dsn": "db"}
+    )
+
+    assert list(results) == ["connection:db:0", "connection:db:1", "connection:db:2"]
+    assert events == [
+        "open",
+        "connection:db:0",
+        "connection:db:1",
+        "connection:db:2",
+        "close",
+    ]
+
+
+def test_inject_many_per_scope_lifespan():
+    events: list[str] = []
+
+    def resource(record: int):
+        events.append(f"open:{record}")
+        yield record
+        events.append(f"close:{record}")
+
+    def application(value: int = from_(resource)) -> int:
+        return value
+
+    assert list(inject_many([{"record": 1}, {"record": 2}], scan(application))) == [1, 2]
+    assert events == ["open:1", "close:1", "open:2", "close:2"]
+
+
+def test_inject_many_unbounded():
+    taken: list[int] = []
+
+    def source():
+        for record in itertools.count():
+            taken.append(record)
+            yield {"record": record}
+
+    results = inject_many(source(), scan(lambda record: record * 2))
+
+    assert next(results) == 0
+    assert next(results) == 2
+    assert taken == [0, 1]
+
+    results.close()
+
+
+def test_inject_many_shadowed():
+    calls: list[str] = []
+
+    def settings(name: str) -> str:
+        calls.append(name)
+        return name
+
+    def application(record: int, settings: str = from_(settings)) -> str:
+        return f"{settings}:{record}"
+
+    scopes = [{"record": 1}, {"record": 2, "name": "other"}, {"record": 3}]
+
+    assert list(inject_many(scopes, scan(application), shared={"name": "main"})) == [
+        "main:1",
+        "other:2",
+        "main:3",
+    ]
+    assert calls == ["main", "other"]
+
+
+def test_inject_many_not_shared():
+    calls: list[str] = []
+
+    def uncached() -> int:
+        calls.append("uncached")
+        return 0
+
+    def by_type(value: FromType[int]) -> int:
+        calls.append("by_type")
+        return value
+
+    def application(
+        a: int = from_(uncached, caching=False),
+        b: int = from_(by_type),
+    ) -> int:
+        return a + b
+
+    scopes = [Scope({int: Type.instance(1)}), Scope({int: Type.instance(2)})]
+
+    assert list(inject_many(scopes, scan(application))) == [1, 2]
+    assert calls == ["uncached", "by_type", "uncached", "by_type"]
+
+
+def test_inject_many_override():
+    def dependency() -> int:
+        return 1
+
+    def application(value: int = from_(dependency)) -> int:
+        return value
+
+    results = inject_many([{}, {}], scan(application), override={dependency: 2})
+
+    assert list(results) == [2, 2]
+
+
+async def test_ainject_many():
+    calls: list[str] = []
+    # Each record completes only after the next one is received
+    received = [asyncio.Event() for _ in range(4)]
+
+    async def settings() -> str:
+        calls.append("settings")
+        return "settings"
+
+    async def record_value(record: int, settings: str = from_(settings)) -> int:
+        await received[record + 1].wait()
+        return record
+
+    info = scan(record_value)
+    scopes = [{"record": record} for record in range(3)]
+
+    received[3].set()
+
+    results: list[int] = []
+    async for value in ainject_many(scopes, info, limit=3, ordered=False):
+        results.append(value)
+        received[value].set()
+
+    assert results == [2, 1, 0]
+    assert calls == ["settings"]
+
+    assert [value async for value in ainject_many(scopes, info, limit=3)] == [0, 1, 2]
+    assert calls == ["settings", "settings"]
+
+
+async def test_ainject_many_limit():
+    running = 0
+    max_running = 0
+
+    async def application(record: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return record
+
+    scopes = [{"record": record} for record in range(6)]
+    results = [value async for value in ainject_many(scopes, scan(application), limit=2)]
+
+    assert results == list(range(6))
+    assert max_running == 2
+
+
+async def test_ainject_many_error():
+    cancelled: list[int] = []
+
+    async def application(record: int) -> int:
+        if record == 0:
+            raise ValueError("record")
+
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(record)
+            raise
+
+        return record
+
+    scopes = [{"record": record} for record in range(3)]
+
+    with pytest.raises(ValueError, match="record"):
+        async for _ in ainject_many(scopes, scan(application), limit=3, ordered=False):
+            pass
+
+    assert cancelled == [1, 2]
+
+    with pytest.raises(ValueError, match="limit"):
+        async for _ in ainject_many(scopes, scan(application), limit=0):
+            pass
+
+
+async def test_ainject_many_backpressure():
+    taken: list[int] = []
+
+    async def source():
+        for record in itertools.count():
+            taken.append(record)
+            yield {"record": record}
+
+    async def application(record: int) -> int:
+        await asyncio.sleep(0)
+        return record
+
+    results: list[int] = []
+    async with contextlib.aclosing(ainject_many(source(), scan(application), limit=3)) as values:
+        async for value in values:
+            results.append(value)
+            # Source is not consumed ahead of the consumer by more than the limit
+            assert len(taken) <= len(results) + 3
+
+            if len(results) == 5:
+                break
+
+    assert results == [0, 1, 2, 3, 4]
@@ -0,0 +1,92 @@
+import asyncio
+import importlib
+
+import pytest
+
+from fundi import Lazy, scan, from_, inject, ainject, generate
+
+inject_module = importlib.import_module("fundi.inject")
+
+PATHS = ["plan", "generated", "generic"]
+
+
+def select(path: str, info, monkeypatch: pytest.MonkeyPatch):
+    if path == "generated":
+        generate(info)
+    elif path == "generic":
+        monkeypatch.setattr(inject_module, "MAX_SPECIALIZED_PLANS", 0)
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_lazy(path: str, monkeypatch: pytest.MonkeyPatch):
+    events: list[str] = []
+
+    def connection(dsn: str):
+        events.append("open")
+        yield f"connection:{dsn}"
+        events.append("close")
+
+    def settings(db: str = from_(connection)) -> str:
+        return f"settings:{db}"
+
+    def application(
+        use: bool, db: Lazy[str] = from_(connection), settings: Lazy[str] = from_(settings)
+    ) -> str | None:
+        events.append("call")
+        if not use:
+            return None
+
+        assert db.get() is db.get()
+        return settings.get()
+
+    info = scan(application)
+    select(path, info, monkeypatch)
+
+    assert inject({"use": False, "dsn": "db"}, info) is None
+    assert events == ["call"]
+
+    events.clear()
+    assert inject({"use": True, "dsn": "db"}, info) == "settings:connection:db"
+    # Connection is shared through the cache and closed with the injection exit stack
+    assert events == ["call", "open", "close"]
+
+
+@pytest.mark.parametrize("path", [*PATHS, "gather"])
+async def test_lazy_async(path: str, monkeypatch: pytest.MonkeyPatch):
+    calls = 0
+
+    async def user(user_id: int) -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return f"user:{user_id}"
+
+    async def application(user: Lazy[str] = from_(user)) -> list[str]:
+        return await asyncio.gather(user.aget(), user)
+
+    info = scan(application)
+    if path != "gather":
+        select(path, info, monkeypatch)
+
+    concurrency = "gather" if path == "gather" else "sequential"
+    assert await ainject({"user_id": 1}, info, concurrency=concurrency) == ["user:1", "user:1"]
+    assert calls == 1
+
+
+def test_lazy_override():
+    def real() -> str:
+        raise AssertionError("Overridden dependency should not be called")
+
+    def application(value: Lazy[str] = from_(real)) -> str:
+        return value.get()
+
+    assert inject({}, scan(application), override={real: "fake"}) == "fake"
+    assert inject({}, scan(application), override={real: scan(lambda: "factory")}) == "factory"
+
+
+def test_lazy_without_dependency():
+    def application(value: Lazy[int]) -> int:
+        return value.get()
+
+    with pytest.raises(ValueError):
+        scan(application)
@@ -0,0 +1,110 @@
+import asyncio
+import importlib
+
+import pytest
+
+from fundi import scan, from_, ainject, generate, AsyncInjectionContext
+
+inject_module = importlib.import_module("fundi.inject")
+
+
+def make_graph():
+    calls: list[str] = []
+
+    async def token() -> str:
+        calls.append("token")
+        await asyncio.sleep(0.01)
+        return "token"
+
+    async def user(token: str = from_(token)) -> str:
+        return f"user:{token}"
+
+    def application(user: str = from_(user)) -> str:
+        return user
+
+    return calls, scan(application)
+
+
+@pytest.mark.parametrize("path", ["plan", "generated", "generic"])
+async def test_single_flight(path: str, monkeypatch: pytest.MonkeyPatch):
+    calls, info = make_graph()
+
+    if path == "generated":
+        generate(info)
+    elif path == "generic":
+        monkeypatch.setattr(inject_module, "MAX_SPECIALIZED_PLANS", 0)
+
+    cache = {}
+    results = await asyncio.gather(*(ainject({}, info, cache=cache) for _ in range(3)))
+
+    assert results == ["user:token"] * 3
+    assert calls == ["token"]
+    assert sorted(cache.values()) == ["token", "user:token"]
+
+
+async def test_single_flight_context():
+    calls, info = make_graph()
+
+    async with AsyncInjectionContext() as context:
+        results = await asyncio.gather(*(context.inject(info) for _ in range(3)))
+
+    assert results == ["user:token"] * 3
+    assert calls == ["token"]
+
+
+async def test_single_flight_error():
+    calls: list[str] = []
+
+    async def token() -> str:
+        calls.append("token")
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise ValueError("token")
+
+        return "token"
+
+    def application(token: str = from_(token)) -> str:
+        return token
+
+    info = scan(application)
+    cache = {}
+
+    results = await asyncio.gather(
+        *(ainject({}, info, cache=cache) for _ in range(3)), return_exceptions=True
+    )
+
+    assert calls == ["token"]
+    assert all(isinstance(result, ValueError) for result in results)
+    # Errors are not cached
+    assert cache == {}
+
+    assert await ainject({}, info, cache=cache) == "token"
+    assert calls == ["token", "token"]
+
+
+@pytest.mark.parametrize("concurrency", ["sequential", "gather"])
+async def test_single_flight_cancelled(concurrency: str):
+    calls: list[str] = []
+
+    async def token() -> str:
+        calls.append("token")
+        await asyncio.sleep(0.01)
+        return "token"
+
+    def application(token: str = from_(token)) -> str:
+        return token
+
+    info = scan(application)
+    cache = {}
+
+    owner = asyncio.ensure_future(ainject({}, info, cache=cache))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(ainject({}, info, cache=cache, concurrency=concurrency))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+
+    # Waiter injects the dependency itself
+    assert await waiter == "token"
+    assert calls == ["token", "token"]
+    assert owner.cancelled()
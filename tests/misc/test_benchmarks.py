@@ -0,0 +1,30 @@
+import asyncio
+
+from benchmarks.__main__ import main
+from benchmarks.runner import BENCHMARKS, load
+
+
+def test_benchmarks_run():
+    for bench in BENCHMARKS:
+        for _, function in bench.cases():
+            if asyncio.iscoroutinefunction(function):
+                asyncio.run(function())
+            else:
+                function()
+
+
+def test_benchmarks_results(tmp_path):
+    output = tmp_path / "results.json"
+    main(["--filter", "scope.merge", "--repeat", "2", "--min-time", "0", "--output", str(output)])
+    # Comparison with previous results
+    main(["--filter", "scope.merge", "--repeat", "1", "--min-time", "0", "--compare", str(output)])
+
+    results = load(output)
+
+    assert results["environment"]["python"]
+    assert set(results["results"]) == {
+        "scope.merge[size=10]",
+        "scope.merge[size=100]",
+        "scope.merge[size=1000]",
+    }
+    assert all(result["repeat"] == 2 for result in results["results"].values())
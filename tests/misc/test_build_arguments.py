@@ -1,3 +1,5 @@
+import pytest
+
 from fundi import scan
 
 
@@ -54,3 +56,39 @@ def test_varkw():
 
     assert args == ()
     assert kwargs == {"arg": 1, "arg2": "1"}
+
+
+def test_mixed():
+    def dep(a: int, /, b: int, *args: int, c: int, **kwargs: int): ...
+
+    info = scan(dep)
+
+    args, kwargs = info.build_arguments(
+        {"a": 1, "b": 2, "args": (3, 4), "c": 5, "kwargs": {"d": 6}}
+    )
+
+    assert args == (1, 2, 3, 4)
+    assert kwargs == {"c": 5, "d": 6}
+
+
+def test_missing_value():
+    def dep(arg: int, arg2: str): ...
+
+    info = scan(dep)
+
+    with pytest.raises(ValueError, match='"arg2"'):
+        info.build_arguments({"arg": 1})
+
+
+def test_binder():
+    def dep(arg: int, *, arg2: str): ...
+
+    def other(arg: int, *, arg2: str): ...
+
+    info = scan(dep)
+
+    assert info.binder is info.binder
+    assert info.binder.bind_ordered([1, "1"]) == ((1,), {"arg2": "1"})
+
+    # Callables with the same signature share generated functions
+    assert scan(other).binder.bind_ordered is info.binder.bind_ordered
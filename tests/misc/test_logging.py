@@ -0,0 +1,42 @@
+import logging
+
+import pytest
+
+from fundi import scan, from_, inject, set_debug
+from fundi import logging as fundi_logging
+
+
+@pytest.fixture
+def debug():
+    enabled = fundi_logging.DEBUG
+    yield
+    set_debug(enabled)
+
+
+def dep() -> int:
+    return 1
+
+
+def func(value: int = from_(dep)) -> int:
+    return value
+
+
+def test_debug_disabled(debug, caplog: pytest.LogCaptureFixture):
+    set_debug(False)
+
+    with caplog.at_level(logging.DEBUG, logger="fundi"):
+        assert inject({}, scan(func)) == 1
+
+    assert not caplog.records
+
+
+def test_debug_enabled(debug, caplog: pytest.LogCaptureFixture):
+    set_debug(True)
+
+    with caplog.at_level(logging.DEBUG, logger="fundi"):
+        assert inject({}, scan(func)) == 1
+
+    assert {record.name for record in caplog.records} >= {
+        "fundi.inject.injection",
+        "fundi.inject.collection",
+    }
@@ -0,0 +1,252 @@
+import pytest
+
+from fundi.hooks import with_hooks
+from fundi.exceptions import CyclicDependencyError, ScopeValueNotFoundError
+from fundi import (
+    Type,
+    Scope,
+    scan,
+    from_,
+    compile,
+    FromType,
+    Parameter,
+    InjectionPlan,
+    injection_trace,
+)
+
+
+def test_compile_inject():
+    def dep(arg: int) -> int:
+        return arg * 2
+
+    def func(arg: int, arg1: str, arg2: int = from_(dep)) -> str:
+        return f"{arg1}:{arg2}"
+
+    plan = compile(scan(func), {"arg": 0, "arg1": ""})
+
+    assert isinstance(plan, InjectionPlan)
+    assert plan.inject({"arg": 1, "arg1": "value"}) == "value:2"
+    assert plan.inject({"arg": 2, "arg1": "other"}) == "other:4"
+
+
+async def test_compile_ainject():
+    async def dep(arg: int) -> int:
+        return arg * 2
+
+    def func(arg2: int = from_(dep)) -> int:
+        return arg2
+
+    plan = compile(scan(func), {"arg": 0})
+
+    assert await plan.ainject({"arg": 1}) == 2
+
+
+def test_compile_order():
+    calls = []
+
+    def dep_a():
+        calls.append("a")
+
+    def dep_b(a: None = from_(dep_a)):
+        calls.append("b")
+
+    def dep_c():
+        calls.append("c")
+
+    def func(b: None = from_(dep_b), c: None = from_(dep_c)):
+        calls.append("func")
+
+    compile(scan(func)).inject({})
+
+    assert calls == ["a", "b", "c", "func"]
+
+
+def test_compile_caching():
+    calls = 0
+
+    def dep() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    def middle(value: int = from_(dep)) -> int:
+        return value
+
+    def func(a: int = from_(dep), b: int = from_(middle), c: int = from_(dep, caching=False)):
+        return a, b, c
+
+    plan = compile(scan(func))
+
+    assert plan.inject({}) == (1, 1, 2)
+
+    cache = {}
+    assert plan.inject({}, cache=cache) == (3, 3, 4)
+    assert plan.inject({}, cache=cache) == (3, 3, 5)
+
+
+def test_compile_cache_skips_subgraph():
+    calls = []
+
+    def inner():
+        calls.append("inner")
+
+    def dep(value: None = from_(inner)) -> str:
+        calls.append("dep")
+        return "dep"
+
+    def func(value: str = from_(dep)):
+        return value
+
+    info = scan(func)
+    plan = compile(info)
+
+    cache = {}
+    plan.inject({}, cache=cache)
+    plan.inject({}, cache=cache)
+
+    assert calls == ["inner", "dep"]
+
+
+def test_compile_override():
+    def dep() -> str:
+        return "dep"
+
+    def replacement() -> str:
+        return "replacement"
+
+    def func(value: str = from_(dep)):
+        return value
+
+    plan = compile(scan(func))
+
+    assert plan.inject({}, override={dep: "value"}) == "value"
+    assert plan.inject({}, override={dep: scan(replacement)}) == "replacement"
+
+
+def test_compile_by_type():
+    class Session:
+        pass
+
+    class User:
+        pass
+
+    session = Session()
+
+    def require_user(session: FromType[Session]) -> User:
+        assert isinstance(session, Session)
+        return User()
+
+    def func(session: FromType[Session], user: FromType[User]):
+        return session, user
+
+    scope = Scope({Session: Type.instance(session), User: Type.factory(require_user)})
+    plan = compile(scan(func), scope)
+
+    result_session, user = plan.inject(scope)
+    assert result_session is session
+    assert isinstance(user, User)
+
+
+def test_compile_parameter_awareness():
+    def dep(param: FromType[Parameter], name: str = from_(lambda __fundi_parameter__: "")):
+        return param.name
+
+    def func(arg: str = from_(dep)):
+        return arg
+
+    assert compile(scan(func)).inject({}) == "arg"
+
+
+def test_compile_default():
+    def func(arg: int = 10):
+        return arg
+
+    plan = compile(scan(func))
+
+    assert plan.inject({}) == 10
+    # Scope shape changed - plan falls back to generic injection
+    assert plan.inject({"arg": 1}) == 1
+
+
+def test_compile_shape_mismatch():
+    def func(arg: int):
+        return arg
+
+    plan = compile(scan(func))
+
+    assert plan.matches(Scope()) is False
+
+    with pytest.raises(ScopeValueNotFoundError):
+        plan.inject({})
+
+    assert plan.inject({"arg": 1}) == 1
+
+
+def test_compile_generator_teardown():
+    states = []
+
+    def dep():
+        states.append("start")
+        yield "value"
+        states.append("end")
+
+    def func(value: str = from_(dep)):
+        assert states == ["start"]
+        return value
+
+    assert compile(scan(func)).inject({}) == "value"
+    assert states == ["start", "end"]
+
+
+def test_compile_scope_hook():
+    @with_hooks(scope=lambda scope, _: scope.update(value="Hook value"))
+    def dep(value: str):
+        return value
+
+    def func(value: str = from_(dep)):
+        return value
+
+    assert compile(scan(func)).inject({}) == "Hook value"
+
+
+def test_compile_injection_trace():
+    def dep(arg: str):
+        raise RuntimeError()
+
+    def application(app_name: str, value=from_(dep)): ...
+
+    plan = compile(scan(application), {"arg": "", "app_name": ""})
+
+    with pytest.raises(RuntimeError) as exc_info:
+        plan.inject({"arg": "string", "app_name": "Kuyu's App"})
+
+    trace = injection_trace(exc_info.value)
+
+    assert trace.info.call is application
+    assert trace.values == {"app_name": "Kuyu's App"}
+
+    assert trace.origin is not None
+    assert trace.origin.info.call is dep
+    assert trace.origin.values == {"arg": "string"}
+
+
+def test_compile_cycle():
+    def dep_a(x=None):
+        return x
+
+    info = scan(dep_a)
+    info.parameters[0] = info.parameters[0].copy(from_=info)
+
+    with pytest.raises(CyclicDependencyError):
+        compile(info)
+
+
+def test_compile_async_in_sync():
+    async def dep():
+        pass
+
+    def func(value: None = from_(dep)):
+        pass
+
+    with pytest.raises(RuntimeError):
+        compile(scan(func)).inject({})
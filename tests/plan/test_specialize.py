@@ -0,0 +1,118 @@
+import importlib
+
+import pytest
+
+from fundi.exceptions import ScopeValueNotFoundError
+from fundi import scan, from_, inject, ainject, generate
+
+# Module name is shadowed by the function in the package namespace
+inject_module = importlib.import_module("fundi.inject")
+
+
+def test_specialize_inject():
+    def dep(arg: int) -> int:
+        return arg * 2
+
+    def func(arg1: str = "default", arg2: int = from_(dep)) -> str:
+        return f"{arg1}:{arg2}"
+
+    info = scan(func)
+
+    assert inject({"arg": 1, "arg1": "value"}, info) == "value:2"
+    assert len(info._plans) == 1
+
+    plan = info._plans[0]
+
+    assert inject({"arg": 2, "arg1": "other"}, info) == "other:4"
+    assert info._plans == (plan,)
+
+    # New shape gets its own plan
+    assert inject({"arg": 3}, info) == "default:6"
+    assert len(info._plans) == 2
+    assert info._plans[0] is plan
+
+
+def test_specialize_shared_by_scans():
+    def dep(arg: int) -> int:
+        return arg * 2
+
+    def func(arg2: int = from_(dep)) -> int:
+        return arg2
+
+    for arg in range(3):
+        assert inject({"arg": arg}, scan(func)) == arg * 2
+
+    (plan,) = scan(func)._plans
+    assert scan(func, caching=False)._plans == (plan,)
+
+    # Copies with other graph do not reuse plans
+    assert scan(func).copy(parameters=[])._plans == ()
+    assert scan(func).copy(deep=True)._plans == ()
+
+
+class Service:
+    def __init__(self, value: int):
+        self.value = value
+
+    __slots__ = ("value",)
+
+    def method(self, arg: int) -> int:
+        return self.value + arg
+
+
+def test_specialize_bound_methods():
+    assert inject({"arg": 1}, scan(Service(10).method)) == 11
+    assert inject({"arg": 1}, scan(Service(20).method)) == 21
+
+
+async def test_specialize_ainject():
+    async def dep(arg: int) -> int:
+        return arg * 2
+
+    def func(arg2: int = from_(dep)) -> int:
+        return arg2
+
+    info = scan(func)
+
+    assert await ainject({"arg": 1}, info) == 2
+    assert await ainject({"arg": 2}, info) == 4
+    assert len(info._plans) == 1
+
+
+def test_specialize_missing_value():
+    def func(arg: int) -> int:
+        return arg
+
+    info = scan(func)
+
+    for _ in range(2):
+        with pytest.raises(ScopeValueNotFoundError):
+            inject({}, info)
+
+    # Shape is remembered as not specializable
+    assert len(info._plans) == 1
+    assert inject({"arg": 1}, info) == 1
+
+
+def test_specialize_limit(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(inject_module, "MAX_SPECIALIZED_PLANS", 1)
+
+    def func(arg: int, other: int = 0) -> int:
+        return arg + other
+
+    info = scan(func)
+
+    assert inject({"arg": 1}, info) == 1
+    assert inject({"arg": 1, "other": 1}, info) == 2
+    assert len(info._plans) == 1
+
+
+def test_specialize_generated():
+    def func(arg: int) -> int:
+        return arg
+
+    info = scan(func)
+    generate(info, {"arg": 0})
+
+    assert inject({"arg": 1}, info) == 1
+    assert info._plans == ()
@@ -0,0 +1,87 @@
+import threading
+
+import pytest
+
+from fundi import scan, inject, from_, set_lazy_scanning
+from fundi.types import CallableInfo
+from fundi.scan import LazyCallableInfo
+
+
+@pytest.fixture
+def lazy_scanning():
+    set_lazy_scanning(True)
+    yield
+    set_lazy_scanning(False)
+
+
+def test_lazy_from():
+    def dep(arg: int) -> int:
+        return arg
+
+    def func(value: int = from_(dep, lazy=True, caching=False)) -> int:
+        return value
+
+    info = scan(func)
+    dependency = info.parameters[0].from_
+
+    assert type(dependency) is LazyCallableInfo
+    assert dependency.call is dep
+    assert dependency.use_cache is False
+    assert not hasattr(dep, "__fundi_info__")
+
+    assert inject({"arg": 1}, info) == 1
+
+    assert type(dependency) is CallableInfo
+    assert dependency.use_cache is False
+    assert [parameter.name for parameter in dependency.parameters] == ["arg"]
+
+
+def test_lazy_global(lazy_scanning: None):
+    def dep() -> int:
+        return 1
+
+    def func(value: int = from_(dep)) -> int:
+        return value
+
+    assert type(scan(func).parameters[0].from_) is LazyCallableInfo
+    assert inject({}, scan(func)) == 1
+
+
+def test_lazy_scanned_already():
+    def dep() -> int:
+        return 1
+
+    scan(dep)
+
+    assert type(scan(dep, lazy=True)) is CallableInfo
+
+
+def test_lazy_overrides():
+    def dep():
+        return 1
+
+    info = scan(dep, lazy=True, async_=True)
+
+    assert info.async_ is True
+
+
+def test_lazy_threads():
+    def dep(arg: int) -> int:
+        return arg
+
+    info = scan(dep, lazy=True)
+    barrier = threading.Barrier(8)
+    results: list[object] = []
+
+    def access():
+        barrier.wait()
+        results.append(info.parameters)
+
+    threads = [threading.Thread(target=access) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
@@ -0,0 +1,109 @@
+import gc
+import functools
+
+from fundi import scan, inject, from_, ScanRegistry, scan_registry
+
+
+class Service:
+    def __init__(self, prefix: str):
+        self.prefix: str = prefix
+
+    def method(self, name: str) -> str:
+        return self.prefix + name
+
+
+class Slotted:
+    __slots__ = ("value",)
+
+    def __init__(self, value: int):
+        self.value: int = value
+
+    def __call__(self, arg: int) -> int:
+        return self.value + arg
+
+
+class Unhashable(Slotted):
+    __slots__ = ()
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+
+def test_bound_method():
+    service = Service("hello, ")
+    info = scan(service.method)
+
+    assert service.method in scan_registry
+    assert Service("bye, ").method in scan_registry
+
+    other = Service("bye, ")
+    other_info = scan(other.method)
+
+    assert other_info.call == other.method
+    assert other_info.parameters is info.parameters
+    assert inject({"name": "world"}, other_info) == "bye, world"
+
+
+def test_builtin():
+    info = scan(divmod)
+
+    assert divmod in scan_registry
+    assert scan(divmod).parameters is info.parameters
+    assert inject({"x": 7, "y": 2}, scan(divmod)) == (3, 1)
+
+
+def test_weak_entry_dropped():
+    registry = ScanRegistry()
+
+    def function(a: int, b: int) -> int:
+        return a + b
+
+    partial = functools.partial(function, b=1)
+    registry.add(partial, scan(partial))
+
+    assert registry.stats().weak == 1
+
+    del partial
+    gc.collect()
+
+    assert len(registry) == 0
+
+
+def test_strong_lru():
+    registry = ScanRegistry(maxsize=2)
+    callables = [Unhashable(i) for i in range(3)]
+
+    for call in callables:
+        registry.add(call, scan(call))
+
+    stats = registry.stats()
+    assert stats.strong == stats.size == 2
+    assert callables[0] not in registry
+    assert callables[2] in registry
+
+    info = registry.get(callables[2])
+    assert info is not None and info.call is callables[2]
+    assert registry.get(callables[0]) is None
+    assert registry.stats().hits == 1
+    assert registry.stats().misses == 1
+
+
+def test_invalidate():
+    registry = ScanRegistry()
+    service = Service("")
+    slotted = Slotted(1)
+
+    registry.add(service.method, scan(service.method))
+    registry.add(slotted, scan(slotted))
+    registry.invalidate(service.method)
+
+    assert service.method not in registry
+    assert slotted in registry
+
+    registry.invalidate()
+    assert len(registry) == 0
+
+
+def test_slotted_dependency():
+    def application(value: int = from_(Slotted(1))) -> int:
+        return value
+
+    assert inject({"arg": 1}, scan(application)) == 2
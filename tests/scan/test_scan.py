@@ -2,6 +2,8 @@ import typing
 import inspect
 from types import TracebackType
 
+import pytest
+
 from fundi.configurable import configurable_dependency
 from fundi import scan, from_, FromType, virtual_context, with_side_effects
 from fundi.types import CallableInfo, DependencyConfiguration, Parameter
@@ -425,3 +427,91 @@ def test_scan_side_effect_local():
 
     info1 = scan(dependency)
     assert info1.side_effects == ()
+
+
+def test_scan_copy_shares_parameters():
+    def dep(arg: int): ...
+
+    info = scan(dep)
+    binder = info.binder
+    copy = info.copy(use_cache=False)
+
+    assert scan(dep, caching=False).parameters is info.parameters
+
+    assert copy.use_cache is False
+    assert copy.parameters is info.parameters
+    assert copy.named_parameters is info.named_parameters
+    assert copy.key == info.key and copy.key is not info.key
+    assert copy.binder is binder
+
+
+def test_scan_copy_update_parameters():
+    def dep(arg: int): ...
+
+    info = scan(dep)
+    copy = info.copy(parameters=[Parameter("other", str, None)])
+
+    assert list(copy.named_parameters) == ["other"]
+    assert copy.binder.layout != info.binder.layout
+    assert list(info.named_parameters) == ["arg"]
+
+
+def test_scan_deep_copy():
+    def dep(arg: int): ...
+
+    def func(value: int = from_(dep)): ...
+
+    info = scan(func)
+    copy = info.copy(deep=True)
+
+    assert copy.parameters == info.parameters
+    assert copy.parameters[0] is not info.parameters[0]
+    assert copy.parameters[0].from_ is not info.parameters[0].from_
+
+    copy.key.add("custom")
+    assert copy.key != info.key
+
+
+def test_scan_copy_key():
+    def func(): ...
+
+    info = scan(func)
+    copy = scan(func)
+
+    assert copy.key == info.key
+
+    copy.key.add("custom")
+    assert copy.key != info.key
+    assert scan(func).key == info.key == getattr(func, "__fundi_info__").key
+
+
+def test_scan_copy_unknown_field():
+    def dep(): ...
+
+    with pytest.raises(TypeError):
+        scan(dep).copy(key=None)
+
+
+def test_scan_signature_from_code():
+    from fundi.scan import _signature
+
+    class Service:
+        def method(self, a: int, /, b: str = "", *args: int, c, d: float = 1.0, **kwargs): ...
+
+        def varargs(*args): ...
+
+    def function(a: int, /, b: str = "", *args: int, c, d: float = 1.0, **kwargs) -> int: ...
+
+    def decorated(*args, **kwargs): ...
+
+    decorated.__wrapped__ = function
+
+    for call in (function, Service().method, Service().varargs, decorated, Service.method):
+        signature = inspect.signature(call)
+        parameters, return_annotation = _signature(call)
+
+        assert parameters == [
+            (parameter.name, parameter.kind, parameter.default, parameter.annotation)
+            for parameter in signature.parameters.values()
+        ]
+        assert return_annotation == signature.return_annotation
@@ -16,3 +16,20 @@ def test_default():
     assert copy.values == scope.values
     assert copy.types == scope.types
     assert copy.factories == scope.factories
+
+
+def test_copy_on_write():
+    scope = Scope({"key": "value", int: Type.Instance(1)})
+    copy = scope.copy()
+
+    assert copy._layers is scope._layers
+
+    copy.add_value("key", "changed")
+    copy.add_type(2)
+    del copy.values["key"]
+    scope.add_value("other", "value")
+
+    assert scope.values.copy() == {"key": "value", "other": "value"}
+    assert scope.types.copy() == {int: 1}
+    assert copy.values.copy() == {}
+    assert copy.types.copy() == {int: 2}
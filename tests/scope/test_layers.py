@@ -0,0 +1,91 @@
+from fundi import scan, from_, inject, with_hooks
+from fundi.scope import MAX_LAYERS, Scope, Type
+
+
+def test_merge_isolation():
+    scope = Scope({"key": "value"})
+    other = Scope({"other": "value"})
+
+    merged = scope | other
+
+    scope.add_value("key", "changed")
+    other.add_value("new", "value")
+    merged.add_value("merged", "value")
+
+    assert merged.values == {"key": "value", "other": "value", "merged": "value"}
+    assert scope.values == {"key": "changed"}
+    assert other.values == {"other": "value", "new": "value"}
+
+
+def test_merge_delete():
+    class User:
+        pass
+
+    user = User()
+
+    def factory() -> User:
+        return User()
+
+    merged = Scope({User: Type.instance(user)}) | Scope({"key": "value"})
+
+    merged.add_factory(factory)
+
+    assert User not in merged.types
+    assert merged.factories[User].call is factory
+    assert merged.resolve_by_type(User) == Type.Factory(scan(factory))
+
+
+def test_instance_beats_factory():
+    class User:
+        pass
+
+    user = User()
+
+    def factory() -> User:
+        return User()
+
+    merged = Scope({User: Type.instance(user)}) | Scope({User: Type.factory(factory)})
+
+    assert merged.resolve_by_type(User) == Type.Instance(user)
+    assert merged.factories == {}
+
+
+def test_collapse():
+    scope = Scope({"base": 0})
+
+    for i in range(MAX_LAYERS * 2):
+        scope = scope | Scope({"key": i})
+
+    assert len(scope._layers) <= MAX_LAYERS
+    assert scope.values == {"base": 0, "key": MAX_LAYERS * 2 - 1}
+
+
+def test_write_at_max_layers():
+    scope = Scope({"base": 0})
+
+    for i in range(MAX_LAYERS - 1):
+        scope = scope | Scope({f"key{i}": i})
+
+    assert len(scope._layers) == MAX_LAYERS
+
+    scope.add_value("written", "value")
+
+    assert len(scope._layers) <= MAX_LAYERS
+    assert scope.resolve_by_name("written") == "value"
+    assert scope.resolve_by_name("base") == 0
+    assert scope.resolve_by_name(f"key{MAX_LAYERS - 2}") == MAX_LAYERS - 2
+
+
+def test_scope_hook_at_depth():
+    @with_hooks(scope=lambda scope, _: scope.add_value("hooked", "value"))
+    def dependency(hooked: str) -> str:
+        return hooked
+
+    def application(value: str = from_(dependency)) -> str:
+        return value
+
+    scope = Scope({"base": 0})
+    for i in range(MAX_LAYERS - 2):
+        scope = scope | Scope({f"key{i}": i})
+
+    assert inject(scope, scan(application)) == "value"
@@ -70,3 +70,57 @@ def test_factory():
 
     assert isinstance(value, Type.Factory)
     assert value.factory.call is factory
+
+
+def test_subclasses():
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    class Other(Base):
+        pass
+
+    child = Child()
+
+    assert Scope({Child: Type.instance(child)}).resolve_by_type(Base) is NO_VALUE
+
+    scope = Scope({Child: Type.instance(child)}, subclasses=True)
+    value = scope.resolve_by_type(Base)
+    assert isinstance(value, Type.Instance)
+    assert value.instance is child
+    assert scope.resolve_by_type(Base) is value
+    assert scope.resolve_by_type(int) is NO_VALUE
+
+    # Exact match is preferred
+    base = Base()
+    scope.add_type(base)
+    assert scope.resolve_by_type(Base) == Type.instance(base)
+
+    # Cache is invalidated on changes
+    del scope.types[Base]
+    del scope.types[Child]
+    scope.add_factory(Other, Other)
+
+    value = scope.resolve_by_type(Base)
+    assert isinstance(value, Type.Factory)
+    assert value.factory.call is Other
+
+
+def test_subclasses_merge():
+    import typing
+
+    @typing.runtime_checkable
+    class Closable(typing.Protocol):
+        def close(self) -> None: ...
+
+    class Connection:
+        def close(self) -> None: ...
+
+    connection = Connection()
+    merged = Scope() | Scope(subclasses=True)
+    merged.add_type(connection)
+
+    assert merged.resolve_by_type(Closable) == Type.instance(connection)
+    assert merged.copy().resolve_by_type(Closable) == Type.instance(connection)
@@ -0,0 +1,88 @@
+from fundi.scope import Scope, Type
+
+
+def test_version():
+    scope = Scope({"key": "value"})
+    assert scope.version == 0
+
+    versions = [scope.version]
+
+    scope.add_value("key", "changed")
+    versions.append(scope.version)
+
+    scope.add_type(1)
+    versions.append(scope.version)
+
+    scope.add_factory(lambda: "", str)
+    versions.append(scope.version)
+
+    scope.update({bytes: Type.instance(b"")}, other="value")
+    versions.append(scope.version)
+
+    assert versions == sorted(set(versions))
+
+    # Other scopes sharing storages are not affected
+    copy = scope.copy()
+    merged = scope | Scope()
+    scope.add_value("key", "again")
+
+    assert copy.version == merged.version == 0
+    assert scope.resolve_by_name("key") == "again"
+
+
+def test_subscribe():
+    scope = Scope()
+    changes: list[int] = []
+
+    unsubscribe = scope.subscribe(lambda changed: changes.append(changed.version))
+
+    scope.add_value("key", "value")
+    del scope.values["key"]
+    scope.copy().add_value("key", "value")
+
+    assert changes == [1, 2]
+
+    unsubscribe()
+    scope.add_value("key", "value")
+
+    assert changes == [1, 2]
+
+
+def test_notify_once_per_operation():
+    class Base: ...
+
+    class Child(Base): ...
+
+    scope = Scope()
+    scope.add_factory(lambda: Child(), Child)
+    scope.add_factory(lambda: Base(), Base)
+
+    changes: list[tuple[int, bool, bool]] = []
+    scope.subscribe(
+        lambda changed: changes.append(
+            (changed.version, Child in changed.factories, Base in changed.types)
+        )
+    )
+
+    # Replaces two factories with instances: subscriber sees only the final state
+    scope.add_type(Child(), mro=True)
+    assert changes == [(3, False, True)]
+
+    scope.add_factory(lambda: Child(), Child)
+    scope.update({Base: Type.factory(lambda: Base())}, key="value")
+    scope.values["other"] = "value"
+
+    assert [version for version, *_ in changes] == [3, 4, 5, 6]
+
+
+def test_from_legacy_version():
+    class Session: ...
+
+    session = Session()
+    scope = Scope.from_legacy({"key": "value", "session": session})
+
+    # Legacy scope is filled in one change
+    assert scope.version == 1
+    assert Scope.from_legacy({}).version == 0
+    assert scope.resolve_by_name("session") is session
+    assert scope.resolve_by_type(Session) == Type.instance(session)
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from fundi.exceptions import CyclicDependencyError
@@ -134,3 +136,22 @@ async def test_async_indirect_type_factory_cycle():
 
     with pytest.raises(CyclicDependencyError):
         await ainject(scope, target_info)
+
+
+async def test_gather_indirect_cycle():
+    async def dep_a(x=None):
+        return x
+
+    async def dep_b(x=None):
+        return x
+
+    info_a = scan(dep_a)
+    info_b = scan(dep_b)
+
+    info_a.parameters[0] = info_a.parameters[0].copy(from_=info_b)
+    info_b.parameters[0] = info_b.parameters[0].copy(from_=info_a)
+
+    with pytest.raises(CyclicDependencyError) as exc_info:
+        await asyncio.wait_for(ainject({}, info_a, concurrency="gather"), 1)
+
+    assert [info.call for info in exc_info.value.trace] == [dep_a, dep_b]
@@ -0,0 +1,44 @@
+import typing
+
+from fundi import scan, FromType, Parameter
+from fundi.util import normalize_annotation
+
+
+class Session:
+    pass
+
+
+class Unhashable:
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+
+def test_normalize_annotation():
+    assert normalize_annotation(int) == (int,)
+    assert normalize_annotation(list[int]) == (list,)
+    assert normalize_annotation(int | None) == (int,)
+    assert normalize_annotation(typing.Annotated[int | str, "meta"]) == (int, str)
+
+
+def test_normalize_annotation_memoized():
+    annotation = Session | int
+
+    assert normalize_annotation(annotation) is normalize_annotation(annotation)
+
+    # Equal unions with other order of types keep their order
+    assert normalize_annotation(int | Session) == (int, Session)
+
+
+def test_normalize_annotation_unhashable():
+    annotation = typing.Annotated[Session, Unhashable()]
+
+    assert normalize_annotation(annotation) == (Session,)
+
+
+def test_parameter_type_options():
+    def func(session: FromType[Session | None], name: str): ...
+
+    session, name = scan(func).parameters
+
+    assert session.type_options == (Session,)
+    assert name.type_options == ()
+    assert Parameter("session", Session, None, resolve_by_type=True).type_options == (Session,)
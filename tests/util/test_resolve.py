@@ -1,4 +1,5 @@
 from fundi.scope import Scope
+from fundi.resolve import RESOLVE_NAME, RESOLVE_TYPE, RESOLVE_DEPENDENCY, resolution_table
 from fundi import resolve, from_, scan, exceptions, FromType
 
 
@@ -140,3 +141,26 @@ def test_resolve_not_found():
     except exceptions.ScopeValueNotFoundError as exc:
         assert exc.parameter == "arg"
         assert exc.info.call is func
+
+
+def test_resolution_table():
+    class Session:
+        pass
+
+    def dep():
+        pass
+
+    def func(arg: int, session: FromType[Session], value: None = from_(dep)):
+        pass
+
+    info = scan(func)
+    table = resolution_table(info)
+
+    assert resolution_table(info) is table
+    assert [(parameter.name, strategy) for parameter, strategy, _ in table] == [
+        ("arg", RESOLVE_NAME),
+        ("session", RESOLVE_TYPE),
+        ("value", RESOLVE_DEPENDENCY),
+    ]
+    assert table[1][2] == (Session,)
+    assert table[2][2].call is dep
@@ -0,0 +1,142 @@
+import pytest
+
+from fundi.hooks import with_hooks
+from fundi.side_effects import with_side_effects
+from fundi.exceptions import CyclicDependencyError, ScopeValueNotFoundError
+from fundi import Type, Scope, scan, from_, inject, validate, FromType, Parameter
+
+
+def test_validate():
+    class Session:
+        pass
+
+    def require_session(url: str) -> Session:
+        return Session()
+
+    def dep(param: FromType[Parameter], __fundi_parameter__: Parameter) -> str:
+        return param.name
+
+    def func(session: FromType[Session], user_id: int, name: str = from_(dep), flag: bool = False):
+        return session, user_id, name, flag
+
+    info = scan(func)
+    graph = validate(info, Scope({"url": "", "user_id": 0, Session: Type.factory(require_session)}))
+
+    assert info._validated is graph
+    assert graph.factories[Session].call is require_session
+
+
+def test_validate_missing():
+    def dep(value: int):
+        return value
+
+    def func(arg: str, value: int = from_(dep)):
+        return value
+
+    with pytest.raises(ScopeValueNotFoundError) as exc_info:
+        validate(scan(func), {"arg": ""})
+
+    assert exc_info.value.parameter == "value"
+    assert exc_info.value.info.call is dep
+
+
+def test_validate_missing_type():
+    class Session:
+        pass
+
+    def func(session: FromType[Session]):
+        return session
+
+    with pytest.raises(ScopeValueNotFoundError):
+        validate(scan(func))
+
+
+def test_validate_cycle():
+    def dep_a(x=None):
+        return x
+
+    def dep_b(x=None):
+        return x
+
+    info_a = scan(dep_a)
+    info_b = scan(dep_b)
+
+    info_a.parameters[0] = info_a.parameters[0].copy(from_=info_b)
+    info_b.parameters[0] = info_b.parameters[0].copy(from_=info_a)
+
+    def func(value=from_(dep_a)):
+        return value
+
+    with pytest.raises(CyclicDependencyError) as exc_info:
+        validate(scan(func))
+
+    assert [info.call for info in exc_info.value.trace] == [func, dep_a, dep_b]
+
+
+def test_validate_factory_cycle():
+    class Session:
+        pass
+
+    def require_session(session: FromType[Session]) -> Session:
+        return session
+
+    def func(session: FromType[Session]):
+        return session
+
+    with pytest.raises(CyclicDependencyError):
+        validate(scan(func), Scope({Session: Type.factory(require_session)}))
+
+
+def test_validate_side_effects():
+    def effect(__values__: dict, __dependant__, __scope__, value: str = from_(lambda: "")):
+        pass
+
+    @with_side_effects(effect)
+    def func(arg: str):
+        return arg
+
+    info = scan(func)
+    validate(info, {"arg": ""})
+
+    assert inject({"arg": "value"}, info) == "value"
+
+
+def test_validate_scope_hook():
+    @with_hooks(scope=lambda scope, _: scope.update(value="Hook value"))
+    def dep(value: str):
+        return value
+
+    def func(value: str = from_(dep)):
+        return value
+
+    info = scan(func)
+    validate(info)
+
+    # Scope hooks may change the graph - it is not remembered as validated
+    assert info._validated is None
+
+
+def test_validated_injection():
+    class Session:
+        pass
+
+    calls = []
+
+    def dep(session: FromType[Session]):
+        calls.append(session)
+        return session
+
+    def func(value: Session = from_(dep)):
+        return value
+
+    info = scan(func)
+    session = Session()
+
+    graph = validate(info, Scope({Session: Type.instance(session)}))
+
+    assert graph.matches(Scope({Session: Type.instance(Session())}))
+    assert not graph.matches(Scope({Session: Type.factory(lambda: session)}))
+
+    assert inject(Scope({Session: Type.instance(session)}), info) is session
+    assert inject(Scope({Session: Type.factory(lambda: session)}), info) is session
+    assert calls == [session, session]
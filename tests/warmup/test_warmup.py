@@ -0,0 +1,114 @@
+import gc
+from types import ModuleType
+
+import pytest
+
+from fundi import scan, from_, inject, warmup, Scope, CallableInfo
+from fundi.exceptions import CyclicDependencyError, ScopeValueNotFoundError
+
+
+def _module(*functions) -> ModuleType:
+    module = ModuleType("handlers")
+
+    for function in functions:
+        function.__module__ = module.__name__
+        setattr(module, function.__name__, function)
+
+    # Imported functions are not warmed up
+    setattr(module, "imported", scan)
+
+    return module
+
+
+def test_warmup_module():
+    def require_user(user_id: int) -> str:
+        return f"user-{user_id}"
+
+    def handler(request: str, user: str = from_(require_user, lazy=True)) -> str:
+        return f"{user} requested {request}"
+
+    report = warmup([_module(require_user, handler)])
+
+    assert not report.failures
+    assert {info.call for info in report.dependants} == {require_user, handler}
+    assert report.nodes == 2
+    assert "binder" in vars(handler.__fundi_info__)
+    assert "binder" in vars(scan(handler))
+    assert type(report.dependants[1].parameters[1].from_) is CallableInfo
+
+
+def test_warmup_failures():
+    def dep(value: int = from_(lambda: 1)):
+        return value
+
+    def cycle_a(value=None):
+        return value
+
+    def cycle_b(value=None):
+        return value
+
+    info_a = scan(cycle_a)
+    info_b = scan(cycle_b)
+
+    info_a.parameters[0] = info_a.parameters[0].copy(from_=info_b)
+    info_b.parameters[0] = info_b.parameters[0].copy(from_=info_a)
+
+    def unresolvable(missing: int):
+        return missing
+
+    report = warmup([dep, info_a, unresolvable], Scope())
+
+    assert [info.call for info in report.dependants] == [dep]
+    assert [call for call, _ in report.failures] == [cycle_a, unresolvable]
+    assert isinstance(report.failures[0][1], CyclicDependencyError)
+    assert isinstance(report.failures[1][1], ScopeValueNotFoundError)
+    assert "unresolvable" in str(report)
+
+
+def test_warmup_precompile():
+    def dep(arg: int) -> int:
+        return arg
+
+    def handler(value: int = from_(dep)) -> int:
+        return value
+
+    report = warmup([handler], {"arg": 1}, precompile=True)
+    (info,) = report.dependants
+
+    assert info._generated is not None
+    assert info._generated._sync is not None
+    assert info._generated._async is not None
+    assert inject({"arg": 2}, info) == 2
+
+    # Later scans of the handler reuse the generated injector and validated graph
+    assert scan(handler)._generated is info._generated
+    assert scan(handler)._validated is info._validated
+
+    with pytest.raises(ValueError):
+        warmup([handler], precompile=True)
+
+
+def test_warmup_freeze():
+    try:
+        report = warmup([lambda: None], freeze=True)
+        assert report.frozen > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_warmup_module_helpers():
+    def helper(x: int, y: int) -> int:
+        return x + y
+
+    def require_user(user_id: int, missing: str) -> str:
+        return f"user-{user_id}"
+
+    def handler(user: str = from_(require_user)) -> str:
+        return user
+
+    report = warmup([_module(helper, handler), helper], Scope({"user_id": 1}))
+
+    # Helpers found in modules are skipped, unresolvable graphs of dependants still fail
+    assert [call for call, _ in report.skipped] == [helper]
+    assert [call for call, _ in report.failures] == [handler, helper]
+    assert "skipped 1 functions" in str(report)